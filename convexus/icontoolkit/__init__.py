@@ -1,7 +1,9 @@
 from .BigInt import *
+from .batcher import *
 from .calldata import *
 from .constants import *
 from .contract import *
 from .interface import *
 from .pack import *
+from .transport import *
 from .validateAndParseAddress import *
\ No newline at end of file
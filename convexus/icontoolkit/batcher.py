@@ -0,0 +1,140 @@
+import asyncio
+import json
+from typing import Any, List, Tuple
+
+from iconsdk.exception import HTTPError, JSONRPCException
+
+from convexus.icontoolkit.transport import AsyncHTTPTransport
+
+class RpcBatcher:
+  """
+  * Collects the JSON-RPC requests sent concurrently, e.g. the readonly calls of many contracts, and sends them
+  * over a transport as JSON-RPC 2.0 batches, resolving every request with its own response.
+  * A batch is sent when it's full, or when the oldest request has waited for the flush interval.
+  * A batcher has the same #request and #call methods as AsyncHTTPTransport, so it can be given to a Contract as its transport.
+  """
+
+  def __init__(self, transport: AsyncHTTPTransport, maxBatchSize: int = 100, flushInterval: float = 0.002) -> None:
+    """
+    * @param transport The transport the batches are sent over
+    * @param maxBatchSize The maximum number of requests of a batch
+    * @param flushInterval The maximum time a request waits for other requests to join its batch, in seconds
+    """
+    assert maxBatchSize > 0, 'MAX_BATCH_SIZE'
+    assert flushInterval >= 0, 'FLUSH_INTERVAL'
+
+    self.transport = transport
+    self.maxBatchSize = maxBatchSize
+    self.flushInterval = flushInterval
+    self.__loop: asyncio.AbstractEventLoop | None = None
+    self.__pending: List[Tuple[dict, asyncio.Future]] = []
+    self.__timer: asyncio.TimerHandle | None = None
+    self.__sending: set = set()
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  async def __aenter__(self) -> 'RpcBatcher':
+    return self
+
+  async def __aexit__(self, *args) -> None:
+    await self.close()
+
+  def __bind(self) -> asyncio.AbstractEventLoop:
+    loop = asyncio.get_running_loop()
+    if loop is not self.__loop:
+      # the requests of another event loop can't be answered anymore
+      self.__loop = loop
+      self.__pending = []
+      self.__timer = None
+      self.__sending = set()
+    return loop
+
+  def flush(self) -> None:
+    """
+    * Sends the pending requests right away, as batches of at most `maxBatchSize` requests
+    """
+    if self.__timer is not None:
+      self.__timer.cancel()
+      self.__timer = None
+
+    pending, self.__pending = self.__pending, []
+    for start in range(0, len(pending), self.maxBatchSize):
+      task = asyncio.ensure_future(self.__send(pending[start:start + self.maxBatchSize]))
+      self.__sending.add(task)
+      task.add_done_callback(self.__sending.discard)
+
+  async def __send(self, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+    try:
+      status, responses = await self.transport.send([payload for payload, _ in batch])
+    except BaseException as error:
+      for _, future in batch:
+        if not future.done():
+          future.set_exception(error)
+      if isinstance(error, asyncio.CancelledError):
+        raise error
+      return
+
+    # the node rejected the whole batch with a single response
+    if isinstance(responses, dict):
+      responses = [dict(responses, id=payload['id']) for payload, _ in batch]
+    elif not isinstance(responses, list):
+      responses = []
+
+    responsesById = {response.get('id'): response for response in responses if isinstance(response, dict)}
+    for payload, future in batch:
+      if future.done():
+        continue
+      response = responsesById.get(payload['id'])
+      if response is None:
+        future.set_exception(HTTPError(f"no response to the request {payload['id']}", status))
+      elif 'error' in response:
+        error = response['error']
+        future.set_exception(JSONRPCException(error.get('message'), error.get('code'), error.get('data')))
+      elif 'result' not in response:
+        future.set_exception(HTTPError(json.dumps(response), status))
+      else:
+        future.set_result(response['result'])
+
+  async def request(self, method: str, params: Any = None) -> Any:
+    """
+    * Sends a JSON-RPC request in the next batch
+    * @param method The JSON-RPC method, e.g. icx_call
+    * @param params The params of the method
+    * @returns The result of the request
+    * @throws JSONRPCException if the request failed
+    """
+    loop = self.__bind()
+    payload = {'jsonrpc': '2.0', 'method': method, 'id': self.transport.nextId()}
+    if params:
+      payload['params'] = params
+
+    future = loop.create_future()
+    self.__pending.append((payload, future))
+    if len(self.__pending) >= self.maxBatchSize:
+      self.flush()
+    elif self.__timer is None:
+      self.__timer = loop.call_later(self.flushInterval, self.flush)
+
+    return await future
+
+  async def call(self, to: str, method: str, params: dict = None) -> Any:
+    """
+    * Calls a readonly method of a contract in the next batch, as AsyncHTTPTransport#call does
+    * @param to The address of the contract
+    * @param method The method
+    * @param params The params of the method
+    * @returns The value returned by the method
+    """
+    return await self.request('icx_call', AsyncHTTPTransport.callParams(to, method, params))
+
+  async def close(self) -> None:
+    """
+    * Sends the pending requests and waits for the batches in flight
+    """
+    if self.__loop is not asyncio.get_running_loop():
+      return
+
+    self.flush()
+    if self.__sending:
+      await asyncio.gather(*self.__sending, return_exceptions=True)
@@ -11,6 +11,8 @@ from iconsdk.builder.call_builder import CallBuilder
 from convexus.icontoolkit.calldata import toHex
 from convexus.icontoolkit.interface import Interface
 from convexus.icontoolkit.asynchronous import make_async
+from convexus.icontoolkit.transport import AsyncHTTPTransport
+from convexus.icontoolkit.batcher import RpcBatcher
 
 class Sync(object):
   pass
@@ -34,6 +36,13 @@ class Contract(object):
       result = output_transform(result)
     return result
 
+  async def buildCallArrayTransport(self, method: str, output_transform: Callable, *args):
+    data = self.interface.encodeFunctionData(method, args)
+    result = await self.transport.call(self.address, method, data['params'] if "params" in data else {})
+    if output_transform:
+      result = output_transform(result)
+    return result
+
   def buildCall (self, method: str, data: dict):
     txObj = CallBuilder()\
       .to(self.address)\
@@ -111,11 +120,17 @@ class Contract(object):
     abi: List, 
     iconService: IconService,
     debugService: IconService,
-    nid: int
+    nid: int,
+    transport: AsyncHTTPTransport | RpcBatcher | None = None
   ):
+    """
+    * @param transport The transport of the asynchronous readonly calls, or a batcher to send them in batches.
+    *                  If none, they run the calls of `iconService` on the default executor
+    """
     self.iconService = iconService
     self.debugService = debugService
     self.nid = nid
+    self.transport = transport
     self.address = address
     self.interface = Interface(abi, address)
     self.sync = Sync()
@@ -133,7 +148,7 @@ class Contract(object):
 
           # readonly methods
           if 'readonly' in obj and int(obj['readonly'], 16) == 1:
-            self.defineAsync(name, partial(self.buildCallArray, name, output_transform))
+            self.defineAsync(name, partial(self.buildCallArrayTransport if transport else self.buildCallArray, name, output_transform))
             self.defineSync(name, partial(self.buildCallArraySync, name, output_transform))
           # write methods
           else:
@@ -0,0 +1,217 @@
+import asyncio
+import itertools
+import json
+import ssl
+from typing import Any, List, Tuple
+from urllib.parse import urlsplit
+
+from iconsdk.exception import HTTPError, JSONRPCException
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+class AsyncHTTPTransport:
+  """
+  * Sends ICON JSON-RPC requests from an asyncio event loop, over a pool of persistent HTTP/1.1 connections,
+  * instead of running the blocking IconService calls on a thread pool.
+  * The connections are bound to the event loop that opened them, and dropped when the transport is used by another loop.
+  """
+
+  def __init__(self, url: str, maxConnections: int = 16, timeout: float = 10) -> None:
+    """
+    * @param url The full URL of the JSON-RPC API, e.g. https://ctz.solidwallet.io/api/v3
+    * @param maxConnections The maximum number of connections, i.e. of requests in flight
+    * @param timeout The timeout of every request, connection included, in seconds
+    """
+    assert maxConnections > 0, 'MAX_CONNECTIONS'
+
+    url = urlsplit(url)
+    assert url.scheme in ('http', 'https'), 'SCHEME'
+    self.url = url.geturl()
+    self.host = url.hostname
+    self.port = url.port or (443 if url.scheme == 'https' else 80)
+    # the host and the port as written in the URL, the port being required unless it's the default one
+    self.authority = url.netloc.rpartition('@')[2]
+    self.ssl = ssl.create_default_context() if url.scheme == 'https' else None
+    self.path = url.path or '/'
+    self.maxConnections = maxConnections
+    self.timeout = timeout
+    self.__ids = itertools.count(1)
+    self.__loop: asyncio.AbstractEventLoop | None = None
+    self.__semaphore: asyncio.Semaphore | None = None
+    self.__idle: List[Connection] = []
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  async def __aenter__(self) -> 'AsyncHTTPTransport':
+    return self
+
+  async def __aexit__(self, *args) -> None:
+    await self.close()
+
+  def __bind(self) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if loop is not self.__loop:
+      # the connections of another event loop can't be used anymore
+      self.__loop = loop
+      self.__semaphore = asyncio.Semaphore(self.maxConnections)
+      self.__idle = []
+    return self.__semaphore
+
+  async def __open(self) -> Connection:
+    return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+  @staticmethod
+  def __discard(connection: Connection) -> None:
+    connection[1].close()
+
+  async def __exchange(self, connection: Connection, body: bytes) -> Tuple[int, bytes, bool]:
+    """
+    * Sends a request over a connection and reads its response
+    * @returns The status, the body of the response, and whether the connection can be reused
+    """
+    reader, writer = connection
+    writer.write((
+      f"POST {self.path} HTTP/1.1\r\n"
+      f"Host: {self.authority}\r\n"
+      "Content-Type: application/json\r\n"
+      f"Content-Length: {len(body)}\r\n"
+      "Connection: keep-alive\r\n"
+      "\r\n"
+    ).encode('latin-1') + body)
+    await writer.drain()
+
+    statusLine = await reader.readline()
+    if not statusLine:
+      raise ConnectionResetError('connection closed by the server')
+    version, status, _ = statusLine.decode('latin-1').split(' ', 2)
+
+    headers = {}
+    while True:
+      line = await reader.readline()
+      if line in (b'\r\n', b'\n', b''):
+        break
+      name, _, value = line.decode('latin-1').partition(':')
+      headers[name.strip().lower()] = value.strip()
+
+    reusable = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+      chunks = []
+      while True:
+        size = int((await reader.readline()).split(b';')[0], 16)
+        if size == 0:
+          # trailers
+          while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+          break
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+      content = b''.join(chunks)
+    elif 'content-length' in headers:
+      content = await reader.readexactly(int(headers['content-length']))
+    else:
+      content = await reader.read()
+      reusable = False
+
+    return int(status), content, reusable
+
+  async def __attempt(self, body: bytes) -> Tuple[int, bytes]:
+    # a connection left idle may have been closed by the server meanwhile, retry once on a new connection
+    for attempt in range(2):
+      reused = len(self.__idle) > 0
+      connection = self.__idle.pop() if reused else await self.__open()
+      try:
+        status, content, reusable = await self.__exchange(connection, body)
+      except (ConnectionError, asyncio.IncompleteReadError) as error:
+        AsyncHTTPTransport.__discard(connection)
+        if reused and attempt == 0:
+          continue
+        raise error
+      except BaseException as error:
+        AsyncHTTPTransport.__discard(connection)
+        raise error
+
+      if reusable:
+        self.__idle.append(connection)
+      else:
+        AsyncHTTPTransport.__discard(connection)
+      return status, content
+
+  async def __post(self, body: bytes) -> Tuple[int, bytes]:
+    async with self.__bind():
+      # the timeout covers opening the connection too, so an unreachable node doesn't hang the request
+      return await asyncio.wait_for(self.__attempt(body), self.timeout)
+
+  async def send(self, payload: Any) -> Tuple[int, Any]:
+    """
+    * Posts a JSON payload, e.g. a JSON-RPC request or a batch of requests
+    * @param payload The payload
+    * @returns The HTTP status and the decoded JSON response
+    """
+    status, content = await self.__post(json.dumps(payload).encode())
+    try:
+      return status, json.loads(content)
+    except ValueError:
+      raise HTTPError(content.decode(errors='replace'), status)
+
+  def nextId(self) -> int:
+    """
+    * Returns a new JSON-RPC request id
+    """
+    return next(self.__ids)
+
+  async def request(self, method: str, params: Any = None) -> Any:
+    """
+    * Sends a JSON-RPC request
+    * @param method The JSON-RPC method, e.g. icx_call
+    * @param params The params of the method
+    * @returns The result of the request
+    * @throws JSONRPCException if the request failed
+    """
+    payload = {'jsonrpc': '2.0', 'method': method, 'id': self.nextId()}
+    if params:
+      payload['params'] = params
+
+    status, response = await self.send(payload)
+    if 'error' in response:
+      error = response['error']
+      raise JSONRPCException(error.get('message'), error.get('code'), error.get('data'))
+    if 'result' not in response:
+      raise HTTPError(json.dumps(response), status)
+    return response['result']
+
+  async def call(self, to: str, method: str, params: dict = None) -> Any:
+    """
+    * Calls a readonly method of a contract, as IconService#call does
+    * @param to The address of the contract
+    * @param method The method
+    * @param params The params of the method
+    * @returns The value returned by the method
+    """
+    return await self.request('icx_call', AsyncHTTPTransport.callParams(to, method, params))
+
+  @staticmethod
+  def callParams(to: str, method: str, params: dict = None) -> dict:
+    """
+    * Returns the params of the icx_call request calling a readonly method of a contract
+    """
+    data = {'method': method}
+    if isinstance(params, dict):
+      data['params'] = params
+    return {'to': to, 'dataType': 'call', 'data': data}
+
+  async def close(self) -> None:
+    """
+    * Closes the idle connections
+    """
+    idle, self.__idle = self.__idle, []
+    for connection in idle:
+      AsyncHTTPTransport.__discard(connection)
+
+    # the connections of another event loop can't be awaited
+    if self.__loop is asyncio.get_running_loop():
+      for _, writer in idle:
+        try:
+          await writer.wait_closed()
+        except (ConnectionError, ssl.SSLError):
+          pass
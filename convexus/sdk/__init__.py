@@ -10,9 +10,19 @@ from .entities.eventlogs import *
 from .entities.factoryProvider import *
 from .entities.observation import *
 from .entities.pool import *
+from .entities.parallelRouter import *
+from .entities.poolReplica import *
+from .entities.poolSnapshot import *
+from .entities.poolLiquidityIndex import *
+from .entities.poolLoader import *
+from .entities.quoteCache import *
 from .entities.slot0 import *
+from .entities.swapCache import *
 from .entities.route import *
+from .entities.routeCache import *
+from .entities.routingGraph import *
 from .entities.tick import *
+from .entities.tickBitmapDataProvider import *
 from .entities.tickDataProvider import *
 from .entities.tickListDataProvider import *
 from .entities.trade import *
@@ -30,7 +40,9 @@ from .utils.nearestUsableTick import *
 from .utils.position import *
 from .utils.priceTickConversions import *
 from .utils.sqrtPriceMath import *
+from .utils.sqrtRatioTable import *
 from .utils.swapMath import *
+from .utils.swapKernel import *
 from .utils.tickLibrary import *
 from .utils.tickList import *
 from .utils.tickMath import *
@@ -79,3 +79,90 @@ class TickUpdate:
       eventlog['data'][6],
       bool(int(eventlog['data'][7], 16)),
     )
+
+class Swap:
+  def __init__(self,
+    sender: str,
+    recipient: str,
+    amount0: BigintIsh,
+    amount1: BigintIsh,
+    sqrtPriceX96: BigintIsh,
+    liquidity: BigintIsh,
+    tick: int
+  ):
+    self.sender = sender
+    self.recipient = recipient
+    self.amount0 = BigInt(amount0)
+    self.amount1 = BigInt(amount1)
+    self.sqrtPriceX96 = BigInt(sqrtPriceX96)
+    self.liquidity = BigInt(liquidity)
+    self.tick = tick
+
+  @staticmethod
+  def fromEventLog(eventlog: dict):
+    return Swap(
+      eventlog['indexed'][1],
+      eventlog['indexed'][2],
+      eventlog['data'][0],
+      eventlog['data'][1],
+      eventlog['data'][2],
+      eventlog['data'][3],
+      int(eventlog['data'][4], 16)
+    )
+
+class Mint:
+  def __init__(self,
+    recipient: str,
+    tickLower: int,
+    tickUpper: int,
+    sender: str,
+    amount: BigintIsh,
+    amount0: BigintIsh,
+    amount1: BigintIsh
+  ):
+    self.recipient = recipient
+    self.tickLower = tickLower
+    self.tickUpper = tickUpper
+    self.sender = sender
+    self.amount = BigInt(amount)
+    self.amount0 = BigInt(amount0)
+    self.amount1 = BigInt(amount1)
+
+  @staticmethod
+  def fromEventLog(eventlog: dict):
+    return Mint(
+      eventlog['indexed'][1],
+      int(eventlog['indexed'][2], 16),
+      int(eventlog['indexed'][3], 16),
+      eventlog['data'][0],
+      eventlog['data'][1],
+      eventlog['data'][2],
+      eventlog['data'][3]
+    )
+
+class Burn:
+  def __init__(self,
+    caller: str,
+    tickLower: int,
+    tickUpper: int,
+    amount: BigintIsh,
+    amount0: BigintIsh,
+    amount1: BigintIsh
+  ):
+    self.caller = caller
+    self.tickLower = tickLower
+    self.tickUpper = tickUpper
+    self.amount = BigInt(amount)
+    self.amount0 = BigInt(amount0)
+    self.amount1 = BigInt(amount1)
+
+  @staticmethod
+  def fromEventLog(eventlog: dict):
+    return Burn(
+      eventlog['indexed'][1],
+      int(eventlog['indexed'][2], 16),
+      int(eventlog['indexed'][3], 16),
+      eventlog['data'][0],
+      eventlog['data'][1],
+      eventlog['data'][2]
+    )
@@ -0,0 +1,369 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+from convexus.sdkcore.constants import TradeType
+from convexus.sdkcore.utils.sortedInsert import sortedInsert
+from convexus.sdkcore.entities.errors import InsufficientInputAmountError
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+from convexus.sdkcore.entities.currency import Currency
+from convexus.sdk.entities.factoryProvider import PoolFactoryProvider
+from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.route import Route
+from convexus.sdk.entities.routingGraph import RoutingGraph
+from convexus.sdk.entities.trade import BestTradeOptions, Trade, UncheckedTradeConstructorArguments, tradeComparator
+
+# The maximum time in seconds a worker waits for the other workers to take their update
+UPDATE_TIMEOUT = 60
+
+# The state of a worker process, shipped once when the process starts, then updated in place
+_poolFactoryProvider: PoolFactoryProvider | None = None
+_graph: RoutingGraph | None = None
+# pool id => position of the pool in the graph
+_positions: Dict[int, int] = {}
+# The generation of the pools of the worker, bumped by every update
+_generation = 0
+# Shared by all the workers, so that every worker takes exactly one update task
+_barrier = None
+
+def _initializeWorker(poolFactoryProvider: PoolFactoryProvider, pools: List[Pool], barrier) -> None:
+  global _poolFactoryProvider, _barrier
+  _poolFactoryProvider = poolFactoryProvider
+  _barrier = barrier
+  _setPools(pools)
+
+def _setPools(pools: List[Pool]) -> None:
+  global _graph, _positions
+  _graph = RoutingGraph(pools)
+  _positions = {id(pool): position for position, pool in enumerate(_graph.pools)}
+
+def _ping() -> int:
+  return os.getpid()
+
+def _updateWorker(generation: int, changes: bytes) -> int:
+  """
+  * Replaces the pools of the worker that changed, then waits until every other worker took its own update task
+  * @param generation The generation of the new pools
+  * @param changes The pickled new pools, by position in the graph
+  * @returns The pid of the worker
+  """
+  global _generation
+  if generation > _generation:
+    pools = list(_graph.pools)
+    for position, pool in pickle.loads(changes).items():
+      pools[position] = pool
+    _setPools(pools)
+    _generation = generation
+
+  # a worker blocked on the barrier can't take a second update task, so all the workers get one
+  _barrier.wait(UPDATE_TIMEOUT)
+  return os.getpid()
+
+def _searchExactIn(
+  generation: int,
+  position: int,
+  currencyAmountIn: CurrencyAmount,
+  currencyOut: Currency,
+  options: BestTradeOptions
+) -> List[Tuple[List[int], int]]:
+  """
+  * Searches the best exact input trades whose first hop goes through a given pool
+  * @returns The positions of the pools of every trade, and its raw amount out
+  """
+  assert generation == _generation, 'GENERATION'
+  pool = _graph.pools[position]
+  try:
+    amountOut, _ = pool.getOutputAmount(currencyAmountIn.wrapped)
+  except InsufficientInputAmountError as error:
+    if (error.isInsufficientInputAmountError):
+      return []
+    raise error
+
+  bestTrades: List[Trade] = []
+  if (amountOut.currency.isToken and amountOut.currency.equals(currencyOut.wrapped)):
+    bestTrades.append(Trade.fromRoute(
+      _poolFactoryProvider,
+      Route([pool], currencyAmountIn.currency, currencyOut),
+      currencyAmountIn,
+      TradeType.EXACT_INPUT
+    ))
+  elif (options.maxHops > 1 and len(_graph) > 1):
+    Trade.bestTradeExactIn(
+      _poolFactoryProvider,
+      _graph,
+      currencyAmountIn,
+      currencyOut,
+      BestTradeOptions(options.maxNumResults, options.maxHops - 1, options.prune),
+      [pool],
+      amountOut,
+      bestTrades
+    )
+
+  return [
+    ([_positions[id(pool)] for pool in trade.swaps[0].route.pools], trade.outputAmount.quotient)
+    for trade in bestTrades
+  ]
+
+def _searchExactOut(
+  generation: int,
+  position: int,
+  currencyIn: Currency,
+  currencyAmountOut: CurrencyAmount,
+  options: BestTradeOptions
+) -> List[Tuple[List[int], int]]:
+  """
+  * Searches the best exact output trades whose last hop goes through a given pool
+  * @returns The positions of the pools of every trade, and its raw amount in
+  """
+  assert generation == _generation, 'GENERATION'
+  pool = _graph.pools[position]
+  try:
+    amountIn, _ = pool.getInputAmount(currencyAmountOut.wrapped)
+  except InsufficientInputAmountError as error:
+    if (error.isInsufficientInputAmountError):
+      return []
+    raise error
+
+  bestTrades: List[Trade] = []
+  if (amountIn.currency.equals(currencyIn.wrapped)):
+    bestTrades.append(Trade.fromRoute(
+      _poolFactoryProvider,
+      Route([pool], currencyIn, currencyAmountOut.currency),
+      currencyAmountOut,
+      TradeType.EXACT_OUTPUT
+    ))
+  elif (options.maxHops > 1 and len(_graph) > 1):
+    Trade.bestTradeExactOut(
+      _poolFactoryProvider,
+      _graph,
+      currencyIn,
+      currencyAmountOut,
+      BestTradeOptions(options.maxNumResults, options.maxHops - 1, options.prune),
+      [pool],
+      amountIn,
+      bestTrades
+    )
+
+  return [
+    ([_positions[id(pool)] for pool in trade.swaps[0].route.pools], trade.inputAmount.quotient)
+    for trade in bestTrades
+  ]
+
+class ParallelRouter:
+  """
+  * Runs the best trade searches of Trade#bestTradeExactIn and Trade#bestTradeExactOut on a pool of worker processes.
+  *
+  * The pools are shipped to the workers once, when they start, and #updatePools only ships them the pools that changed.
+  * A search is partitioned by its first hop, every worker
+  * searching the routes that start with one of the candidate pools, and the top trades of every partition are merged
+  * in the order of the candidates with the trade comparator, so the results are the same as a sequential search.
+  * Start the workers ahead of the requests with #start, or use the router as a context manager.
+  """
+
+  def __init__(
+    self,
+    poolFactoryProvider: PoolFactoryProvider,
+    pools: List[Pool],
+    workers: int | None = None,
+    mpContext = None
+  ) -> None:
+    """
+    * @param poolFactoryProvider The pool factory provider, shipped to the workers
+    * @param pools The pools to route through, shipped to the workers
+    * @param workers The number of worker processes, the number of CPUs by default
+    * @param mpContext The multiprocessing context used to start the workers
+    """
+    self.poolFactoryProvider = poolFactoryProvider
+    self.graph = RoutingGraph(pools)
+    self.workers = workers if workers else (os.cpu_count() or 1)
+    self.mpContext = mpContext
+    self.__executor: ProcessPoolExecutor | None = None
+    self.__generation = 0
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def __enter__(self) -> 'ParallelRouter':
+    return self.start()
+
+  def __exit__(self, *args) -> None:
+    self.close()
+
+  @property
+  def started(self) -> bool:
+    return self.__executor is not None
+
+  def start(self) -> 'ParallelRouter':
+    """
+    * Starts the workers and ships them the pools, waiting until all of them are ready
+    """
+    if self.__executor is None:
+      self.__generation = 0
+      self.__executor = ProcessPoolExecutor(
+        max_workers=self.workers,
+        mp_context=self.mpContext,
+        initializer=_initializeWorker,
+        initargs=(self.poolFactoryProvider, self.graph.pools, (self.mpContext or multiprocessing).Barrier(self.workers))
+      )
+      # the workers are spawned on demand, make sure they're all warm before the first request
+      for future in [self.__executor.submit(_ping) for _ in range(self.workers)]:
+        future.result()
+
+    return self
+
+  def close(self) -> None:
+    """
+    * Stops the workers
+    """
+    if self.__executor is not None:
+      self.__executor.shutdown()
+      self.__executor = None
+
+  def updatePools(self, pools: List[Pool]) -> None:
+    """
+    * Replaces the pools to route through.
+    * If the workers were started and the pools connect the same tokens with the same fees in the same order, the
+    * workers are kept alive and only receive the pools that changed. Otherwise they're restarted with the new pools.
+    * @param pools The new pools
+    """
+    graph = RoutingGraph(pools)
+
+    if self.__executor is not None and self.__topology(graph) != self.__topology(self.graph):
+      self.close()
+      self.graph = graph
+      self.start()
+      return
+
+    changes = {
+      position: pool
+      for position, (previous, pool) in enumerate(zip(self.graph.pools, graph.pools))
+      if previous is not pool
+    }
+    self.graph = graph
+
+    if self.__executor is not None and len(changes) > 0:
+      self.__generation += 1
+      payload = pickle.dumps(changes)
+      for future in [self.__executor.submit(_updateWorker, self.__generation, payload) for _ in range(self.workers)]:
+        future.result()
+
+  @staticmethod
+  def __topology(graph: RoutingGraph) -> List[Tuple[str, str, int]]:
+    return [(pool.token0.address, pool.token1.address, pool.fee) for pool in graph.pools]
+
+  def __submit(self, search, token: Currency, *args) -> List[Future]:
+    self.start()
+    return [
+      self.__executor.submit(search, self.__generation, position, *args)
+      for position in self.graph.poolsOf(token.wrapped)
+    ]
+
+  def __merge(
+    self,
+    results: List[List[Tuple[List[int], int]]],
+    currencyIn: Currency,
+    currencyOut: Currency,
+    amount: CurrencyAmount,
+    tradeType: TradeType,
+    maxNumResults: int
+  ) -> List[Trade]:
+    bestTrades: List[Trade] = []
+
+    for result in results:
+      for positions, quotient in result:
+        route = Route([self.graph.pools[position] for position in positions], currencyIn, currencyOut)
+        if (tradeType == TradeType.EXACT_INPUT):
+          inputAmount = CurrencyAmount.fromFractionalAmount(currencyIn, amount.numerator, amount.denominator)
+          outputAmount = CurrencyAmount.fromRawAmount(currencyOut, quotient)
+        else:
+          inputAmount = CurrencyAmount.fromRawAmount(currencyIn, quotient)
+          outputAmount = CurrencyAmount.fromFractionalAmount(currencyOut, amount.numerator, amount.denominator)
+
+        sortedInsert(
+          bestTrades,
+          Trade.createUncheckedTrade(self.poolFactoryProvider, UncheckedTradeConstructorArguments(
+            route=route,
+            inputAmount=inputAmount,
+            outputAmount=outputAmount,
+            tradeType=tradeType
+          )),
+          maxNumResults,
+          tradeComparator
+        )
+
+    return bestTrades
+
+  def bestTradeExactIn(
+    self,
+    currencyAmountIn: CurrencyAmount,
+    currencyOut: Currency,
+    options: BestTradeOptions = BestTradeOptions(3, 3)
+  ) -> List[Trade]:
+    """
+    * Same as Trade#bestTradeExactIn over the pools of the router, searching the routes of every first hop in parallel
+    * @param currencyAmountIn exact amount of input currency to spend
+    * @param currencyOut the desired currency out
+    * @param options the maximum number of results and the maximum number of hops
+    * @returns The exact in trades
+    """
+    assert len(self.graph) > 0, 'POOLS'
+    assert options.maxHops > 0, 'MAX_HOPS'
+
+    futures = self.__submit(_searchExactIn, currencyAmountIn.currency, currencyAmountIn, currencyOut, options)
+    results = [future.result() for future in futures]
+    return self.__merge(results, currencyAmountIn.currency, currencyOut, currencyAmountIn, TradeType.EXACT_INPUT, options.maxNumResults)
+
+  def bestTradeExactOut(
+    self,
+    currencyIn: Currency,
+    currencyAmountOut: CurrencyAmount,
+    options: BestTradeOptions = BestTradeOptions(3, 3)
+  ) -> List[Trade]:
+    """
+    * Same as Trade#bestTradeExactOut over the pools of the router, searching the routes of every last hop in parallel
+    * @param currencyIn the currency to spend
+    * @param currencyAmountOut the desired currency amount out
+    * @param options the maximum number of results and the maximum number of hops
+    * @returns The exact out trades
+    """
+    assert len(self.graph) > 0, 'POOLS'
+    assert options.maxHops > 0, 'MAX_HOPS'
+
+    futures = self.__submit(_searchExactOut, currencyAmountOut.currency, currencyIn, currencyAmountOut, options)
+    results = [future.result() for future in futures]
+    return self.__merge(results, currencyIn, currencyAmountOut.currency, currencyAmountOut, TradeType.EXACT_OUTPUT, options.maxNumResults)
+
+  async def bestTradeExactInAsync(
+    self,
+    currencyAmountIn: CurrencyAmount,
+    currencyOut: Currency,
+    options: BestTradeOptions = BestTradeOptions(3, 3)
+  ) -> List[Trade]:
+    """
+    * Same as #bestTradeExactIn, awaiting the workers instead of blocking the event loop
+    """
+    assert len(self.graph) > 0, 'POOLS'
+    assert options.maxHops > 0, 'MAX_HOPS'
+
+    futures = self.__submit(_searchExactIn, currencyAmountIn.currency, currencyAmountIn, currencyOut, options)
+    results = await asyncio.gather(*[asyncio.wrap_future(future) for future in futures])
+    return self.__merge(results, currencyAmountIn.currency, currencyOut, currencyAmountIn, TradeType.EXACT_INPUT, options.maxNumResults)
+
+  async def bestTradeExactOutAsync(
+    self,
+    currencyIn: Currency,
+    currencyAmountOut: CurrencyAmount,
+    options: BestTradeOptions = BestTradeOptions(3, 3)
+  ) -> List[Trade]:
+    """
+    * Same as #bestTradeExactOut, awaiting the workers instead of blocking the event loop
+    """
+    assert len(self.graph) > 0, 'POOLS'
+    assert options.maxHops > 0, 'MAX_HOPS'
+
+    futures = self.__submit(_searchExactOut, currencyAmountOut.currency, currencyIn, currencyAmountOut, options)
+    results = await asyncio.gather(*[asyncio.wrap_future(future) for future in futures])
+    return self.__merge(results, currencyIn, currencyAmountOut.currency, currencyAmountOut, TradeType.EXACT_OUTPUT, options.maxNumResults)
@@ -4,32 +4,25 @@ from typing import List, Tuple, cast
 from convexus.icontoolkit.contract import Contract
 from convexus.icontoolkit.BigInt import BigInt
 from convexus.icontoolkit.constants import BigintIsh
+from convexus.sdkcore.utils.slots import slotsToDict
 from convexus.sdkcore.entities.fractions.price import Price
 from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
 from convexus.sdkcore.entities.currency import Token
+from convexus.sdkcore.entities.tokenMetadataCache import TokenMetadataCache, TOKEN_METADATA_CACHE
 from convexus.sdk.constants import FeeAmount, TICK_SPACINGS
 from convexus.sdk.entities.tickDataProvider import NoTickDataProvider, TickDataProvider
 from convexus.sdk.entities.factoryProvider import NoPoolFactoryProvider, PoolFactoryProvider
 from convexus.sdk.entities.tick import Tick, TickConstructorArgs
 from convexus.sdk.entities.tickListDataProvider import TickListDataProvider
+from convexus.sdk.entities.poolLiquidityIndex import PoolLiquidityIndex, LiquidityDistribution, DepthCurve
+from convexus.sdk.entities.poolSnapshot import PoolSnapshot
 from convexus.sdk.utils.tickMath import TickMath
 from convexus.sdk.internalConstants import Q192
-from convexus.sdk.utils.swapMath import SwapMath
-from convexus.sdk.utils.liquidityMath import LiquidityMath
+from convexus.sdk.utils.swapKernel import computeSwap, computeSwapMany
 from convexus.sdk.entities.slot0 import Slot0
 from convexus.sdk.artifacts.contracts.IRC2 import IIRC2
 from collections.abc import Sequence
 
-@dataclass
-class StepComputations:
-  sqrtPriceStartX96: int
-  tickNext: int
-  initialized: bool
-  sqrtPriceNextX96: int
-  amountIn: int
-  amountOut: int
-  feeAmount: int
-
 @dataclass
 class SwapResult:
   amountCalculated: int
@@ -47,6 +40,21 @@ class Pool:
   """
   * Represents a Convexus pool
   """
+
+  __slots__ = (
+    'token0',
+    'token1',
+    'fee',
+    'sqrtRatioX96',
+    'liquidity',
+    'tickCurrent',
+    '__tickDataProvider',
+    'poolFactoryProvider',
+    '__token0Price',
+    '__token1Price',
+    '__liquidityIndex'
+  )
+
   def __init__(
     self,
     tokenA: Token,
@@ -91,7 +99,12 @@ class Pool:
     self.__token1Price: Price | None = None
 
   @staticmethod
-  async def fromContract (contract: Contract) -> 'Pool':
+  async def fromContract (contract: Contract, tokenMetadataCache: TokenMetadataCache = TOKEN_METADATA_CACHE) -> 'Pool':
+    """
+    * Construct a pool from the state of its contract
+    * @param contract The pool contract
+    * @param tokenMetadataCache The cache of the metadata of the tokens, only the tokens missing from it are read
+    """
     addr0, addr1, _slot0, fee, liquidity = await asyncio.gather(
       contract.token0(), 
       contract.token1(), 
@@ -100,16 +113,38 @@ class Pool:
       contract.liquidity()
     )
     slot0 = Slot0.fromCall(_slot0)
-    args = IIRC2, contract.iconService, contract.debugService, contract.nid
-    token0, token1 = await asyncio.gather(
-      Token.fromContract(Contract(addr0, *args)),
-      Token.fromContract(Contract(addr1, *args))
-    )
+    args = IIRC2, contract.iconService, contract.debugService, contract.nid, contract.transport
+    token0, token1 = await Token.fromContracts([addr0, addr1], lambda address: Contract(address, *args), tokenMetadataCache)
 
     return Pool(token0, token1, fee, slot0.sqrtPriceX96, liquidity, slot0.tick)
 
+  @staticmethod
+  def fromSnapshot (buffer, poolFactoryProvider: PoolFactoryProvider = NO_POOL_FACTORY_PROVIDER_DEFAULT) -> 'Pool':
+    """
+    * Construct a pool from a binary snapshot written by #toSnapshot.
+    * The ticks are read in place from the buffer and only decoded when the pool touches them
+    * @param buffer A bytes-like object, such as the content or a memory map of a snapshot file
+    """
+    snapshot = PoolSnapshot.decode(buffer)
+    return Pool(
+      snapshot.token0,
+      snapshot.token1,
+      snapshot.fee,
+      snapshot.sqrtRatioX96,
+      snapshot.liquidity,
+      snapshot.tickCurrent,
+      snapshot.tickDataProvider,
+      poolFactoryProvider
+    )
+
+  def toSnapshot (self) -> bytes:
+    """
+    * Serializes the pool and the liquidity of its ticks to a compact binary snapshot, see #PoolSnapshot
+    """
+    return PoolSnapshot.encode(self)
+
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
   def __eq__(self, __o) -> bool:
     return self.token0 == __o.token0 and self.token1 == __o.token1 and self.fee == __o.fee
@@ -259,85 +294,107 @@ class Pool:
       assert (sqrtPriceLimitX96 < TickMath.MAX_SQRT_RATIO), 'RATIO_MAX'
       assert (sqrtPriceLimitX96 > self.sqrtRatioX96), 'RATIO_CURRENT'
   
-    exactInput = amountSpecified >= 0
-
-    # keep track of swap state
-    @dataclass
-    class SwapState:
-      amountSpecifiedRemaining: int
-      amountCalculated: int
-      sqrtPriceX96: int
-      tick: int
-      liquidity: int
-
-    state = SwapState (
+    amountCalculated, sqrtPriceX96, liquidity, tick = computeSwap (
+      self.tickDataProvider,
+      self.fee,
+      self.tickSpacing,
+      zeroForOne,
       amountSpecified,
-      0,
+      sqrtPriceLimitX96,
       self.sqrtRatioX96,
       self.tickCurrent,
       self.liquidity
     )
 
-    # start swap while loop
-    while ((state.amountSpecifiedRemaining != 0) and state.sqrtPriceX96 != sqrtPriceLimitX96):
-      step = StepComputations(0, 0, False, 0, 0, 0, 0)
-      step.sqrtPriceStartX96 = state.sqrtPriceX96
-
-      # because each iteration of the while loop rounds, we can't optimize this code (relative to the smart contract)
-      # by simply traversing to the next available tick, we instead need to exactly replicate
-      # tickBitmap.nextInitializedTickWithinOneWord
-      step.tickNext, step.initialized = self.tickDataProvider.nextInitializedTickWithinOneWord(
-        state.tick,
-        zeroForOne,
-        self.tickSpacing
-      )
+    return SwapResult (
+      amountCalculated,
+      sqrtPriceX96,
+      liquidity,
+      tick
+    )
 
-      if (step.tickNext < TickMath.MIN_TICK):
-        step.tickNext = TickMath.MIN_TICK
-      elif (step.tickNext > TickMath.MAX_TICK):
-        step.tickNext = TickMath.MAX_TICK
-    
-      step.sqrtPriceNextX96 = TickMath.getSqrtRatioAtTick(step.tickNext)
-
-      direction = (step.sqrtPriceNextX96 < sqrtPriceLimitX96) if zeroForOne else (step.sqrtPriceNextX96 > sqrtPriceLimitX96)
-      state.sqrtPriceX96, step.amountIn, step.amountOut, step.feeAmount = SwapMath.computeSwapStep (
-        state.sqrtPriceX96, 
-        sqrtPriceLimitX96 if direction else step.sqrtPriceNextX96,
-        state.liquidity,
-        state.amountSpecifiedRemaining,
-        self.fee
-      )
+  def swapMany (
+    self,
+    zeroForOne: bool,
+    amountsSpecified: List[int],
+    sqrtPriceLimitX96: int = None
+  ) -> List[SwapResult]:
+    """
+    * Executes a swap for each of the given amounts, all starting from the current state of the pool.
+    * The ticks are only traversed once for all the amounts, the results are the same as calling #swap for each amount
+    * @param zeroForOne Whether the amounts in are token0 or token1
+    * @param amountsSpecified The amounts of the swaps, exact input if positive, exact output if negative
+    * @param sqrtPriceLimitX96 The Q64.96 sqrt price limit, see #swap
+    * @returns The result of each swap, in the order of the amounts
+    """
+    if not sqrtPriceLimitX96:
+      a = TickMath.MIN_SQRT_RATIO + 1
+      b = TickMath.MAX_SQRT_RATIO - 1
+      sqrtPriceLimitX96 = a if zeroForOne else b
 
-      if exactInput:
-        state.amountSpecifiedRemaining = state.amountSpecifiedRemaining - (step.amountIn + step.feeAmount)
-        state.amountCalculated = state.amountCalculated - step.amountOut
-      else:
-        state.amountSpecifiedRemaining = state.amountSpecifiedRemaining + step.amountOut
-        state.amountCalculated = state.amountCalculated + step.amountIn + step.feeAmount
-
-      if state.sqrtPriceX96 == step.sqrtPriceNextX96:
-        # if the tick is initialized, run the tick transition
-        if step.initialized:
-          liquidityNet = self.tickDataProvider.getTick(step.tickNext).liquidityNet
-          # if we're moving leftward, we interpret liquidityNet as the opposite sign
-          # safe because liquidityNet cannot be type(int128).min
-          if (zeroForOne):
-            liquidityNet = liquidityNet * -1
-          state.liquidity = LiquidityMath.addDelta(state.liquidity, liquidityNet)
-
-        state.tick = step.tickNext - 1 if zeroForOne else step.tickNext
-
-      elif (state.sqrtPriceX96 != step.sqrtPriceStartX96):
-        # recompute unless we're on a lower tick boundary (i.e. already transitioned ticks), and haven't moved
-        state.tick = TickMath.getTickAtSqrtRatio(state.sqrtPriceX96)
+    if (zeroForOne):
+      assert (sqrtPriceLimitX96 > TickMath.MIN_SQRT_RATIO), 'RATIO_MIN'
+      assert (sqrtPriceLimitX96 < self.sqrtRatioX96), 'RATIO_CURRENT'
+    else:
+      assert (sqrtPriceLimitX96 < TickMath.MAX_SQRT_RATIO), 'RATIO_MAX'
+      assert (sqrtPriceLimitX96 > self.sqrtRatioX96), 'RATIO_CURRENT'
 
-    return SwapResult (
-      state.amountCalculated,
-      state.sqrtPriceX96,
-      state.liquidity,
-      state.tick
+    results = computeSwapMany (
+      self.tickDataProvider,
+      self.fee,
+      self.tickSpacing,
+      zeroForOne,
+      list(amountsSpecified),
+      sqrtPriceLimitX96,
+      self.sqrtRatioX96,
+      self.tickCurrent,
+      self.liquidity
     )
 
+    return [SwapResult(*result) for result in results]
+
+  @property
+  def tickDataProvider(self) -> TickDataProvider:
+    """
+    * Returns the tick data provider of the pool
+    """
+    return self.__tickDataProvider
+
+  @tickDataProvider.setter
+  def tickDataProvider(self, tickDataProvider: TickDataProvider) -> None:
+    # the liquidity index is built from the ticks of the previous provider
+    self.__tickDataProvider = tickDataProvider
+    self.__liquidityIndex: PoolLiquidityIndex | None = None
+
+  @property
+  def liquidityIndex(self) -> PoolLiquidityIndex:
+    """
+    * Returns the liquidity index of the pool, built once from the ticks of its tick data provider,
+    * and again whenever the provider is replaced. The queries start from the current price of the pool,
+    * even if it has been updated in place since the index was built
+    """
+    index = self.__liquidityIndex
+    if not index or index.fee != self.fee:
+      self.__liquidityIndex = PoolLiquidityIndex.fromPool(self)
+    elif index.sqrtRatioX96 != self.sqrtRatioX96:
+      self.__liquidityIndex = index.atSqrtRatio(self.sqrtRatioX96)
+
+    return self.__liquidityIndex
+
+  def liquidityDistribution(self) -> LiquidityDistribution:
+    """
+    * Returns the in range liquidity between every initialized tick of the pool
+    """
+    return self.liquidityIndex.liquidityDistribution()
+
+  def depthCurve(self, levels: List[int]) -> DepthCurve:
+    """
+    * Computes the cumulative bid and ask depth of the pool at a set of price levels
+    * @param levels The price levels, as Q64.96 sqrt prices. Levels below the current price are on the bid side, levels above on the ask side
+    * @returns The input amount, fee included, needed to move the price to each level and the output amount available before it
+    """
+    return self.liquidityIndex.depthCurve(levels)
+
   @property
   def tickSpacing(self) -> int:
     return TICK_SPACINGS[self.fee]
\ No newline at end of file
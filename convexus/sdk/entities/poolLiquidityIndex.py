@@ -0,0 +1,291 @@
+import copy
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+from convexus.sdk.constants import FeeAmount
+from convexus.sdk.entities.tick import Tick, TickConstructorArgs
+from convexus.sdk.utils.tickList import TickList
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.sqrtPriceMath import SqrtPriceMath
+from convexus.sdk.utils.fullMath import FullMath
+from convexus.sdk.utils.swapMath import MAX_FEE
+
+@dataclass
+class LiquidityDistribution:
+  # the initialized ticks, in ascending order
+  ticks: List[int]
+  # the in range liquidity between each tick and the next one
+  liquidities: List[int]
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+@dataclass
+class DepthCurve:
+  # the price levels, as Q64.96 sqrt prices
+  sqrtPricesX96: List[int]
+  # the input amount, fee included, needed to move the price to each level
+  amountsIn: List[int]
+  # the output amount available before each level, i.e. the cumulative depth
+  amountsOut: List[int]
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+class PoolLiquidityIndex:
+  """
+  * An index of the liquidity of a pool, split in segments of constant liquidity between two consecutive initialized ticks.
+  * For every segment boundary, the index stores the cumulative amounts of token0 and token1 needed to traverse all the
+  * segments below it, so the amount needed to reach a price, or the price reached by an amount, is found with a binary
+  * search and a single closed form computation in the last segment, instead of simulating the swap step by step.
+  *
+  * The amounts are computed once per segment rather than once per swap step, so they can differ from #Pool.swap
+  * by a few units of rounding. The input amounts include the fee of the pool.
+  """
+
+  def __init__(
+    self,
+    ticks: List[Tick | TickConstructorArgs],
+    tickSpacing: int,
+    fee: FeeAmount,
+    sqrtRatioX96: int
+  ) -> None:
+    """
+    * Builds the index
+    * @param ticks The initialized ticks of the pool
+    * @param tickSpacing The tick spacing of the pool
+    * @param fee The fee of the pool
+    * @param sqrtRatioX96 The current sqrt price of the pool, from which the queries start
+    """
+    ticksMapped: List[Tick] = list(map(lambda t: (t if isinstance(t, Tick) else Tick(t)), ticks))
+    TickList.validateList(ticksMapped, tickSpacing)
+    assert TickMath.MIN_SQRT_RATIO <= sqrtRatioX96 < TickMath.MAX_SQRT_RATIO, 'SQRT_RATIO'
+
+    self.fee = fee
+    self.sqrtRatioX96 = sqrtRatioX96
+    # the tick and the sqrt price of every segment boundary, in ascending order
+    self.tickIndexes: List[int] = []
+    self.sqrtRatios: List[int] = []
+    # the liquidity of the segment below every boundary, and above the last one
+    self.liquidities: List[int] = [0]
+    # the cumulative amounts needed to go from the first boundary to every boundary, rounded up and down
+    self.amount0Up: List[int] = []
+    self.amount0Down: List[int] = []
+    self.amount1Up: List[int] = []
+    self.amount1Down: List[int] = []
+
+    liquidity = 0
+    for tick in ticksMapped:
+      sqrtRatioX96 = TickMath.getSqrtRatioAtTick(tick.index)
+
+      if self.sqrtRatios and self.sqrtRatios[-1] == sqrtRatioX96:
+        # merge the ticks sharing the same index
+        liquidity += tick.liquidityNet
+        self.liquidities[-1] = liquidity
+        continue
+
+      if self.sqrtRatios:
+        previous = self.sqrtRatios[-1]
+        self.amount0Up.append(self.amount0Up[-1] + SqrtPriceMath.getAmount0Delta(previous, sqrtRatioX96, liquidity, True))
+        self.amount0Down.append(self.amount0Down[-1] + SqrtPriceMath.getAmount0Delta(previous, sqrtRatioX96, liquidity, False))
+        self.amount1Up.append(self.amount1Up[-1] + SqrtPriceMath.getAmount1Delta(previous, sqrtRatioX96, liquidity, True))
+        self.amount1Down.append(self.amount1Down[-1] + SqrtPriceMath.getAmount1Delta(previous, sqrtRatioX96, liquidity, False))
+      else:
+        self.amount0Up.append(0)
+        self.amount0Down.append(0)
+        self.amount1Up.append(0)
+        self.amount1Down.append(0)
+
+      liquidity += tick.liquidityNet
+      self.tickIndexes.append(tick.index)
+      self.sqrtRatios.append(sqrtRatioX96)
+      self.liquidities.append(liquidity)
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  @staticmethod
+  def fromPool(pool) -> 'PoolLiquidityIndex':
+    """
+    * Builds the index of a pool whose tick data provider holds its list of ticks
+    * @param pool The pool
+    """
+    ticks = getattr(pool.tickDataProvider, 'ticks', None)
+    assert ticks is not None, 'TICKS'
+    return PoolLiquidityIndex(ticks, pool.tickSpacing, pool.fee, pool.sqrtRatioX96)
+
+  def atSqrtRatio(self, sqrtRatioX96: int) -> 'PoolLiquidityIndex':
+    """
+    * Returns the same index with the queries starting from another price, sharing the segments derived from the ticks
+    * @param sqrtRatioX96 The current sqrt price of the pool, from which the queries start
+    """
+    assert TickMath.MIN_SQRT_RATIO <= sqrtRatioX96 < TickMath.MAX_SQRT_RATIO, 'SQRT_RATIO'
+    index = copy.copy(self)
+    index.sqrtRatioX96 = sqrtRatioX96
+    return index
+
+  def segmentAt(self, sqrtPriceX96: int) -> int:
+    """
+    * Returns the segment containing a sqrt price, i.e. the number of boundaries less than or equal to it
+    * @param sqrtPriceX96 The sqrt price
+    """
+    return bisect_right(self.sqrtRatios, sqrtPriceX96)
+
+  def liquidityAt(self, sqrtPriceX96: int) -> int:
+    """
+    * Returns the in range liquidity at a sqrt price
+    * @param sqrtPriceX96 The sqrt price
+    """
+    return self.liquidities[self.segmentAt(sqrtPriceX96)]
+
+  def getAmountsToSqrtPrice(self, sqrtPriceTargetX96: int) -> Tuple[int, int]:
+    """
+    * Computes the amounts swapped to move the price of the pool to a target price
+    * @param sqrtPriceTargetX96 The target sqrt price
+    * @returns The input amount, fee included, and the output amount. Token0 is the input if the target is below the current price
+    """
+    assert TickMath.MIN_SQRT_RATIO <= sqrtPriceTargetX96 < TickMath.MAX_SQRT_RATIO, 'SQRT_RATIO'
+
+    if sqrtPriceTargetX96 < self.sqrtRatioX96:
+      lower, upper = sqrtPriceTargetX96, self.sqrtRatioX96
+      amountIn = self.__amountBetween(lower, upper, self.amount0Up, SqrtPriceMath.getAmount0Delta, True)
+      amountOut = self.__amountBetween(lower, upper, self.amount1Down, SqrtPriceMath.getAmount1Delta, False)
+    else:
+      lower, upper = self.sqrtRatioX96, sqrtPriceTargetX96
+      amountIn = self.__amountBetween(lower, upper, self.amount1Up, SqrtPriceMath.getAmount1Delta, True)
+      amountOut = self.__amountBetween(lower, upper, self.amount0Down, SqrtPriceMath.getAmount0Delta, False)
+
+    feeAmount = FullMath.mulDivRoundingUp(amountIn, self.fee, MAX_FEE - self.fee)
+    return (amountIn + feeAmount, amountOut)
+
+  def liquidityDistribution(self) -> LiquidityDistribution:
+    """
+    * Returns the in range liquidity of every segment, from the lowest initialized tick to the highest one
+    """
+    return LiquidityDistribution(list(self.tickIndexes), self.liquidities[1:])
+
+  def depthCurve(self, sqrtPricesX96: List[int]) -> DepthCurve:
+    """
+    * Computes the cumulative depth of the pool at a set of price levels.
+    * Levels below the current price are on the bid side: token0 is sold for token1.
+    * Levels above the current price are on the ask side: token1 is sold for token0.
+    * @param sqrtPricesX96 The price levels, as Q64.96 sqrt prices
+    """
+    amountsIn: List[int] = []
+    amountsOut: List[int] = []
+    for sqrtPriceX96 in sqrtPricesX96:
+      amountIn, amountOut = self.getAmountsToSqrtPrice(sqrtPriceX96)
+      amountsIn.append(amountIn)
+      amountsOut.append(amountOut)
+    return DepthCurve(list(sqrtPricesX96), amountsIn, amountsOut)
+
+  def getSqrtPriceAfterInput(self, zeroForOne: bool, amountIn: int) -> int:
+    """
+    * Computes the price of the pool after swapping an input amount.
+    * If the amount exceeds the liquidity of the pool, the price goes to the default price limit of #Pool.swap
+    * @param zeroForOne Whether the amount in is token0 or token1
+    * @param amountIn The input amount, fee included
+    * @returns The sqrt price after the swap
+    """
+    assert amountIn >= 0, 'AMOUNT'
+    amountInLessFee = (amountIn * (MAX_FEE - self.fee)) // MAX_FEE
+
+    if zeroForOne:
+      return self.__sqrtPriceAfter(True, amountInLessFee, self.amount0Up, SqrtPriceMath.getAmount0Delta, True, SqrtPriceMath.getNextSqrtPriceFromInput)
+    else:
+      return self.__sqrtPriceAfter(False, amountInLessFee, self.amount1Up, SqrtPriceMath.getAmount1Delta, True, SqrtPriceMath.getNextSqrtPriceFromInput)
+
+  def getSqrtPriceAfterOutput(self, zeroForOne: bool, amountOut: int) -> int:
+    """
+    * Computes the price of the pool after swapping for an output amount.
+    * If the amount exceeds the liquidity of the pool, the price goes to the default price limit of #Pool.swap
+    * @param zeroForOne Whether the amount out is token1 or token0
+    * @param amountOut The output amount
+    * @returns The sqrt price after the swap
+    """
+    assert amountOut >= 0, 'AMOUNT'
+
+    if zeroForOne:
+      return self.__sqrtPriceAfter(True, amountOut, self.amount1Down, SqrtPriceMath.getAmount1Delta, False, SqrtPriceMath.getNextSqrtPriceFromOutput)
+    else:
+      return self.__sqrtPriceAfter(False, amountOut, self.amount0Down, SqrtPriceMath.getAmount0Delta, False, SqrtPriceMath.getNextSqrtPriceFromOutput)
+
+  def __amountBetween(
+    self,
+    sqrtPriceLowerX96: int,
+    sqrtPriceUpperX96: int,
+    cumulative: List[int],
+    getAmountDelta: Callable[[int, int, int, bool], int],
+    roundUp: bool
+  ) -> int:
+    lower = self.segmentAt(sqrtPriceLowerX96)
+    upper = self.segmentAt(sqrtPriceUpperX96)
+
+    if lower == upper:
+      return getAmountDelta(sqrtPriceLowerX96, sqrtPriceUpperX96, self.liquidities[lower], roundUp)
+
+    # the partial segments at both ends, and the full segments between them
+    return (
+      getAmountDelta(sqrtPriceLowerX96, self.sqrtRatios[lower], self.liquidities[lower], roundUp)
+      + cumulative[upper - 1] - cumulative[lower]
+      + getAmountDelta(self.sqrtRatios[upper - 1], sqrtPriceUpperX96, self.liquidities[upper], roundUp)
+    )
+
+  def __sqrtPriceAfter(
+    self,
+    zeroForOne: bool,
+    amount: int,
+    cumulative: List[int],
+    getAmountDelta: Callable[[int, int, int, bool], int],
+    roundUp: bool,
+    getNextSqrtPrice: Callable[[int, int, int, bool], int]
+  ) -> int:
+    sqrtPriceX96 = self.sqrtRatioX96
+    sqrtRatios = self.sqrtRatios
+    liquidities = self.liquidities
+
+    if amount == 0:
+      return sqrtPriceX96
+
+    segment = self.segmentAt(sqrtPriceX96)
+
+    if zeroForOne:
+      # no liquidity below the lowest boundary
+      if segment == 0:
+        return TickMath.MIN_SQRT_RATIO + 1
+
+      boundary = segment - 1
+      available = getAmountDelta(sqrtRatios[boundary], sqrtPriceX96, liquidities[segment], roundUp)
+      if amount < available:
+        return getNextSqrtPrice(sqrtPriceX96, liquidities[segment], amount, True)
+
+      # find the lowest boundary reachable with the remaining amount
+      target = cumulative[boundary] - (amount - available)
+      if target < 0:
+        return TickMath.MIN_SQRT_RATIO + 1
+
+      index = bisect_left(cumulative, target, 0, boundary + 1)
+      if cumulative[index] == target:
+        # the amount runs out exactly on a boundary, stop at the first one reached
+        return sqrtRatios[bisect_right(cumulative, target, 0, boundary + 1) - 1]
+
+      return getNextSqrtPrice(sqrtRatios[index], liquidities[index], cumulative[index] - target, True)
+    else:
+      # no liquidity above the highest boundary
+      if segment == len(sqrtRatios):
+        return TickMath.MAX_SQRT_RATIO - 1
+
+      available = getAmountDelta(sqrtPriceX96, sqrtRatios[segment], liquidities[segment], roundUp)
+      if amount < available:
+        return getNextSqrtPrice(sqrtPriceX96, liquidities[segment], amount, False)
+
+      # find the highest boundary reachable with the remaining amount
+      target = cumulative[segment] + (amount - available)
+      if target > cumulative[-1]:
+        return TickMath.MAX_SQRT_RATIO - 1
+
+      index = bisect_left(cumulative, target, segment)
+      if cumulative[index] == target:
+        return sqrtRatios[index]
+
+      return getNextSqrtPrice(sqrtRatios[index - 1], liquidities[index], target - cumulative[index - 1], False)
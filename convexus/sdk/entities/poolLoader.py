@@ -0,0 +1,145 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Tuple
+
+from iconsdk.icon_service import IconService
+
+from convexus.icontoolkit.contract import Contract
+from convexus.icontoolkit.transport import AsyncHTTPTransport
+from convexus.icontoolkit.batcher import RpcBatcher
+from convexus.sdkcore.entities.currency import Icx, Token, TOKEN_REGISTRY
+from convexus.sdkcore.entities.tokenMetadataCache import TokenMetadata, TokenMetadataCache, TOKEN_METADATA_CACHE
+from convexus.sdk.entities.pool import Pool, NO_TICK_DATA_PROVIDER_DEFAULT
+from convexus.sdk.entities.slot0 import Slot0
+from convexus.sdk.entities.tick import Tick
+from convexus.sdk.artifacts.contracts.ConvexusPool import IConvexusPool
+from convexus.sdk.artifacts.contracts.IRC2 import IIRC2
+
+class PoolLoader:
+  """
+  * Loads many pools from their contracts concurrently, as Pool#fromContract does for a single pool.
+  *
+  * The tokens of every pool are resolved as soon as its state is read, through tasks shared by the pools, so the tokens shared
+  * by the pools are only read once, and only if their metadata isn't cached yet. The new metadata is cached, and the cache saved,
+  * once all the pools are loaded. The number of RPC requests in flight is capped, so loading many pools doesn't overwhelm the node.
+  """
+
+  def __init__(
+    self,
+    iconService: IconService,
+    debugService: IconService,
+    nid: int,
+    poolAbi: List = IConvexusPool,
+    maxConcurrency: int = 16,
+    ticksPageSize: int = 100,
+    tokenMetadataCache: TokenMetadataCache = TOKEN_METADATA_CACHE,
+    transport: AsyncHTTPTransport | RpcBatcher | None = None
+  ) -> None:
+    """
+    * @param iconService The service the contracts are read from
+    * @param debugService The debug service of the contracts
+    * @param nid The network id
+    * @param poolAbi The ABI of the pool contracts. Loading the ticks requires `ticksInitializedRange`, defined by the ABI
+    *                of the deployed pools, see Contract#getAbi
+    * @param maxConcurrency The maximum number of RPC requests in flight
+    * @param ticksPageSize The number of ticks read per request
+    * @param tokenMetadataCache The cache of the metadata of the tokens, only the tokens missing from it are read
+    * @param transport The transport of the readonly calls of the contracts, see Contract
+    """
+    assert maxConcurrency > 0, 'MAX_CONCURRENCY'
+    assert ticksPageSize > 0, 'TICKS_PAGE_SIZE'
+
+    self.iconService = iconService
+    self.debugService = debugService
+    self.nid = nid
+    self.poolAbi = poolAbi
+    self.maxConcurrency = maxConcurrency
+    self.ticksPageSize = ticksPageSize
+    self.tokenMetadataCache = tokenMetadataCache
+    self.transport = transport
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def contractOf(self, address: str, abi: List) -> Contract:
+    """
+    * Returns the contract of an address
+    * @param address The address of the contract
+    * @param abi The ABI of the contract
+    """
+    return Contract(address, abi, self.iconService, self.debugService, self.nid, self.transport)
+
+  async def loadMany(self, addresses: List[str], ticks: bool = False) -> AsyncIterator[Tuple[str, Pool]]:
+    """
+    * Loads pools concurrently, yielding every pool as soon as it's loaded
+    * @param addresses The addresses of the pool contracts, loaded once each
+    * @param ticks Whether to load the initialized ticks of the pools too, in pages read concurrently
+    * @returns The normalized address and the pool of every pool contract, in the order they're loaded
+    """
+    addresses = list(dict.fromkeys(TOKEN_REGISTRY.parse(address)[0] for address in addresses))
+    semaphore = asyncio.Semaphore(self.maxConcurrency)
+
+    async def call(method, *args):
+      async with semaphore:
+        return await method(*args)
+
+    # the metadata read from the contracts, cached once all the pools are loaded so the cache is only saved once
+    newMetadata: Dict[str, TokenMetadata] = {}
+    # normalized address => task resolving the token, shared by the pools of the token
+    tokenTasks: Dict[str, asyncio.Task] = {}
+
+    async def loadToken(address: str) -> Token:
+      if Icx.isWrappedAddress(address):
+        return Icx().wrapped
+
+      metadata = self.tokenMetadataCache.get(address)
+      if metadata is None:
+        contract = self.contractOf(address, IIRC2)
+        decimals, name, symbol = await asyncio.gather(call(contract.decimals), call(contract.name), call(contract.symbol))
+        metadata = newMetadata[address] = TokenMetadata(decimals, symbol, name)
+      return Token(address, metadata.decimals, metadata.symbol, metadata.name)
+
+    def tokenOf(address: str) -> asyncio.Future:
+      address = TOKEN_REGISTRY.parse(address)[0]
+      if address not in tokenTasks:
+        tokenTasks[address] = asyncio.ensure_future(loadToken(address))
+      # a pool cancelled while waiting doesn't cancel the token of the other pools
+      return asyncio.shield(tokenTasks[address])
+
+    async def loadState(contract: Contract) -> Tuple:
+      return await asyncio.gather(
+        call(contract.token0),
+        call(contract.token1),
+        call(contract.slot0),
+        call(contract.fee),
+        call(contract.liquidity)
+      )
+
+    async def loadTicks(contract: Contract) -> List[Tick]:
+      size = await call(contract.ticksInitializedSize)
+      pages = await asyncio.gather(*[
+        call(contract.ticksInitializedRange, start, min(start + self.ticksPageSize, size))
+        for start in range(0, size, self.ticksPageSize)
+      ])
+      return sorted((Tick.fromCall(data) for page in pages for data in page), key=lambda tick: tick.index)
+
+    async def loadPool(address: str, contract: Contract) -> Tuple[str, Pool]:
+      ticksTask = asyncio.ensure_future(loadTicks(contract)) if ticks else None
+      try:
+        addr0, addr1, _slot0, fee, liquidity = await loadState(contract)
+        token0, token1 = await asyncio.gather(tokenOf(addr0), tokenOf(addr1))
+        slot0 = Slot0.fromCall(_slot0)
+        tickData = await ticksTask if ticksTask else NO_TICK_DATA_PROVIDER_DEFAULT
+      finally:
+        if ticksTask:
+          ticksTask.cancel()
+
+      return address, Pool(token0, token1, fee, slot0.sqrtPriceX96, liquidity, slot0.tick, tickData)
+
+    tasks = [asyncio.ensure_future(loadPool(address, self.contractOf(address, self.poolAbi))) for address in addresses]
+    try:
+      for task in asyncio.as_completed(tasks):
+        yield await task
+    finally:
+      for task in tasks + list(tokenTasks.values()):
+        task.cancel()
+      self.tokenMetadataCache.update(newMetadata)
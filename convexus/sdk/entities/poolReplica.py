@@ -0,0 +1,242 @@
+from bisect import bisect_left
+from typing import Dict, List
+from convexus.icontoolkit.constants import BigintIsh
+from convexus.icontoolkit.BigInt import BigInt
+from convexus.sdkcore.entities.currency import Token
+from convexus.sdk.constants import FeeAmount, TICK_SPACINGS
+from convexus.sdk.entities.tick import Tick, TickConstructorArgs, FeeGrowthOutside
+from convexus.sdk.entities.tickBitmapDataProvider import TickBitmapDataProvider
+from convexus.sdk.entities.factoryProvider import PoolFactoryProvider
+from convexus.sdk.entities.pool import Pool, NO_POOL_FACTORY_PROVIDER_DEFAULT
+from convexus.sdk.entities.eventlogs import Swap, Mint, Burn, IntrinsicsUpdate, TickUpdate
+
+# the decoder of every supported eventlog, by name
+EVENTLOG_DECODERS = {
+  'Swap': Swap.fromEventLog,
+  'Mint': Mint.fromEventLog,
+  'Burn': Burn.fromEventLog,
+  'IntrinsicsUpdate': IntrinsicsUpdate.fromEventLog,
+  'TickUpdate': TickUpdate.fromEventLog,
+}
+
+class PoolReplica:
+  """
+  * A mutable replica of the state of a pool, kept up to date by applying the eventlogs of the pool in order.
+  * Each event only updates the state it touches, and immutable #Pool snapshots of the current state are handed out on demand.
+  * A snapshot is cached until the next event, and the tick data provider of the snapshots is only rebuilt when the ticks change.
+  *
+  * The pool contract emits the TickUpdate and IntrinsicsUpdate events carrying the new state of the ticks and of the intrinsics
+  * along with every Mint and Burn event, so by default the replica only follows these absolute updates and ignores the
+  * Mint and Burn events, which would count the same liquidity twice. In the liquidity deltas mode, for a feed of Swap, Mint
+  * and Burn events only, the Mint and Burn events are applied as liquidity deltas and the absolute updates are ignored instead.
+  """
+
+  def __init__(
+    self,
+    tokenA: Token,
+    tokenB: Token,
+    fee: FeeAmount,
+    sqrtRatioX96: BigintIsh,
+    liquidity: BigintIsh,
+    tickCurrent: int,
+    ticks: List[Tick | TickConstructorArgs] = [],
+    poolFactoryProvider: PoolFactoryProvider = NO_POOL_FACTORY_PROVIDER_DEFAULT,
+    address: str | None = None,
+    liquidityDeltas: bool = False
+  ) -> None:
+    """
+    * Construct a replica from a known state of the pool
+    * @param tokenA One of the tokens in the pool
+    * @param tokenB The other token in the pool
+    * @param fee The fee in hundredths of a bips of the input amount of every swap that is collected by the pool
+    * @param sqrtRatioX96 The sqrt of the current ratio of amounts of token1 to token0
+    * @param liquidity The current value of in range liquidity
+    * @param tickCurrent The current tick of the pool
+    * @param ticks The initialized ticks of the pool
+    * @param address The address of the pool contract. If set, the eventlogs of other contracts are ignored, e.g. the logs of the
+    *                other pools of a multi hop swap. If not, every eventlog given to the replica must be emitted by the pool
+    * @param liquidityDeltas Whether to apply the Mint and Burn events as liquidity deltas rather than the TickUpdate and
+    *                        IntrinsicsUpdate events
+    """
+    self.token0, self.token1 = [tokenA, tokenB] if tokenA.sortsBefore(tokenB) else [tokenB, tokenA]
+    self.fee = fee
+    self.sqrtRatioX96 = BigInt(sqrtRatioX96)
+    self.liquidity = BigInt(liquidity)
+    self.tickCurrent = tickCurrent
+    self.poolFactoryProvider = poolFactoryProvider
+    self.address = address
+    self.liquidityDeltas = liquidityDeltas
+    # index => tick mapping, and the sorted list of the initialized tick indexes
+    self.ticks: Dict[int, Tick] = {}
+    self.tickIndexes: List[int] = []
+    self.__pool: Pool | None = None
+    self.__tickDataProvider: TickBitmapDataProvider | None = None
+
+    for tick in ticks:
+      self.__setTick(tick if isinstance(tick, Tick) else Tick(tick))
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  @staticmethod
+  def fromPool(pool: Pool, address: str | None = None, liquidityDeltas: bool = False) -> 'PoolReplica':
+    """
+    * Construct a replica from a pool whose tick data provider holds its list of ticks
+    * @param pool The pool
+    * @param address The address of the pool contract, see #constructor
+    * @param liquidityDeltas Whether to apply the Mint and Burn events as liquidity deltas, see #constructor
+    """
+    ticks = getattr(pool.tickDataProvider, 'ticks', None)
+    assert ticks is not None, 'TICKS'
+    return PoolReplica(
+      pool.token0,
+      pool.token1,
+      pool.fee,
+      pool.sqrtRatioX96,
+      pool.liquidity,
+      pool.tickCurrent,
+      ticks,
+      pool.poolFactoryProvider,
+      address,
+      liquidityDeltas
+    )
+
+  @property
+  def tickSpacing(self) -> int:
+    return TICK_SPACINGS[self.fee]
+
+  @property
+  def pool(self) -> Pool:
+    """
+    * Returns an immutable snapshot of the current state of the pool
+    """
+    if not self.__pool:
+      if not self.__tickDataProvider:
+        self.__tickDataProvider = TickBitmapDataProvider([self.ticks[index] for index in self.tickIndexes], self.tickSpacing)
+
+      self.__pool = Pool (
+        self.token0,
+        self.token1,
+        self.fee,
+        self.sqrtRatioX96,
+        self.liquidity,
+        self.tickCurrent,
+        self.__tickDataProvider,
+        self.poolFactoryProvider
+      )
+
+    return self.__pool
+
+  def applyEventLog(self, eventlog: dict) -> bool:
+    """
+    * Decodes and applies an eventlog of the pool
+    * @param eventlog The eventlog, as returned in a transaction result
+    * @returns True if the eventlog changed the state of the replica, false if it isn't an eventlog the replica tracks
+    """
+    if self.address is not None and eventlog.get('scoreAddress') != self.address:
+      return False
+
+    name = eventlog['indexed'][0].split('(')[0]
+    decoder = EVENTLOG_DECODERS.get(name)
+    if not decoder:
+      return False
+
+    return self.apply(decoder(eventlog))
+
+  def applyEventLogs(self, eventlogs: List[dict]) -> None:
+    """
+    * Applies eventlogs of the pool, in order
+    * @param eventlogs The eventlogs
+    """
+    for eventlog in eventlogs:
+      self.applyEventLog(eventlog)
+
+  def apply(self, event: Swap | Mint | Burn | IntrinsicsUpdate | TickUpdate) -> bool:
+    """
+    * Applies a decoded event of the pool
+    * @param event The event
+    * @returns True if the event changed the state of the replica, false if the replica ignores it in its mode
+    """
+    if isinstance(event, Swap):
+      self.__setIntrinsics(event.sqrtPriceX96, event.tick, event.liquidity)
+    elif isinstance(event, (Mint, Burn, IntrinsicsUpdate, TickUpdate)):
+      if self.liquidityDeltas != isinstance(event, (Mint, Burn)):
+        return False
+
+      if isinstance(event, Mint):
+        self.__modifyPosition(event.tickLower, event.tickUpper, event.amount)
+      elif isinstance(event, Burn):
+        self.__modifyPosition(event.tickLower, event.tickUpper, event.amount * -1)
+      elif isinstance(event, IntrinsicsUpdate):
+        self.__setIntrinsics(event.sqrtPriceX96, event.tick, event.liquidity)
+      else:
+        self.__updateTick(event)
+    else:
+      raise Exception(f"Unsupported event type: {type(event)}")
+
+    return True
+
+  def __setIntrinsics(self, sqrtPriceX96: int, tick: int, liquidity: int) -> None:
+    self.sqrtRatioX96 = sqrtPriceX96
+    self.tickCurrent = tick
+    self.liquidity = liquidity
+    self.__pool = None
+
+  def __modifyPosition(self, tickLower: int, tickUpper: int, liquidityDelta: int) -> None:
+    # same as the pool contract: the ticks are updated, and so is the liquidity if the position is in range
+    self.__addLiquidity(tickLower, liquidityDelta, liquidityDelta)
+    self.__addLiquidity(tickUpper, liquidityDelta, liquidityDelta * -1)
+
+    if tickLower <= self.tickCurrent < tickUpper:
+      self.liquidity = self.liquidity + liquidityDelta
+
+    self.__pool = None
+
+  def __addLiquidity(self, index: int, liquidityGrossDelta: int, liquidityNetDelta: int) -> None:
+    # ticks are shared with the snapshots, so they are replaced rather than updated
+    previous = self.ticks.get(index)
+    liquidityGross = (previous.liquidityGross if previous else 0) + liquidityGrossDelta
+    liquidityNet = (previous.liquidityNet if previous else 0) + liquidityNetDelta
+    assert liquidityGross >= 0, 'LIQUIDITY_GROSS'
+
+    if liquidityGross == 0:
+      self.__removeTick(index)
+    else:
+      self.__setTick(Tick(TickConstructorArgs(
+        index,
+        liquidityGross,
+        liquidityNet,
+        previous.feeGrowthOutside if previous else None,
+        previous.secondsOutside if previous else None,
+        previous.secondsPerLiquidityOutsideX128 if previous else None,
+        previous.tickCumulativeOutside if previous else None,
+        True
+      )))
+
+  def __updateTick(self, update: TickUpdate) -> None:
+    if not update.initialized or update.liquidityGross == 0:
+      self.__removeTick(update.index)
+    else:
+      self.__setTick(Tick(TickConstructorArgs(
+        update.index,
+        update.liquidityGross,
+        update.liquidityNet,
+        FeeGrowthOutside(update.feeGrowthOutside0X128, update.feeGrowthOutside1X128),
+        update.secondsOutside,
+        update.secondsPerLiquidityOutsideX128,
+        update.tickCumulativeOutside,
+        True
+      )))
+    self.__pool = None
+
+  def __setTick(self, tick: Tick) -> None:
+    if tick.index not in self.ticks:
+      self.tickIndexes.insert(bisect_left(self.tickIndexes, tick.index), tick.index)
+    self.ticks[tick.index] = tick
+    self.__tickDataProvider = None
+
+  def __removeTick(self, index: int) -> None:
+    if index in self.ticks:
+      del self.ticks[index]
+      del self.tickIndexes[bisect_left(self.tickIndexes, index)]
+      self.__tickDataProvider = None
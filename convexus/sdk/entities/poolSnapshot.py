@@ -0,0 +1,237 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import List, Tuple
+from convexus.sdkcore.entities.currency import Token
+from convexus.sdk.constants import TICK_SPACINGS
+from convexus.sdk.entities.tick import Tick, TickConstructorArgs
+from convexus.sdk.entities.tickDataProvider import TickDataProvider
+
+class SnapshotTickDataProvider(TickDataProvider):
+  """
+  * A data provider for ticks that reads them from the binary buffer of a pool snapshot.
+  * The tick indexes are searched in place, and a tick is only decoded the first time it is requested.
+  """
+
+  def __init__(self, indexes, records, tickSpacing: int) -> None:
+    """
+    * @param indexes The sorted tick indexes, as a sequence of integers
+    * @param records The liquidity of every tick, RECORD_SIZE bytes per tick in the same order as the indexes
+    * @param tickSpacing The tick spacing of the pool
+    """
+    super().__init__()
+    assert len(records) == len(indexes) * PoolSnapshot.RECORD_SIZE, 'SNAPSHOT_SIZE'
+    self.indexes = indexes
+    self.records = records
+    self.tickSpacing = tickSpacing
+    self.__decoded = {}
+    self.__ticks: List[Tick] | None = None
+
+  def __repr__(self) -> str:
+    return f"SnapshotTickDataProvider(tickSpacing={self.tickSpacing}, count={len(self.indexes)})"
+
+  def __len__(self) -> int:
+    return len(self.indexes)
+
+  def __decode(self, position: int) -> Tick:
+    tick = self.__decoded.get(position)
+    if not tick:
+      start = position * PoolSnapshot.RECORD_SIZE
+      liquidityNet = int.from_bytes(self.records[start:start + 16], 'little', signed=True)
+      liquidityGross = int.from_bytes(self.records[start + 16:start + 32], 'little')
+      tick = Tick(TickConstructorArgs(self.indexes[position], liquidityGross, liquidityNet))
+      self.__decoded[position] = tick
+    return tick
+
+  @property
+  def ticks(self) -> List[Tick]:
+    """
+    * Returns every tick of the snapshot, decoding all of them
+    """
+    if self.__ticks is None:
+      self.__ticks = [self.__decode(position) for position in range(len(self.indexes))]
+    return self.__ticks
+
+  def getTick(self, tick: int) -> Tick:
+    position = bisect_right(self.indexes, tick) - 1
+    assert position >= 0 and self.indexes[position] == tick, 'NOT_CONTAINED'
+    return self.__decode(position)
+
+  def nextInitializedTickWithinOneWord(self, tick: int, lte: bool, tickSpacing: int) -> Tuple[int, bool]:
+    compressed = tick // tickSpacing # floors, matches rounding in the code
+
+    if (lte):
+      minimum = ((compressed >> 8) << 8) * tickSpacing
+      position = bisect_right(self.indexes, tick) - 1
+
+      if position < 0:
+        return (minimum, False)
+
+      index = self.indexes[position]
+      nextInitializedTick = max(minimum, index)
+      return (nextInitializedTick, nextInitializedTick == index)
+    else:
+      maximum = (((((compressed + 1) >> 8) + 1) << 8) - 1) * tickSpacing
+      position = bisect_right(self.indexes, tick)
+
+      if position == len(self.indexes):
+        return (maximum, False)
+
+      index = self.indexes[position]
+      nextInitializedTick = min(maximum, index)
+      return (nextInitializedTick, nextInitializedTick == index)
+
+class PoolSnapshot:
+  """
+  * A versioned binary snapshot of the state of a pool and of its ticks.
+  *
+  * The snapshot is a fixed header, the two tokens, the int32 indexes of the ticks and one fixed width record per tick
+  * holding its liquidityNet and liquidityGross, all little-endian. The indexes and the records are read in place from
+  * the buffer, so loading a snapshot doesn't depend on the number of ticks. Only the liquidity of the ticks is stored.
+  """
+
+  MAGIC = b'CVXPOOL\x00'
+  VERSION = 1
+  # magic, version, fee, current tick, ticks count, sqrtPriceX96 (uint160), liquidity (uint128)
+  HEADER = struct.Struct('<8sIIiI20s16s')
+  # liquidityNet (int128), liquidityGross (uint128)
+  RECORD_SIZE = 32
+  INDEX_SIZE = 4
+  # marks a missing token symbol or name
+  NO_STRING = 0xffff
+
+  def __init__(
+    self,
+    token0: Token,
+    token1: Token,
+    fee: int,
+    sqrtRatioX96: int,
+    liquidity: int,
+    tickCurrent: int,
+    tickDataProvider: SnapshotTickDataProvider
+  ) -> None:
+    self.token0 = token0
+    self.token1 = token1
+    self.fee = fee
+    self.sqrtRatioX96 = sqrtRatioX96
+    self.liquidity = liquidity
+    self.tickCurrent = tickCurrent
+    self.tickDataProvider = tickDataProvider
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  @staticmethod
+  def __align(buffer: bytearray) -> None:
+    buffer += bytes(-len(buffer) % 8)
+
+  @staticmethod
+  def __encodeString(buffer: bytearray, value: str | None) -> None:
+    if value is None:
+      buffer += struct.pack('<H', PoolSnapshot.NO_STRING)
+    else:
+      encoded = value.encode('utf-8')
+      assert len(encoded) < PoolSnapshot.NO_STRING, 'SNAPSHOT_STRING'
+      buffer += struct.pack('<H', len(encoded)) + encoded
+
+  @staticmethod
+  def __decodeString(buffer, offset: int) -> Tuple[str | None, int]:
+    (size,) = struct.unpack_from('<H', buffer, offset)
+    offset += 2
+    if size == PoolSnapshot.NO_STRING:
+      return (None, offset)
+    return (bytes(buffer[offset:offset + size]).decode('utf-8'), offset + size)
+
+  @staticmethod
+  def encode(pool) -> bytes:
+    """
+    * Serializes the state of a pool whose tick data provider holds its list of ticks
+    * @param pool The pool
+    """
+    provider = pool.tickDataProvider
+    if isinstance(provider, SnapshotTickDataProvider):
+      # copy the ticks without decoding them
+      count = len(provider.indexes)
+      indexes = struct.pack(f'<{count}i', *provider.indexes)
+      records = bytes(provider.records)
+    else:
+      ticks = getattr(provider, 'ticks', None)
+      assert ticks is not None, 'TICKS'
+      count = len(ticks)
+      indexes = struct.pack(f'<{count}i', *[tick.index for tick in ticks])
+      records = b''.join(
+        tick.liquidityNet.to_bytes(16, 'little', signed=True) + tick.liquidityGross.to_bytes(16, 'little')
+        for tick in ticks
+      )
+
+    buffer = bytearray(PoolSnapshot.HEADER.pack(
+      PoolSnapshot.MAGIC,
+      PoolSnapshot.VERSION,
+      pool.fee,
+      pool.tickCurrent,
+      count,
+      pool.sqrtRatioX96.to_bytes(20, 'little'),
+      pool.liquidity.to_bytes(16, 'little')
+    ))
+
+    for token in [pool.token0, pool.token1]:
+      PoolSnapshot.__encodeString(buffer, token.address)
+      buffer += struct.pack('<B', token.decimals)
+      PoolSnapshot.__encodeString(buffer, token.symbol)
+      PoolSnapshot.__encodeString(buffer, token.name)
+
+    PoolSnapshot.__align(buffer)
+    buffer += indexes
+    PoolSnapshot.__align(buffer)
+    buffer += records
+    return bytes(buffer)
+
+  @staticmethod
+  def decode(buffer, tickSpacing: int | None = None) -> 'PoolSnapshot':
+    """
+    * Reads a snapshot without copying nor decoding its ticks
+    * @param buffer A bytes-like object written by #encode, such as a memory map of a file
+    * @param tickSpacing The tick spacing of the pool, deduced from the fee by default
+    """
+    view = memoryview(buffer)
+    magic, version, fee, tickCurrent, count, sqrtRatioX96, liquidity = PoolSnapshot.HEADER.unpack_from(view, 0)
+    assert magic == PoolSnapshot.MAGIC, 'SNAPSHOT_MAGIC'
+    assert version == PoolSnapshot.VERSION, 'SNAPSHOT_VERSION'
+
+    offset = PoolSnapshot.HEADER.size
+    tokens = []
+    for _ in range(2):
+      address, offset = PoolSnapshot.__decodeString(view, offset)
+      (decimals,) = struct.unpack_from('<B', view, offset)
+      symbol, offset = PoolSnapshot.__decodeString(view, offset + 1)
+      name, offset = PoolSnapshot.__decodeString(view, offset)
+      tokens.append(Token(address, decimals, symbol, name))
+
+    offset += -offset % 8
+    indexesEnd = offset + count * PoolSnapshot.INDEX_SIZE
+    recordsStart = indexesEnd + (-indexesEnd % 8)
+    recordsEnd = recordsStart + count * PoolSnapshot.RECORD_SIZE
+    assert len(view) >= recordsEnd, 'SNAPSHOT_SIZE'
+
+    if sys.byteorder == 'little':
+      indexes = view[offset:indexesEnd].cast('i')
+    else:
+      indexes = array('i', bytes(view[offset:indexesEnd]))
+      indexes.byteswap()
+
+    tickDataProvider = SnapshotTickDataProvider(
+      indexes,
+      view[recordsStart:recordsEnd],
+      tickSpacing if tickSpacing else TICK_SPACINGS[fee]
+    )
+
+    return PoolSnapshot(
+      tokens[0],
+      tokens[1],
+      fee,
+      int.from_bytes(sqrtRatioX96, 'little'),
+      int.from_bytes(liquidity, 'little'),
+      tickCurrent,
+      tickDataProvider
+    )
@@ -0,0 +1,124 @@
+from typing import Dict, Hashable, List, Set
+
+from convexus.sdkcore.constants import TradeType
+from convexus.sdkcore.entities.errors import InsufficientInputAmountError
+from convexus.sdk.entities.factoryProvider import PoolFactoryProvider
+from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.route import Route
+from convexus.sdk.entities.swapCache import SwapCache
+from convexus.sdk.entities.trade import RouteAmount, Trade
+
+class QuoteCache:
+  """
+  * Stores trades along with the addresses of the pools they go through, so that when some pools change,
+  * only the trades depending on them are quoted again, through the same routes and for the same amounts.
+  * The routes aren't searched again: a route that is no longer the best one stays cached until replaced.
+  """
+
+  def __init__(self, poolFactoryProvider: PoolFactoryProvider) -> None:
+    """
+    * @param poolFactoryProvider The pool factory provider, used to identify the pools by their address
+    """
+    self.poolFactoryProvider = poolFactoryProvider
+    self.trades: Dict[Hashable, Trade] = {}
+    # pool address => keys of the trades going through the pool
+    self.dependents: Dict[str, Set[Hashable]] = {}
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def __len__(self) -> int:
+    return len(self.trades)
+
+  def __contains__(self, key: Hashable) -> bool:
+    return key in self.trades
+
+  def __addressOf(self, pool: Pool) -> str:
+    return Pool.getAddress(self.poolFactoryProvider, pool.token0, pool.token1, pool.fee)
+
+  def __addressesOf(self, trade: Trade) -> Set[str]:
+    return set(self.__addressOf(pool) for swap in trade.swaps for pool in swap.route.pools)
+
+  def get(self, key: Hashable) -> Trade | None:
+    """
+    * Returns the trade stored with the given key, if any
+    * @param key The key of the trade
+    """
+    return self.trades.get(key)
+
+  def set(self, key: Hashable, trade: Trade) -> None:
+    """
+    * Stores a trade, replacing the trade previously stored with the same key
+    * @param key The key of the trade, e.g. the pair and the amount it quotes
+    * @param trade The trade
+    """
+    self.remove(key)
+    self.trades[key] = trade
+    for address in self.__addressesOf(trade):
+      self.dependents.setdefault(address, set()).add(key)
+
+  def remove(self, key: Hashable) -> Trade | None:
+    """
+    * Removes a trade
+    * @param key The key of the trade
+    * @returns The removed trade, if any
+    """
+    trade = self.trades.pop(key, None)
+    if trade is not None:
+      for address in self.__addressesOf(trade):
+        keys = self.dependents[address]
+        keys.discard(key)
+        if len(keys) == 0:
+          del self.dependents[address]
+    return trade
+
+  def dependentsOf(self, pools: List[Pool]) -> Set[Hashable]:
+    """
+    * Returns the keys of the trades going through any of the given pools
+    * @param pools The pools
+    """
+    keys = set()
+    for pool in pools:
+      keys |= self.dependents.get(self.__addressOf(pool), set())
+    return keys
+
+  def update(self, pools: List[Pool]) -> List[Hashable]:
+    """
+    * Quotes again the trades going through the given pools, using their new state.
+    * The trades that can't be quoted anymore are removed.
+    * @param pools The pools that changed, in their new state
+    * @returns The keys of the trades quoted again
+    """
+    updated = dict((self.__addressOf(pool), pool) for pool in pools)
+    keys = set()
+    for address in updated:
+      keys |= self.dependents.get(address, set())
+
+    # the trades of the same pairs and amounts share their simulations
+    cache = SwapCache()
+    requoted = []
+    for key in [key for key in self.trades if key in keys]:
+      trade = self.trades[key]
+      routes = [
+        RouteAmount(
+          Route(
+            [updated.get(self.__addressOf(pool), pool) for pool in swap.route.pools],
+            swap.route.input,
+            swap.route.output
+          ),
+          swap.inputAmount if trade.tradeType == TradeType.EXACT_INPUT else swap.outputAmount
+        )
+        for swap in trade.swaps
+      ]
+
+      try:
+        self.trades[key] = Trade.fromRoutes(self.poolFactoryProvider, routes, trade.tradeType, cache)
+      except InsufficientInputAmountError as error:
+        if (error.isInsufficientInputAmountError):
+          self.remove(key)
+          continue
+        raise error
+
+      requoted.append(key)
+
+    return requoted
@@ -2,9 +2,12 @@ from dataclasses import dataclass
 from typing import Any, Dict, List
 from convexus.icontoolkit.BigInt import BigInt
 from convexus.icontoolkit.constants import BigintIsh
+from convexus.sdkcore.utils.slots import slotsToDict
 
 @dataclass
 class NextInitializedTickWithinOneWordResult:
+  __slots__ = ('tickNext', 'initialized')
+
   tickNext: int
   initialized: bool
 
@@ -16,7 +19,7 @@ class NextInitializedTickWithinOneWordResult:
     )
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
   def __iter__(self):
     yield self.tickNext
@@ -24,6 +27,8 @@ class NextInitializedTickWithinOneWordResult:
 
 
 class QuoteResult:
+  __slots__ = ('amountOut', 'sqrtPriceX96After', 'initializedTicksCrossed')
+
   amountOut: int
   sqrtPriceX96After: int
   initializedTicksCrossed: int
@@ -42,7 +47,7 @@ class QuoteResult:
     )
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
   def __iter__(self):
     yield self.amountOut
@@ -51,6 +56,8 @@ class QuoteResult:
   
 
 class QuoteMultiResult:
+  __slots__ = ('amountOut', 'sqrtPriceX96AfterList', 'initializedTicksCrossedList')
+
   amountOut: int
   sqrtPriceX96AfterList: List[int]
   initializedTicksCrossedList: List[int]
@@ -74,7 +81,7 @@ class QuoteMultiResult:
     )
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
   def __iter__(self):
     yield self.amountOut
@@ -4,6 +4,7 @@ from typing import List, cast
 from convexus.sdk.entities.pool import Pool
 from convexus.sdkcore.entities.currency import Currency, Token
 from convexus.sdkcore.entities.fractions.price import Price
+from convexus.sdkcore.utils.slots import slotsToDict
 
 from functools import reduce
 
@@ -14,6 +15,8 @@ class Route:
   * @template Currency The output token
   """
 
+  __slots__ = ('__midPrice', 'pools', 'tokenPath', 'input', 'output')
+
   def __init__(self, pools: List[Pool], input: Currency, output: Currency):
     """
     * Creates an instance of route.
@@ -48,7 +51,7 @@ class Route:
     self.output = output if output else tokenPath[len(tokenPath) - 1]
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
   """
    * Returns the mid price of the route
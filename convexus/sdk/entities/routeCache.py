@@ -0,0 +1,136 @@
+from typing import Dict, List, Tuple
+
+from convexus.sdkcore.constants import TradeType
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+from convexus.sdkcore.entities.currency import Currency
+from convexus.sdk.entities.factoryProvider import PoolFactoryProvider
+from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.route import Route
+from convexus.sdk.entities.routingGraph import RoutingGraph
+from convexus.sdk.entities.trade import BestTradeOptions, Trade
+
+class RouteCache:
+  """
+  * Enumerates the routes between two currencies once, and reuses them to find the best trades of any amount.
+  *
+  * The routes are stored as the positions of their pools, so they survive updates of the state of the pools, and are
+  * only enumerated again when the pool universe changes, i.e. when pools are added, removed or reordered.
+  * The routes are enumerated in the order of the search of Trade#bestTradeExactIn and Trade#bestTradeExactOut,
+  * so the best trades are the same as theirs, ties included.
+  """
+
+  def __init__(self, pools: List[Pool]) -> None:
+    """
+    * @param pools The pools to route through
+    """
+    self.graph = RoutingGraph(pools)
+    # (trade type, currency in, currency out, max hops) => positions of the pools of every route
+    self.paths: Dict[Tuple, List[List[int]]] = {}
+    # same keys => routes through the current state of the pools
+    self.routes: Dict[Tuple, List[Route]] = {}
+    self.hits = 0
+    self.misses = 0
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def __len__(self) -> int:
+    return len(self.paths)
+
+  @property
+  def pools(self) -> List[Pool]:
+    return self.graph.pools
+
+  @staticmethod
+  def __topology(pools: List[Pool]) -> List[Tuple[str, str, int]]:
+    return [(pool.token0.address, pool.token1.address, pool.fee) for pool in pools]
+
+  @staticmethod
+  def __currencyKey(currency: Currency) -> Tuple[bool, str]:
+    return (currency.isNative, currency.wrapped.address)
+
+  def updatePools(self, pools: List[Pool]) -> bool:
+    """
+    * Replaces the pools to route through, typically with the same pools in a new state
+    * @param pools The new pools
+    * @returns True if the pool universe changed, in which case the routes are enumerated again
+    """
+    changed = RouteCache.__topology(pools) != RouteCache.__topology(self.graph.pools)
+    self.graph = RoutingGraph(pools)
+    self.routes.clear()
+    if changed:
+      self.paths.clear()
+    return changed
+
+  def getRoutes(
+    self,
+    currencyIn: Currency,
+    currencyOut: Currency,
+    maxHops: int,
+    tradeType: TradeType = TradeType.EXACT_INPUT
+  ) -> List[Route]:
+    """
+    * Returns every route from a currency to another with at most `maxHops` hops, in the order of the search
+    * @param currencyIn the currency in
+    * @param currencyOut the currency out
+    * @param maxHops maximum number of hops of a route
+    * @param tradeType the search the order of the routes follows, exact input or exact output
+    """
+    assert maxHops > 0, 'MAX_HOPS'
+
+    key = (tradeType, RouteCache.__currencyKey(currencyIn), RouteCache.__currencyKey(currencyOut), maxHops)
+    routes = self.routes.get(key)
+    if routes is not None:
+      self.hits += 1
+      return routes
+
+    paths = self.paths.get(key)
+    if paths is None:
+      self.misses += 1
+      if (tradeType == TradeType.EXACT_INPUT):
+        paths = self.graph.pathsExactIn(currencyIn.wrapped, currencyOut.wrapped, maxHops)
+      else:
+        paths = self.graph.pathsExactOut(currencyIn.wrapped, currencyOut.wrapped, maxHops)
+      self.paths[key] = paths
+    else:
+      self.hits += 1
+
+    routes = [Route([self.graph.pools[position] for position in path], currencyIn, currencyOut) for path in paths]
+    self.routes[key] = routes
+    return routes
+
+  def bestTradeExactIn(
+    self,
+    poolFactoryProvider: PoolFactoryProvider,
+    currencyAmountIn: CurrencyAmount,
+    currencyOut: Currency,
+    options: BestTradeOptions = BestTradeOptions(3, 3)
+  ) -> List[Trade]:
+    """
+    * Same as Trade#bestTradeExactIn over the pools of the cache, only evaluating the cached routes
+    * @param currencyAmountIn exact amount of input currency to spend
+    * @param currencyOut the desired currency out
+    * @param options the maximum number of results and the maximum number of hops
+    * @returns The exact in trades
+    """
+    assert len(self.graph) > 0, 'POOLS'
+    routes = self.getRoutes(currencyAmountIn.currency, currencyOut, options.maxHops, TradeType.EXACT_INPUT)
+    return Trade.bestTradesOfRoutes(poolFactoryProvider, routes, currencyAmountIn, TradeType.EXACT_INPUT, options.maxNumResults)
+
+  def bestTradeExactOut(
+    self,
+    poolFactoryProvider: PoolFactoryProvider,
+    currencyIn: Currency,
+    currencyAmountOut: CurrencyAmount,
+    options: BestTradeOptions = BestTradeOptions(3, 3)
+  ) -> List[Trade]:
+    """
+    * Same as Trade#bestTradeExactOut over the pools of the cache, only evaluating the cached routes
+    * @param currencyIn the currency to spend
+    * @param currencyAmountOut the desired currency amount out
+    * @param options the maximum number of results and the maximum number of hops
+    * @returns The exact out trades
+    """
+    assert len(self.graph) > 0, 'POOLS'
+    routes = self.getRoutes(currencyIn, currencyAmountOut.currency, options.maxHops, TradeType.EXACT_OUTPUT)
+    return Trade.bestTradesOfRoutes(poolFactoryProvider, routes, currencyAmountOut, TradeType.EXACT_OUTPUT, options.maxNumResults)
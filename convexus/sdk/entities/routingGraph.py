@@ -0,0 +1,144 @@
+from typing import Dict, List, Set
+from convexus.sdkcore.entities.currency import Token
+from convexus.sdkcore.entities.fractions.fraction import Fraction
+from convexus.sdk.entities.pool import Pool
+
+class RoutingGraph:
+  """
+  * An adjacency index of a list of pools, mapping every token to the pools that involve it.
+  * Built once per pool universe, it lets the route search only visit the pools of the current token.
+  * Pools are identified by their position in the list, and listed per token in the order of the list.
+  """
+
+  def __init__(self, pools: List[Pool]) -> None:
+    """
+    * @param pools The pools to route through
+    """
+    self.pools = list(pools)
+    # token address => positions of the pools involving the token
+    self.adjacency: Dict[str, List[int]] = {}
+
+    for position, pool in enumerate(self.pools):
+      self.adjacency.setdefault(pool.token0.address, []).append(position)
+      self.adjacency.setdefault(pool.token1.address, []).append(position)
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def __len__(self) -> int:
+    return len(self.pools)
+
+  def poolsOf(self, token: Token) -> List[int]:
+    """
+    * Returns the positions of the pools involving a token
+    * @param token The token
+    """
+    return self.adjacency.get(token.address, [])
+
+  def positionsOf(self, pools: List[Pool]) -> Set[int]:
+    """
+    * Returns the positions of the given pools in the graph, ignoring the pools that aren't part of it
+    * @param pools The pools
+    """
+    if len(pools) == 0:
+      return set()
+
+    ids = set(id(pool) for pool in pools)
+    return set(position for position, pool in enumerate(self.pools) if id(pool) in ids)
+
+  def midPriceBounds(self, tokenOut: Token, maxHops: int) -> List[Dict[str, Fraction]]:
+    """
+    * Returns the best rates at which the tokens can be swapped to a token at the mid prices of the pools.
+    * A swap never gets a better rate than the mid price of its pool, so the amount of a token times its rate bounds
+    * the amount out of any route from that token, which lets the route search prune the routes that can't compete.
+    * @param tokenOut The token swapped to
+    * @param maxHops The maximum number of hops of the routes
+    * @returns For every number of hops up to maxHops, the raw rate of the tokens that can reach tokenOut within
+    * that many hops, by address. Routes stop at tokenOut, so they never go through it.
+    """
+    bounds = [{tokenOut.address: Fraction(1)}]
+
+    for _ in range(maxHops):
+      previous = bounds[-1]
+      current = dict(previous)
+
+      for pool in self.pools:
+        for tokenIn, tokenNext in [(pool.token0, pool.token1), (pool.token1, pool.token0)]:
+          rate = previous.get(tokenNext.address)
+          if rate is None or tokenIn.address == tokenOut.address:
+            continue
+
+          rate = pool.priceOf(tokenIn).asFraction.multiply(rate)
+          best = current.get(tokenIn.address)
+          if best is None or rate.greaterThan(best):
+            current[tokenIn.address] = rate
+
+      bounds.append(current)
+
+    return bounds
+
+  def pathsExactIn(self, tokenIn: Token, tokenOut: Token, maxHops: int) -> List[List[int]]:
+    """
+    * Returns the positions of the pools of every route from a token to another with at most `maxHops` hops,
+    * in the order Trade#bestTradeExactIn visits them
+    * @param tokenIn The token in
+    * @param tokenOut The token out
+    * @param maxHops The maximum number of hops of the routes
+    """
+    paths = []
+    self.__pathsExactIn(tokenIn, tokenOut, maxHops, set(), [], paths)
+    return paths
+
+  def pathsExactOut(self, tokenIn: Token, tokenOut: Token, maxHops: int) -> List[List[int]]:
+    """
+    * Same as #pathsExactIn, in the order Trade#bestTradeExactOut visits the routes, from the token out
+    """
+    paths = []
+    self.__pathsExactOut(tokenIn, tokenOut, maxHops, set(), [], paths)
+    return paths
+
+  def __pathsExactIn(
+    self,
+    token: Token,
+    tokenOut: Token,
+    maxHops: int,
+    visited: Set[int],
+    path: List[int],
+    paths: List[List[int]]
+  ) -> None:
+    for position in self.poolsOf(token):
+      if position in visited:
+        continue
+
+      pool = self.pools[position]
+      tokenNext = pool.token1 if token.equals(pool.token0) else pool.token0
+
+      if (tokenNext.equals(tokenOut)):
+        paths.append(path + [position])
+      elif (maxHops > 1 and len(self.pools) - len(visited) > 1):
+        visited.add(position)
+        self.__pathsExactIn(tokenNext, tokenOut, maxHops - 1, visited, path + [position], paths)
+        visited.remove(position)
+
+  def __pathsExactOut(
+    self,
+    tokenIn: Token,
+    token: Token,
+    maxHops: int,
+    visited: Set[int],
+    path: List[int],
+    paths: List[List[int]]
+  ) -> None:
+    for position in self.poolsOf(token):
+      if position in visited:
+        continue
+
+      pool = self.pools[position]
+      tokenNext = pool.token1 if token.equals(pool.token0) else pool.token0
+
+      if (tokenNext.equals(tokenIn)):
+        paths.append([position] + path)
+      elif (maxHops > 1 and len(self.pools) - len(visited) > 1):
+        visited.add(position)
+        self.__pathsExactOut(tokenIn, tokenNext, maxHops - 1, visited, [position] + path, paths)
+        visited.remove(position)
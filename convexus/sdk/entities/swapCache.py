@@ -0,0 +1,73 @@
+from typing import Dict, Tuple
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+from convexus.sdk.entities.pool import Pool
+
+class SwapCache:
+  """
+  * Memoizes the simulations of swaps through pools, keyed by the pool, the direction of the swap and the raw amount.
+  * Meant to be scoped to a single route search, during which the pools don't change, so the hops shared by several
+  * routes and the hops re-simulated when building the resulting trades are only swapped once.
+  """
+
+  def __init__(self) -> None:
+    # (pool id, exact input, token address, raw amount) => (pool, (amount, pool with updated state))
+    self.entries: Dict[Tuple[int, bool, str, int], Tuple[Pool, Tuple[CurrencyAmount, Pool]]] = {}
+    self.hits = 0
+    self.misses = 0
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def __len__(self) -> int:
+    return len(self.entries)
+
+  def clear(self) -> None:
+    """
+    * Forgets every simulation and resets the counters
+    """
+    self.entries.clear()
+    self.hits = 0
+    self.misses = 0
+
+  def __lookup(self, pool: Pool, exactInput: bool, amount: CurrencyAmount):
+    # native currencies aren't keyed, the pool rejects them anyway
+    if not amount.currency.isToken:
+      return (None, None)
+
+    key = (id(pool), exactInput, amount.currency.address, amount.quotient)
+    entry = self.entries.get(key)
+    # the pool is kept in the entry so an id reused by another pool never matches
+    if entry and entry[0] is pool:
+      self.hits += 1
+      return (key, entry[1])
+
+    self.misses += 1
+    return (key, None)
+
+  def getOutputAmount(self, pool: Pool, inputAmount: CurrencyAmount) -> Tuple[CurrencyAmount, Pool]:
+    """
+    * Same as Pool#getOutputAmount, simulating the swap only once per pool and input amount
+    * @param pool The pool to swap through
+    * @param inputAmount The input amount for which to quote the output amount
+    * @returns The output amount and the pool with updated state
+    """
+    key, result = self.__lookup(pool, True, inputAmount)
+    if result is None:
+      result = pool.getOutputAmount(inputAmount)
+      if key is not None:
+        self.entries[key] = (pool, result)
+    return result
+
+  def getInputAmount(self, pool: Pool, outputAmount: CurrencyAmount) -> Tuple[CurrencyAmount, Pool]:
+    """
+    * Same as Pool#getInputAmount, simulating the swap only once per pool and output amount
+    * @param pool The pool to swap through
+    * @param outputAmount The output amount for which to quote the input amount
+    * @returns The input amount and the pool with updated state
+    """
+    key, result = self.__lookup(pool, False, outputAmount)
+    if result is None:
+      result = pool.getInputAmount(outputAmount)
+      if key is not None:
+        self.entries[key] = (pool, result)
+    return result
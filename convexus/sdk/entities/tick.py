@@ -2,15 +2,18 @@ from dataclasses import dataclass
 from typing import Dict
 from convexus.icontoolkit.BigInt import BigInt
 from convexus.icontoolkit.constants import BigintIsh
+from convexus.sdkcore.utils.slots import slotsToDict
 from convexus.sdk.utils.tickMath import TickMath
 
 class FeeGrowthOutside:
+  __slots__ = ('feeGrowthOutside0X128', 'feeGrowthOutside1X128')
+
   def __init__(self, feeGrowthOutside0X128: BigintIsh, feeGrowthOutside1X128: BigintIsh) -> None:
     self.feeGrowthOutside0X128 = BigInt(feeGrowthOutside0X128)
     self.feeGrowthOutside1X128 = BigInt(feeGrowthOutside1X128)
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
 @dataclass
 class TickConstructorArgs:
@@ -24,6 +27,17 @@ class TickConstructorArgs:
   initialized: bool | None = None
 
 class Tick:
+  __slots__ = (
+    'index',
+    'liquidityGross',
+    'liquidityNet',
+    'feeGrowthOutside',
+    'secondsOutside',
+    'secondsPerLiquidityOutsideX128',
+    'tickCumulativeOutside',
+    'initialized'
+  )
+
   def __init__(self, args: TickConstructorArgs) -> None:
     index = args.index
     assert index >= TickMath.MIN_TICK and index <= TickMath.MAX_TICK, 'TICK'
@@ -54,4 +68,4 @@ class Tick:
     ))
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
\ No newline at end of file
+    return str(slotsToDict(self))
\ No newline at end of file
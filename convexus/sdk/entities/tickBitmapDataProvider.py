@@ -0,0 +1,71 @@
+from typing import Dict, List, Tuple
+from convexus.sdk.utils.tickList import TickList
+from convexus.sdk.entities.tick import Tick, TickConstructorArgs
+from convexus.sdk.entities.tickDataProvider import TickDataProvider
+
+class TickBitmapDataProvider(TickDataProvider):
+  """
+  * A data provider for ticks that is backed by an in-memory tick bitmap.
+  * Initialized ticks are stored as 256-bit words keyed by word position, exactly like the
+  * `tickBitmap` mapping of the pool contract, so the next initialized tick within one word
+  * is found with constant-time bit arithmetic instead of a binary search over the tick list.
+  """
+
+  def __init__(self, ticks: List[Tick | TickConstructorArgs], tickSpacing: int) -> None:
+    super().__init__()
+    ticksMapped: List[Tick] = list(map(lambda t: (t if isinstance(t, Tick) else Tick(t)), ticks))
+    TickList.validateList(ticksMapped, tickSpacing)
+    self.ticks = ticksMapped
+    self.tickSpacing = tickSpacing
+    self.ticksByIndex: Dict[int, Tick] = {}
+    self.bitmap: Dict[int, int] = {}
+
+    for tick in ticksMapped:
+      self.ticksByIndex[tick.index] = tick
+      wordPos, bitPos = TickBitmapDataProvider.position(tick.index // tickSpacing)
+      self.bitmap[wordPos] = self.bitmap.get(wordPos, 0) | (1 << bitPos)
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  @staticmethod
+  def position(compressed: int) -> Tuple[int, int]:
+    """
+    * Computes the position in the bitmap where the initialized bit for a compressed tick lives
+    * @param compressed The tick divided by the tick spacing
+    * @returns The word position and the bit position in that word
+    """
+    return (compressed >> 8, compressed & 0xff)
+
+  def getTick(self, tick: int) -> Tick:
+    result = self.ticksByIndex.get(tick)
+    assert result is not None, 'NOT_CONTAINED'
+    return result
+
+  def nextInitializedTickWithinOneWord(self, tick: int, lte: bool, tickSpacing: int) -> Tuple[int, bool]:
+    assert tickSpacing == self.tickSpacing, 'TICK_SPACING'
+    compressed = tick // tickSpacing # floors, matches rounding in the code
+
+    if (lte):
+      wordPos, bitPos = TickBitmapDataProvider.position(compressed)
+      # all the 1s at or to the right of the current bitPos
+      masked = self.bitmap.get(wordPos, 0) & ((2 << bitPos) - 1)
+
+      # if there are no initialized ticks to the right of or at the current tick, return rightmost in the word
+      if masked == 0:
+        return ((compressed - bitPos) * tickSpacing, False)
+
+      mostSignificantBit = masked.bit_length() - 1
+      return ((compressed - (bitPos - mostSignificantBit)) * tickSpacing, True)
+    else:
+      # start from the word of the next tick, since the current tick state doesn't matter
+      wordPos, bitPos = TickBitmapDataProvider.position(compressed + 1)
+      # all the 1s at or to the left of the bitPos
+      masked = (self.bitmap.get(wordPos, 0) >> bitPos) << bitPos
+
+      # if there are no initialized ticks to the left of the current tick, return leftmost in the word
+      if masked == 0:
+        return ((compressed + 1 + (0xff - bitPos)) * tickSpacing, False)
+
+      leastSignificantBit = (masked & -masked).bit_length() - 1
+      return ((compressed + 1 + (leastSignificantBit - bitPos)) * tickSpacing, True)
@@ -1,5 +1,5 @@
 from functools import reduce
-from typing import List, cast
+from typing import Dict, List, Set, Tuple, cast
 from dataclasses import dataclass
 
 from convexus.sdkcore.constants import TradeType
@@ -14,6 +14,8 @@ from convexus.sdk.entities.factoryProvider import PoolFactoryProvider
 
 from convexus.sdk.entities.route import Route
 from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.routingGraph import RoutingGraph
+from convexus.sdk.entities.swapCache import SwapCache
 
 def tradeComparator (
   a: 'Trade',
@@ -57,6 +59,23 @@ class BestTradeOptions:
   maxNumResults: int = 3
   # the maximum number of hops a trade should contain
   maxHops: int = 3
+  # whether to skip the exact input routes whose output at mid prices can't beat the trades found so far
+  prune: bool = False
+
+@dataclass
+class BestTradeRequest:
+  # the exact amount, in the input currency for an exact input trade, in the output currency otherwise
+  amount: CurrencyAmount
+  # the other currency, the output currency for an exact input trade, the input currency otherwise
+  currency: Currency
+  tradeType: TradeType = TradeType.EXACT_INPUT
+
+@dataclass
+class BestSplitTradeOptions:
+  # the granularity of the split, in percent of the amount; must divide 100
+  distributionPercent: int = 5
+  # the maximum number of routes the amount is split across
+  maxSplits: int = 3
 
 @dataclass
 class RouteInfo:
@@ -265,7 +284,8 @@ class Trade:
     poolFactoryProvider: PoolFactoryProvider,
     route: Route,
     amount: CurrencyAmount,
-    tradeType: TradeType
+    tradeType: TradeType,
+    cache: SwapCache = None
   ) -> 'Trade':
     """
     * Constructs a trade by simulating swaps through the given route
@@ -275,6 +295,7 @@ class Trade:
     * @param route route to swap through
     * @param amount the amount specified, either input or output, depending on tradeType
     * @param tradeType whether the trade is an exact input or exact output swap
+    * @param cache optional cache of the swaps already simulated through the pools of the route
     * @returns The route
     """
     amounts: List[CurrencyAmount] = [None] * len(route.tokenPath)
@@ -286,7 +307,7 @@ class Trade:
       amounts[0] = amount.wrapped
       for i in range(len(route.tokenPath) - 1):
         pool = route.pools[i]
-        outputAmount, _ = pool.getOutputAmount(amounts[i])
+        outputAmount, _ = cache.getOutputAmount(pool, amounts[i]) if cache is not None else pool.getOutputAmount(amounts[i])
         amounts[i + 1] = outputAmount
 
       inputAmount = CurrencyAmount.fromFractionalAmount(route.input, amount.numerator, amount.denominator)
@@ -300,7 +321,7 @@ class Trade:
       amounts[len(amounts) - 1] = amount.wrapped
       for i in range(len(route.tokenPath) - 1, 0, -1):
         pool = route.pools[i - 1]
-        inputAmount, _ = pool.getInputAmount(amounts[i])
+        inputAmount, _ = cache.getInputAmount(pool, amounts[i]) if cache is not None else pool.getInputAmount(amounts[i])
         amounts[i - 1] = inputAmount
 
       inputAmount = CurrencyAmount.fromFractionalAmount(route.input, amounts[0].numerator, amounts[0].denominator)
@@ -319,7 +340,8 @@ class Trade:
   def fromRoutes (
     poolFactoryProvider: PoolFactoryProvider,
     routes: List[RouteAmount],
-    tradeType: TradeType
+    tradeType: TradeType,
+    cache: SwapCache = None
   ) -> 'Trade':
     """
     * Constructs a trade from routes by simulating swaps
@@ -329,6 +351,7 @@ class Trade:
     * @template TradeType The type of the trade, either exact in or exact out.
     * @param routes the routes to swap through and how much of the amount should be routed through each
     * @param tradeType whether the trade is an exact input or exact output swap
+    * @param cache optional cache of the swaps already simulated through the pools of the routes
     * @returns The trade
     """
     populatedRoutes: List[RouteInfo] = []
@@ -347,7 +370,7 @@ class Trade:
 
         for i in range(len(route.tokenPath) - 1):
           pool = route.pools[i]
-          outputAmount, pool = pool.getOutputAmount(amounts[i])
+          outputAmount, pool = cache.getOutputAmount(pool, amounts[i]) if cache is not None else pool.getOutputAmount(amounts[i])
           amounts[i + 1] = outputAmount
 
         outputAmount = CurrencyAmount.fromFractionalAmount(
@@ -366,7 +389,7 @@ class Trade:
 
         for i in range(len(route.tokenPath) - 1, 0, -1):
           pool = route.pools[i - 1]
-          inputAmount, pool = pool.getInputAmount(amounts[i])
+          inputAmount, pool = cache.getInputAmount(pool, amounts[i]) if cache is not None else pool.getInputAmount(amounts[i])
           amounts[i - 1] = inputAmount
 
         inputAmount = CurrencyAmount.fromFractionalAmount(route.input, amounts[0].numerator, amounts[0].denominator)
@@ -497,28 +520,31 @@ class Trade:
   @staticmethod
   def bestTradeExactIn (
     poolFactoryProvider: PoolFactoryProvider,
-    pools: List[Pool],
+    pools: List[Pool] | RoutingGraph,
     currencyAmountIn: CurrencyAmount,
     currencyOut: Currency,
     options: BestTradeOptions = BestTradeOptions(3, 3),
     # used in recursion.
     currentPools: List[Pool] = None,
     nextAmountIn: CurrencyAmount = None,
-    bestTrades: List['Trade'] = None
+    bestTrades: List['Trade'] = None,
+    cache: SwapCache = None
   ) -> List['Trade']:
     """
     * Given a list of pools, and a fixed amount in, returns the top `maxNumResults` trades that go from an input token
     * amount to an output token, making at most `maxHops` hops.
     * Note this does not consider aggregation, as routes are linear. It's possible a better route exists by splitting
     * the amount in among multiple routes.
-    * @param pools the pools to consider in finding the best trade
+    * @param pools the pools to consider in finding the best trade, or a routing graph built from them
     * @param nextAmountIn exact amount of input currency to spend
     * @param currencyOut the desired currency out
     * @param maxNumResults maximum number of results to return
     * @param maxHops maximum number of hops a returned trade can make, e.g. 1 hop goes through a single pool
+    * @param prune whether to skip the routes whose output at the mid prices of their pools can't beat the trades found so far
     * @param currentPools used in recursion; the current list of pools
     * @param currencyAmountIn used in recursion; the original value of the currencyAmountIn parameter
     * @param bestTrades used in recursion; the current list of best trades
+    * @param cache the cache of the simulated swaps, scoped to the search by default
     * @returns The exact in trade
     """
     if nextAmountIn is None:
@@ -528,24 +554,69 @@ class Trade:
     if bestTrades is None:
       bestTrades = []
 
-    maxNumResults = options.maxNumResults
-    maxHops = options.maxHops
+    graph = pools if isinstance(pools, RoutingGraph) else RoutingGraph(pools)
 
-    assert len(pools) > 0, 'POOLS'
-    assert maxHops > 0, 'MAX_HOPS'
+    assert len(graph) > 0, 'POOLS'
+    assert options.maxHops > 0, 'MAX_HOPS'
     assert currencyAmountIn == nextAmountIn or len(currentPools) > 0, 'INVALID_RECURSION'
 
+    Trade.__bestTradeExactIn(
+      poolFactoryProvider,
+      graph,
+      graph.positionsOf(currentPools),
+      currencyAmountIn,
+      currencyOut,
+      options.maxNumResults,
+      options.maxHops,
+      currentPools,
+      nextAmountIn,
+      bestTrades,
+      cache if cache is not None else SwapCache(),
+      graph.midPriceBounds(currencyOut.wrapped, options.maxHops) if options.prune else None
+    )
+
+    return bestTrades
+
+  @staticmethod
+  def __bestTradeExactIn (
+    poolFactoryProvider: PoolFactoryProvider,
+    graph: RoutingGraph,
+    visited: Set[int],
+    currencyAmountIn: CurrencyAmount,
+    currencyOut: Currency,
+    maxNumResults: int,
+    maxHops: int,
+    currentPools: List[Pool],
+    nextAmountIn: CurrencyAmount,
+    bestTrades: List['Trade'],
+    cache: SwapCache,
+    bounds: List[Dict[str, Fraction]] | None
+  ) -> None:
     amountIn = nextAmountIn.wrapped
     tokenOut = currencyOut.wrapped
-    for i in range(len(pools)):
-      pool = pools[i]
-      # pool irrelevant
-      if (not pool.token0.equals(amountIn.currency) and not pool.token1.equals(amountIn.currency)):
+    # only the pools involving the input token, skipping the pools already in the route
+    for position in graph.poolsOf(amountIn.currency):
+      if position in visited:
         continue
 
+      pool = graph.pools[position]
+
+      if bounds is not None:
+        tokenNext = pool.token1 if amountIn.currency.equals(pool.token0) else pool.token0
+        rate = bounds[maxHops - 1].get(tokenNext.address)
+        # the output token can't be reached from this pool
+        if rate is None:
+          continue
+        # even at mid prices, any route through this pool would be worse than the worst trade kept
+        if (len(bestTrades) == maxNumResults and
+          pool.priceOf(amountIn.currency).asFraction.multiply(rate).multiply(amountIn.quotient).lessThan(
+            bestTrades[-1].outputAmount.quotient
+          )):
+          continue
+
       amountOut: CurrencyAmount
       try:
-        amountOut, _ = pool.getOutputAmount(amountIn)
+        amountOut, _ = cache.getOutputAmount(pool, amountIn)
       except InsufficientInputAmountError as error:
         # input too low
         if (error.isInsufficientInputAmountError):
@@ -560,42 +631,43 @@ class Trade:
             poolFactoryProvider,
             Route(currentPools + [pool], currencyAmountIn.currency, currencyOut),
             currencyAmountIn,
-            TradeType.EXACT_INPUT
+            TradeType.EXACT_INPUT,
+            cache
           ),
           maxNumResults,
           tradeComparator
         )
-      elif (maxHops > 1 and len(pools) > 1):
-        poolsExcludingThisPool = pools[0:i] + pools[i + 1: len(pools)]
-
+      elif (maxHops > 1 and len(graph) - len(visited) > 1):
         # otherwise, consider all the other paths that lead from this token as long as we have not exceeded maxHops
-        Trade.bestTradeExactIn (
+        visited.add(position)
+        Trade.__bestTradeExactIn (
           poolFactoryProvider,
-          poolsExcludingThisPool,
+          graph,
+          visited,
           currencyAmountIn,
           currencyOut,
-          BestTradeOptions (
-            maxNumResults,
-            maxHops - 1
-          ),
+          maxNumResults,
+          maxHops - 1,
           currentPools + [pool],
           amountOut,
-          bestTrades
+          bestTrades,
+          cache,
+          bounds
         )
-
-    return bestTrades
+        visited.remove(position)
 
   @staticmethod
   def bestTradeExactOut (
     poolFactoryProvider: PoolFactoryProvider,
-    pools: List[Pool],
+    pools: List[Pool] | RoutingGraph,
     currencyIn: Currency,
     currencyAmountOut: CurrencyAmount,
     options: BestTradeOptions = BestTradeOptions(3, 3),
     # used in recursion.
     currentPools: List[Pool] = None,
     nextAmountOut: CurrencyAmount = None,
-    bestTrades: List['Trade'] = None
+    bestTrades: List['Trade'] = None,
+    cache: SwapCache = None
   ) -> List['Trade']:
     """
     * similar to the above method but instead targets a fixed output amount
@@ -603,7 +675,7 @@ class Trade:
     * to an output token amount, making at most `maxHops` hops
     * note this does not consider aggregation, as routes are linear. it's possible a better route exists by splitting
     * the amount in among multiple routes.
-    * @param pools the pools to consider in finding the best trade
+    * @param pools the pools to consider in finding the best trade, or a routing graph built from them
     * @param currencyIn the currency to spend
     * @param currencyAmountOut the desired currency amount out
     * @param nextAmountOut the exact amount of currency out
@@ -611,6 +683,7 @@ class Trade:
     * @param maxHops maximum number of hops a returned trade can make, e.g. 1 hop goes through a single pool
     * @param currentPools used in recursion; the current list of pools
     * @param bestTrades used in recursion; the current list of best trades
+    * @param cache the cache of the simulated swaps, scoped to the search by default
     * @returns The exact out trade
     """
     if nextAmountOut is None:
@@ -622,24 +695,53 @@ class Trade:
     if currentPools is None:
       currentPools = []
 
-    maxNumResults = options.maxNumResults
-    maxHops = options.maxHops
+    graph = pools if isinstance(pools, RoutingGraph) else RoutingGraph(pools)
 
-    assert len(pools) > 0, 'POOLS'
-    assert maxHops > 0, 'MAX_HOPS'
+    assert len(graph) > 0, 'POOLS'
+    assert options.maxHops > 0, 'MAX_HOPS'
     assert currencyAmountOut == nextAmountOut or len(currentPools) > 0, 'INVALID_RECURSION'
 
+    Trade.__bestTradeExactOut(
+      poolFactoryProvider,
+      graph,
+      graph.positionsOf(currentPools),
+      currencyIn,
+      currencyAmountOut,
+      options.maxNumResults,
+      options.maxHops,
+      currentPools,
+      nextAmountOut,
+      bestTrades,
+      cache if cache is not None else SwapCache()
+    )
+
+    return bestTrades
+
+  @staticmethod
+  def __bestTradeExactOut (
+    poolFactoryProvider: PoolFactoryProvider,
+    graph: RoutingGraph,
+    visited: Set[int],
+    currencyIn: Currency,
+    currencyAmountOut: CurrencyAmount,
+    maxNumResults: int,
+    maxHops: int,
+    currentPools: List[Pool],
+    nextAmountOut: CurrencyAmount,
+    bestTrades: List['Trade'],
+    cache: SwapCache
+  ) -> None:
     amountOut = nextAmountOut.wrapped
     tokenIn = currencyIn.wrapped
-    for i in range(len(pools)):
-      pool = pools[i]
-      # pool irrelevant
-      if (not pool.token0.equals(amountOut.currency) and not pool.token1.equals(amountOut.currency)):
+    # only the pools involving the output token, skipping the pools already in the route
+    for position in graph.poolsOf(amountOut.currency):
+      if position in visited:
         continue
 
+      pool = graph.pools[position]
       amountIn: CurrencyAmount
       try:
-        amountIn, _ = pool.getInputAmount(amountOut)
+        amountIn, _ = cache.getInputAmount(pool, amountOut)
       except InsufficientInputAmountError as error:
         # input too low
         if (error.isInsufficientInputAmountError):
@@ -654,27 +756,281 @@ class Trade:
             poolFactoryProvider,
             Route([pool] + currentPools, currencyIn, currencyAmountOut.currency),
             currencyAmountOut,
-            TradeType.EXACT_OUTPUT
+            TradeType.EXACT_OUTPUT,
+            cache
           ),
           maxNumResults,
           tradeComparator
         )
-      elif (maxHops > 1 and len(pools) > 1):
-        poolsExcludingThisPool = pools[0:i] + pools[i+1:]
-
+      elif (maxHops > 1 and len(graph) - len(visited) > 1):
         # otherwise, consider all the other paths that arrive at this token as long as we have not exceeded maxHops
-        Trade.bestTradeExactOut(
+        visited.add(position)
+        Trade.__bestTradeExactOut(
           poolFactoryProvider,
-          poolsExcludingThisPool,
+          graph,
+          visited,
           currencyIn,
           currencyAmountOut,
-          BestTradeOptions (
-            maxNumResults,
-            maxHops - 1
-          ),
+          maxNumResults,
+          maxHops - 1,
           [pool] + currentPools,
           amountIn,
-          bestTrades
+          bestTrades,
+          cache
         )
+        visited.remove(position)
+
+  @staticmethod
+  def bestTradesOfRoutes (
+    poolFactoryProvider: PoolFactoryProvider,
+    routes: List[Route],
+    amount: CurrencyAmount,
+    tradeType: TradeType,
+    maxNumResults: int = 3,
+    cache: SwapCache = None
+  ) -> List['Trade']:
+    """
+    * Evaluates the given routes for an amount, and returns the top `maxNumResults` trades.
+    * Given the routes in the order the search visits them, the trades are the same as the search's.
+    * @param routes the routes to evaluate, all between the same currencies
+    * @param amount the amount specified, either input or output, depending on tradeType
+    * @param tradeType whether the trades are exact input or exact output trades
+    * @param maxNumResults maximum number of results to return
+    * @param cache the cache of the simulated swaps, scoped to the call by default
+    * @returns The best trades
+    """
+    if cache is None:
+      cache = SwapCache()
+
+    bestTrades: List[Trade] = []
+    for route in routes:
+      try:
+        trade = Trade.fromRoute(poolFactoryProvider, route, amount, tradeType, cache)
+      except InsufficientInputAmountError as error:
+        # input too low
+        if (error.isInsufficientInputAmountError):
+          continue
+        raise error
+
+      sortedInsert(bestTrades, trade, maxNumResults, tradeComparator)
 
     return bestTrades
+
+  @staticmethod
+  def bestTradesBatch (
+    poolFactoryProvider: PoolFactoryProvider,
+    pools: List[Pool] | RoutingGraph,
+    requests: List[BestTradeRequest],
+    options: BestTradeOptions = BestTradeOptions(3, 3),
+    cache: SwapCache = None
+  ) -> List[List['Trade']]:
+    """
+    * Returns the best trades of every request, same as calling #bestTradeExactIn or #bestTradeExactOut for each of them.
+    * The routes are enumerated once per pair of currencies, the simulations of the same swaps are shared across
+    * the whole batch, and the identical requests are only evaluated once.
+    * @param pools the pools to consider in finding the best trades, or a routing graph built from them
+    * @param requests the amounts, currencies and trade types to find the best trades of
+    * @param options the maximum number of results and the maximum number of hops, for every request
+    * @param cache the cache of the simulated swaps, scoped to the batch by default
+    * @returns The best trades of every request, in the order of the requests
+    """
+    graph = pools if isinstance(pools, RoutingGraph) else RoutingGraph(pools)
+
+    assert len(graph) > 0, 'POOLS'
+    assert options.maxHops > 0, 'MAX_HOPS'
+
+    if cache is None:
+      cache = SwapCache()
+
+    # (trade type, currency in, currency out) => routes in the order of the search
+    routes: Dict[tuple, List[Route]] = {}
+    # same keys and the amount => best trades
+    results: Dict[tuple, List[Trade]] = {}
+    batch: List[List[Trade]] = []
+
+    for request in requests:
+      exactInput = request.tradeType == TradeType.EXACT_INPUT
+      currencyIn = request.amount.currency if exactInput else request.currency
+      currencyOut = request.currency if exactInput else request.amount.currency
+      pair = (
+        request.tradeType,
+        currencyIn.isNative, currencyIn.wrapped.address,
+        currencyOut.isNative, currencyOut.wrapped.address
+      )
+      key = pair + (request.amount.numerator, request.amount.denominator)
+
+      trades = results.get(key)
+      if trades is None:
+        if pair not in routes:
+          if exactInput:
+            paths = graph.pathsExactIn(currencyIn.wrapped, currencyOut.wrapped, options.maxHops)
+          else:
+            paths = graph.pathsExactOut(currencyIn.wrapped, currencyOut.wrapped, options.maxHops)
+          routes[pair] = [Route([graph.pools[position] for position in path], currencyIn, currencyOut) for path in paths]
+
+        trades = Trade.bestTradesOfRoutes(poolFactoryProvider, routes[pair], request.amount, request.tradeType, options.maxNumResults, cache)
+        results[key] = trades
+
+      batch.append(list(trades))
+
+    return batch
+
+  @staticmethod
+  def bestSplitTradeExactIn (
+    poolFactoryProvider: PoolFactoryProvider,
+    routes: List[Route],
+    currencyAmountIn: CurrencyAmount,
+    options: BestSplitTradeOptions = BestSplitTradeOptions()
+  ) -> 'Trade':
+    """
+    * Given candidate routes, e.g. the routes of the trades returned by #bestTradeExactIn, and a fixed amount in,
+    * returns the trade that splits the amount in across the routes so as to maximize the amount out.
+    * The amount is allocated in steps of `distributionPercent`, each step going to the route with the best marginal
+    * output given the amounts already allocated. The routes sharing pools are simulated on the states of the pools
+    * left by the amounts already allocated to the other routes, and the amounts of the trade are those of swapping
+    * through its routes one after the other, as the swap router does.
+    * The trade is never worse than the best of the trades going through a single route.
+    * @param routes the candidate routes, all from the input currency to the same output currency
+    * @param currencyAmountIn exact amount of input currency to spend
+    * @param distributionPercent the size of an allocation step, in percent of the amount in
+    * @param maxSplits maximum number of routes the amount in is split across
+    * @returns The exact in trade
+    """
+    for route in routes:
+      assert currencyAmountIn.currency.equals(route.input), 'INPUT'
+
+    return Trade.__bestSplitTrade(poolFactoryProvider, routes, currencyAmountIn, TradeType.EXACT_INPUT, options)
+
+  @staticmethod
+  def bestSplitTradeExactOut (
+    poolFactoryProvider: PoolFactoryProvider,
+    routes: List[Route],
+    currencyAmountOut: CurrencyAmount,
+    options: BestSplitTradeOptions = BestSplitTradeOptions()
+  ) -> 'Trade':
+    """
+    * similar to the above method but instead targets a fixed output amount, minimizing the amount in
+    * @param routes the candidate routes, all from the same input currency to the output currency
+    * @param currencyAmountOut the desired currency amount out
+    * @param distributionPercent the size of an allocation step, in percent of the amount out
+    * @param maxSplits maximum number of routes the amount out is split across
+    * @returns The exact out trade
+    """
+    for route in routes:
+      assert currencyAmountOut.currency.equals(route.output), 'OUTPUT'
+
+    return Trade.__bestSplitTrade(poolFactoryProvider, routes, currencyAmountOut, TradeType.EXACT_OUTPUT, options)
+
+  @staticmethod
+  def __simulateRoute (
+    states: Dict[str, Pool],
+    addresses: List[str],
+    route: Route,
+    amount: int,
+    tradeType: TradeType
+  ) -> Tuple[int, List[Pool]]:
+    """
+    * Swaps a raw amount through the current states of the pools of a route
+    * @param states The current state of every pool, by address
+    * @param addresses The addresses of the pools of the route
+    * @returns The raw amount calculated, and the states of the pools of the route after the swap
+    """
+    if (tradeType == TradeType.EXACT_INPUT):
+      currencyAmount = CurrencyAmount.fromRawAmount(route.input.wrapped, amount)
+      updated = []
+      for address in addresses:
+        currencyAmount, pool = states[address].getOutputAmount(currencyAmount)
+        updated.append(pool)
+    else:
+      currencyAmount = CurrencyAmount.fromRawAmount(route.output.wrapped, amount)
+      updated = [None] * len(addresses)
+      for i in range(len(addresses) - 1, -1, -1):
+        currencyAmount, updated[i] = states[addresses[i]].getInputAmount(currencyAmount)
+
+    return (currencyAmount.quotient, updated)
+
+  @staticmethod
+  def __bestSplitTrade (
+    poolFactoryProvider: PoolFactoryProvider,
+    routes: List[Route],
+    amount: CurrencyAmount,
+    tradeType: TradeType,
+    options: BestSplitTradeOptions
+  ) -> 'Trade':
+    assert len(routes) > 0, 'ROUTES'
+    assert options.distributionPercent > 0 and 100 % options.distributionPercent == 0, 'DISTRIBUTION_PERCENT'
+    assert options.maxSplits > 0, 'MAX_SPLITS'
+
+    total = amount.quotient
+    assert total > 0, 'AMOUNT'
+
+    exactInput = tradeType == TradeType.EXACT_INPUT
+    steps = 100 // options.distributionPercent
+    poolAddresses = [
+      [Pool.getAddress(poolFactoryProvider, pool.token0, pool.token1, pool.fee) for pool in route.pools]
+      for route in routes
+    ]
+    initialStates = {address: pool for route, addresses in zip(routes, poolAddresses) for address, pool in zip(addresses, route.pools)}
+    # the state of every pool after swapping the amounts allocated so far, shared by the routes going through it,
+    # so every step only simulates its own part of the amount
+    states = dict(initialStates)
+    allocations = [0] * len(routes)
+    used: List[int] = []
+
+    for step in range(steps):
+      part = total * (step + 1) // steps - total * step // steps
+      if part == 0:
+        continue
+
+      best: Tuple[int, int, List[Pool]] | None = None
+      for i, route in enumerate(routes):
+        if allocations[i] == 0 and len(used) == options.maxSplits:
+          continue
+
+        try:
+          quote, pools = Trade.__simulateRoute(states, poolAddresses[i], route, part, tradeType)
+        except InsufficientInputAmountError as error:
+          # input too low
+          if (error.isInsufficientInputAmountError):
+            continue
+          raise error
+
+        if best is None or (quote > best[1] if exactInput else quote < best[1]):
+          best = (i, quote, pools)
+
+      assert best is not None, 'ROUTES'
+      i, _, pools = best
+      if allocations[i] == 0:
+        used.append(i)
+      allocations[i] += part
+      states.update(zip(poolAddresses[i], pools))
+
+    # swap the amount allocated to every route one after the other, the routes sharing pools
+    # going through the states left by the routes swapped before them
+    states = dict(initialStates)
+    swaps: List[RouteInfo] = []
+    for i in used:
+      route = routes[i]
+      quote, pools = Trade.__simulateRoute(states, poolAddresses[i], route, allocations[i], tradeType)
+      states.update(zip(poolAddresses[i], pools))
+      inputAmount, outputAmount = (allocations[i], quote) if exactInput else (quote, allocations[i])
+      swaps.append(RouteInfo(
+        route,
+        CurrencyAmount.fromRawAmount(route.input, inputAmount),
+        CurrencyAmount.fromRawAmount(route.output, outputAmount)
+      ))
+    trade = Trade(TradeConstructorArgs(swaps, tradeType))
+
+    # the greedy allocation may miss a better single route
+    for route in routes:
+      try:
+        single = Trade.fromRoute(poolFactoryProvider, route, amount, tradeType)
+      except InsufficientInputAmountError as error:
+        if (error.isInsufficientInputAmountError):
+          continue
+        raise error
+
+      if tradeComparator(single, trade) < 0:
+        trade = single
+
+    return trade
@@ -25,30 +25,30 @@ class SqrtPriceMath(metaclass=ABCMeta):
     numerator1 = liquidity << 96
     numerator2 = sqrtRatioBX96 - sqrtRatioAX96
 
-    a = FullMath.mulDivRoundingUp(FullMath.mulDivRoundingUp(numerator1, numerator2, sqrtRatioBX96), 1, sqrtRatioAX96)
-    b = numerator1 * numerator2 // sqrtRatioBX96 // sqrtRatioAX96
-
-    return a if roundUp else b
+    if roundUp:
+      return FullMath.mulDivRoundingUp(FullMath.mulDivRoundingUp(numerator1, numerator2, sqrtRatioBX96), 1, sqrtRatioAX96)
+    else:
+      return numerator1 * numerator2 // sqrtRatioBX96 // sqrtRatioAX96
 
   @staticmethod
   def getAmount1Delta(sqrtRatioAX96: int, sqrtRatioBX96: int, liquidity: int, roundUp: bool) -> int:
     if sqrtRatioAX96 > sqrtRatioBX96:
       sqrtRatioAX96, sqrtRatioBX96 = sqrtRatioBX96, sqrtRatioAX96
 
-    a = FullMath.mulDivRoundingUp(liquidity, (sqrtRatioBX96 - sqrtRatioAX96), Q96)
-    b = liquidity * (sqrtRatioBX96 - sqrtRatioAX96) // Q96
-
-    return a if roundUp else b
+    if roundUp:
+      return FullMath.mulDivRoundingUp(liquidity, (sqrtRatioBX96 - sqrtRatioAX96), Q96)
+    else:
+      return liquidity * (sqrtRatioBX96 - sqrtRatioAX96) // Q96
 
   @staticmethod
   def getNextSqrtPriceFromInput(sqrtPX96: int, liquidity: int, amountIn: int, zeroForOne: bool) -> int:
     assert sqrtPX96 > 0
     assert liquidity > 0
 
-    a = SqrtPriceMath.getNextSqrtPriceFromAmount0RoundingUp(sqrtPX96, liquidity, amountIn, True)
-    b = SqrtPriceMath.getNextSqrtPriceFromAmount1RoundingDown(sqrtPX96, liquidity, amountIn, True)
-
-    return a if zeroForOne else b
+    if zeroForOne:
+      return SqrtPriceMath.getNextSqrtPriceFromAmount0RoundingUp(sqrtPX96, liquidity, amountIn, True)
+    else:
+      return SqrtPriceMath.getNextSqrtPriceFromAmount1RoundingDown(sqrtPX96, liquidity, amountIn, True)
 
   @staticmethod
   def getNextSqrtPriceFromOutput(
@@ -60,10 +60,10 @@ class SqrtPriceMath(metaclass=ABCMeta):
     assert sqrtPX96 > 0
     assert liquidity > 0
 
-    a = SqrtPriceMath.getNextSqrtPriceFromAmount1RoundingDown(sqrtPX96, liquidity, amountOut, False)
-    b = SqrtPriceMath.getNextSqrtPriceFromAmount0RoundingUp(sqrtPX96, liquidity, amountOut, False)
-
-    return a if zeroForOne else b
+    if zeroForOne:
+      return SqrtPriceMath.getNextSqrtPriceFromAmount1RoundingDown(sqrtPX96, liquidity, amountOut, False)
+    else:
+      return SqrtPriceMath.getNextSqrtPriceFromAmount0RoundingUp(sqrtPX96, liquidity, amountOut, False)
 
   @staticmethod
   def getNextSqrtPriceFromAmount0RoundingUp(
@@ -0,0 +1,162 @@
+import mmap
+import math
+import struct
+from bisect import bisect_right
+from convexus.sdk.utils.tickMath import TickMath
+
+# log(sqrt(1.0001)), used to estimate the position of a sqrt ratio in the table
+LOG_SQRT10001 = math.log(1.0001) / 2
+LOG_Q96 = 96 * math.log(2)
+
+class SqrtRatioTable:
+  """
+  * A table of the sqrt ratios of every tick that is a multiple of a given tick spacing, in ascending tick order.
+  * A tick spacing of 1 covers the full tick range, while the tick spacing of a fee tier only covers its usable ticks.
+  *
+  * The table is stored as a compact binary file: a header followed by one little-endian
+  * unsigned 160 bits integer per tick, so it can be memory mapped and shared between processes.
+  """
+
+  MAGIC = b'CVXSQRT\x00'
+  VERSION = 1
+  # magic, version, tick spacing, first tick, entries count
+  HEADER = struct.Struct('<8sIiiI')
+  # a Q64.96 sqrt ratio always fits in 160 bits
+  ENTRY_SIZE = 20
+
+  def __init__(self, tickSpacing: int, buffer, offset: int = 0) -> None:
+    """
+    * Wraps a buffer of sqrt ratios
+    * @param tickSpacing The tick spacing between two consecutive entries
+    * @param buffer The entries, one ENTRY_SIZE bytes little-endian integer per tick, starting from the smallest usable tick
+    * @param offset The offset of the first entry in the buffer
+    """
+    assert tickSpacing > 0, 'TICK_SPACING'
+    self.tickSpacing = tickSpacing
+    self.minTick = SqrtRatioTable.minUsableTick(tickSpacing)
+    self.maxTick = SqrtRatioTable.maxUsableTick(tickSpacing)
+    self.count = (self.maxTick - self.minTick) // tickSpacing + 1
+    assert len(buffer) - offset >= self.count * SqrtRatioTable.ENTRY_SIZE, 'TABLE_SIZE'
+    self.buffer = buffer
+    self.offset = offset
+
+  def __repr__(self) -> str:
+    return f"SqrtRatioTable(tickSpacing={self.tickSpacing}, count={self.count})"
+
+  @staticmethod
+  def minUsableTick(tickSpacing: int) -> int:
+    return -(TickMath.MAX_TICK // tickSpacing) * tickSpacing
+
+  @staticmethod
+  def maxUsableTick(tickSpacing: int) -> int:
+    return (TickMath.MAX_TICK // tickSpacing) * tickSpacing
+
+  @staticmethod
+  def build(tickSpacing: int = 1) -> 'SqrtRatioTable':
+    """
+    * Computes the sqrt ratio of every usable tick for a given tick spacing
+    * @param tickSpacing The tick spacing, 1 for the full tick range
+    """
+    size = SqrtRatioTable.ENTRY_SIZE
+    minTick = SqrtRatioTable.minUsableTick(tickSpacing)
+    maxTick = SqrtRatioTable.maxUsableTick(tickSpacing)
+    buffer = bytearray()
+    for tick in range(minTick, maxTick + 1, tickSpacing):
+      buffer += TickMath.computeSqrtRatioAtTick(tick).to_bytes(size, 'little')
+    return SqrtRatioTable(tickSpacing, bytes(buffer))
+
+  def toBytes(self) -> bytes:
+    """
+    * Serializes the table to its binary file format
+    """
+    header = SqrtRatioTable.HEADER.pack(SqrtRatioTable.MAGIC, SqrtRatioTable.VERSION, self.tickSpacing, self.minTick, self.count)
+    start = self.offset
+    end = start + self.count * SqrtRatioTable.ENTRY_SIZE
+    return header + bytes(self.buffer[start:end])
+
+  def save(self, path: str) -> None:
+    """
+    * Writes the table to a file that can be loaded with #load
+    * @param path The file path
+    """
+    with open(path, 'wb') as f:
+      f.write(self.toBytes())
+
+  @staticmethod
+  def fromBuffer(buffer) -> 'SqrtRatioTable':
+    """
+    * Reads a table from its binary file format without copying the entries
+    * @param buffer A bytes-like object, such as a memory map of a file written by #save
+    """
+    magic, version, tickSpacing, minTick, count = SqrtRatioTable.HEADER.unpack_from(buffer, 0)
+    assert magic == SqrtRatioTable.MAGIC, 'TABLE_MAGIC'
+    assert version == SqrtRatioTable.VERSION, 'TABLE_VERSION'
+    table = SqrtRatioTable(tickSpacing, buffer, SqrtRatioTable.HEADER.size)
+    assert table.minTick == minTick and table.count == count, 'TABLE_RANGE'
+    return table
+
+  @staticmethod
+  def load(path: str) -> 'SqrtRatioTable':
+    """
+    * Memory maps a table file written by #save
+    * @param path The file path
+    """
+    with open(path, 'rb') as f:
+      buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return SqrtRatioTable.fromBuffer(buffer)
+
+  def close(self) -> None:
+    """
+    * Releases the memory map backing the table, if any
+    """
+    if isinstance(self.buffer, mmap.mmap):
+      self.buffer.close()
+
+  def contains(self, tick: int) -> bool:
+    """
+    * Returns true if the sqrt ratio of the tick is stored in the table
+    * @param tick The tick
+    """
+    return tick % self.tickSpacing == 0 and self.minTick <= tick <= self.maxTick
+
+  def __len__(self) -> int:
+    return self.count
+
+  def __getitem__(self, index: int) -> int:
+    """
+    * Returns the sqrt ratio of the entry at the given position, i.e. of the tick `minTick + index * tickSpacing`
+    """
+    if index < 0 or index >= self.count:
+      raise IndexError(index)
+    start = self.offset + index * SqrtRatioTable.ENTRY_SIZE
+    return int.from_bytes(self.buffer[start:start + SqrtRatioTable.ENTRY_SIZE], 'little')
+
+  def getSqrtRatioAtTick(self, tick: int) -> int:
+    """
+    * Returns the precomputed sqrt ratio as a Q64.96 for the given tick
+    * @param tick A tick contained in the table
+    """
+    index, remainder = divmod(tick - self.minTick, self.tickSpacing)
+    assert remainder == 0 and 0 <= index < self.count, 'TICK'
+    start = self.offset + index * SqrtRatioTable.ENTRY_SIZE
+    return int.from_bytes(self.buffer[start:start + SqrtRatioTable.ENTRY_SIZE], 'little')
+
+  def getTickAtSqrtRatio(self, sqrtRatioX96: int) -> int:
+    """
+    * Returns the largest tick of the table whose sqrt ratio is less than or equal to the given sqrt ratio.
+    * With a tick spacing of 1, this is exactly #TickMath.getTickAtSqrtRatio.
+    * @param sqrtRatioX96 the sqrt ratio as a Q64.96 for which to find the tick
+    """
+    # estimate the position with floating point logarithms, then bisect around it
+    estimate = math.floor((math.log(sqrtRatioX96) - LOG_Q96) / LOG_SQRT10001)
+    index = (estimate - self.minTick) // self.tickSpacing
+    lo = min(max(index - 1, 0), self.count)
+    hi = min(max(index + 3, 0), self.count)
+    position = bisect_right(self, sqrtRatioX96, lo, hi)
+
+    # the estimate missed, search the whole table
+    if (position == lo and lo > 0) or (position == hi and hi < self.count):
+      position = bisect_right(self, sqrtRatioX96)
+
+    assert position > 0, 'SQRT_RATIO'
+    return self.minTick + (position - 1) * self.tickSpacing
@@ -0,0 +1,278 @@
+from typing import List, Tuple
+
+from convexus.sdk.entities.tickDataProvider import TickDataProvider
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.sqrtPriceMath import SqrtPriceMath
+from convexus.sdk.utils.swapMath import MAX_FEE
+
+def computeSwap (
+  tickDataProvider: TickDataProvider,
+  fee: int,
+  tickSpacing: int,
+  zeroForOne: bool,
+  amountSpecified: int,
+  sqrtPriceLimitX96: int,
+  sqrtPriceX96: int,
+  tick: int,
+  liquidity: int
+) -> Tuple[int, int, int, int]:
+  """
+  * Simulates a swap from a given pool state, exactly like the pool contract does.
+  * The state is kept in plain integers and each step of `SwapMath.computeSwapStep` is inlined,
+  * so no object is allocated while crossing ticks. The sqrt price limit is expected to be validated by the caller.
+  * @param tickDataProvider The tick data provider of the pool
+  * @param fee The fee of the pool in hundredths of a bips
+  * @param tickSpacing The tick spacing of the pool
+  * @param zeroForOne Whether the amount in is token0 or token1
+  * @param amountSpecified The amount of the swap, exact input if positive, exact output if negative
+  * @param sqrtPriceLimitX96 The Q64.96 sqrt price limit
+  * @param sqrtPriceX96 The current sqrt price of the pool
+  * @param tick The current tick of the pool
+  * @param liquidity The current in range liquidity of the pool
+  * @returns amountCalculated, sqrtPriceX96, liquidity and tick after the swap
+  """
+  # hoist the lookups out of the loop
+  nextInitializedTickWithinOneWord = tickDataProvider.nextInitializedTickWithinOneWord
+  getTick = tickDataProvider.getTick
+  getSqrtRatioAtTick = TickMath.getSqrtRatioAtTick
+  getTickAtSqrtRatio = TickMath.getTickAtSqrtRatio
+  getAmount0Delta = SqrtPriceMath.getAmount0Delta
+  getAmount1Delta = SqrtPriceMath.getAmount1Delta
+  getNextSqrtPriceFromInput = SqrtPriceMath.getNextSqrtPriceFromInput
+  getNextSqrtPriceFromOutput = SqrtPriceMath.getNextSqrtPriceFromOutput
+  MIN_TICK = TickMath.MIN_TICK
+  MAX_TICK = TickMath.MAX_TICK
+  feeComplement = MAX_FEE - fee
+
+  exactInput = amountSpecified >= 0
+  amountSpecifiedRemaining = amountSpecified
+  amountCalculated = 0
+
+  while amountSpecifiedRemaining != 0 and sqrtPriceX96 != sqrtPriceLimitX96:
+    sqrtPriceStartX96 = sqrtPriceX96
+
+    # because each iteration of the while loop rounds, we can't optimize this code (relative to the smart contract)
+    # by simply traversing to the next available tick, we instead need to exactly replicate
+    # tickBitmap.nextInitializedTickWithinOneWord
+    tickNext, initialized = nextInitializedTickWithinOneWord(tick, zeroForOne, tickSpacing)
+
+    if tickNext < MIN_TICK:
+      tickNext = MIN_TICK
+    elif tickNext > MAX_TICK:
+      tickNext = MAX_TICK
+
+    sqrtPriceNextX96 = getSqrtRatioAtTick(tickNext)
+
+    if zeroForOne:
+      sqrtPriceTargetX96 = sqrtPriceLimitX96 if sqrtPriceNextX96 < sqrtPriceLimitX96 else sqrtPriceNextX96
+    else:
+      sqrtPriceTargetX96 = sqrtPriceLimitX96 if sqrtPriceNextX96 > sqrtPriceLimitX96 else sqrtPriceNextX96
+
+    # SwapMath.computeSwapStep
+    stepZeroForOne = sqrtPriceStartX96 >= sqrtPriceTargetX96
+
+    if exactInput:
+      amountRemainingLessFee = (amountSpecifiedRemaining * feeComplement) // MAX_FEE
+      if stepZeroForOne:
+        amountIn = getAmount0Delta(sqrtPriceTargetX96, sqrtPriceStartX96, liquidity, True)
+      else:
+        amountIn = getAmount1Delta(sqrtPriceStartX96, sqrtPriceTargetX96, liquidity, True)
+
+      if amountRemainingLessFee >= amountIn:
+        sqrtPriceX96 = sqrtPriceTargetX96
+      else:
+        sqrtPriceX96 = getNextSqrtPriceFromInput(sqrtPriceStartX96, liquidity, amountRemainingLessFee, stepZeroForOne)
+    else:
+      if stepZeroForOne:
+        amountOut = getAmount1Delta(sqrtPriceTargetX96, sqrtPriceStartX96, liquidity, False)
+      else:
+        amountOut = getAmount0Delta(sqrtPriceStartX96, sqrtPriceTargetX96, liquidity, False)
+
+      if -amountSpecifiedRemaining >= amountOut:
+        sqrtPriceX96 = sqrtPriceTargetX96
+      else:
+        sqrtPriceX96 = getNextSqrtPriceFromOutput(sqrtPriceStartX96, liquidity, -amountSpecifiedRemaining, stepZeroForOne)
+
+    reachedTarget = sqrtPriceTargetX96 == sqrtPriceX96
+
+    if stepZeroForOne:
+      if not (reachedTarget and exactInput):
+        amountIn = getAmount0Delta(sqrtPriceX96, sqrtPriceStartX96, liquidity, True)
+      if not (reachedTarget and not exactInput):
+        amountOut = getAmount1Delta(sqrtPriceX96, sqrtPriceStartX96, liquidity, False)
+    else:
+      if not (reachedTarget and exactInput):
+        amountIn = getAmount1Delta(sqrtPriceStartX96, sqrtPriceX96, liquidity, True)
+      if not (reachedTarget and not exactInput):
+        amountOut = getAmount0Delta(sqrtPriceStartX96, sqrtPriceX96, liquidity, False)
+
+    if not exactInput and amountOut > -amountSpecifiedRemaining:
+      amountOut = -amountSpecifiedRemaining
+
+    if exactInput and sqrtPriceX96 != sqrtPriceTargetX96:
+      # we didn't reach the target, so take the remainder of the maximum input as fee
+      feeAmount = amountSpecifiedRemaining - amountIn
+    else:
+      # FullMath.mulDivRoundingUp
+      feeAmount = -((-amountIn * fee) // feeComplement)
+
+    if exactInput:
+      amountSpecifiedRemaining -= amountIn + feeAmount
+      amountCalculated -= amountOut
+    else:
+      amountSpecifiedRemaining += amountOut
+      amountCalculated += amountIn + feeAmount
+
+    if sqrtPriceX96 == sqrtPriceNextX96:
+      # if the tick is initialized, run the tick transition
+      if initialized:
+        # if we're moving leftward, we interpret liquidityNet as the opposite sign
+        # safe because liquidityNet cannot be type(int128).min
+        if zeroForOne:
+          liquidity -= getTick(tickNext).liquidityNet
+        else:
+          liquidity += getTick(tickNext).liquidityNet
+
+      tick = tickNext - 1 if zeroForOne else tickNext
+
+    elif sqrtPriceX96 != sqrtPriceStartX96:
+      # recompute unless we're on a lower tick boundary (i.e. already transitioned ticks), and haven't moved
+      tick = getTickAtSqrtRatio(sqrtPriceX96)
+
+  return (amountCalculated, sqrtPriceX96, liquidity, tick)
+
+def computeSwapMany (
+  tickDataProvider: TickDataProvider,
+  fee: int,
+  tickSpacing: int,
+  zeroForOne: bool,
+  amountsSpecified: List[int],
+  sqrtPriceLimitX96: int,
+  sqrtPriceX96: int,
+  tick: int,
+  liquidity: int
+) -> List[Tuple[int, int, int, int]]:
+  """
+  * Simulates one swap per amount from the same pool state, with the same results as calling #computeSwap for each of them.
+  * The amounts are processed in increasing order of magnitude and share the steps that fully reach their target:
+  * such a step consumes the same amounts whatever the amount remaining, so it is computed once for every amount large enough to complete it.
+  * Each amount is then finished from the shared state where it stops being able to complete a step.
+  * @param amountsSpecified The amounts of the swaps, exact input if positive, exact output if negative
+  * @returns amountCalculated, sqrtPriceX96, liquidity and tick after each swap, in the order of the amounts
+  """
+  results: List[Tuple[int, int, int, int]] = [None] * len(amountsSpecified)
+  exactInputs = [i for i, amount in enumerate(amountsSpecified) if amount >= 0]
+  exactOutputs = [i for i, amount in enumerate(amountsSpecified) if amount < 0]
+
+  for indexes in (exactInputs, exactOutputs):
+    if not indexes:
+      continue
+    indexes.sort(key=lambda i: abs(amountsSpecified[i]))
+    _computeSwapGroup(
+      tickDataProvider, fee, tickSpacing, zeroForOne,
+      amountsSpecified, indexes, results,
+      sqrtPriceLimitX96, sqrtPriceX96, tick, liquidity
+    )
+
+  return results
+
+def _computeSwapGroup (
+  tickDataProvider: TickDataProvider,
+  fee: int,
+  tickSpacing: int,
+  zeroForOne: bool,
+  amountsSpecified: List[int],
+  indexes: List[int],
+  results: List[Tuple[int, int, int, int]],
+  sqrtPriceLimitX96: int,
+  sqrtPriceX96: int,
+  tick: int,
+  liquidity: int
+) -> None:
+  # the indexes are sorted by magnitude and all share the same sign
+  nextInitializedTickWithinOneWord = tickDataProvider.nextInitializedTickWithinOneWord
+  getTick = tickDataProvider.getTick
+  getSqrtRatioAtTick = TickMath.getSqrtRatioAtTick
+  getTickAtSqrtRatio = TickMath.getTickAtSqrtRatio
+  getAmount0Delta = SqrtPriceMath.getAmount0Delta
+  getAmount1Delta = SqrtPriceMath.getAmount1Delta
+  MIN_TICK = TickMath.MIN_TICK
+  MAX_TICK = TickMath.MAX_TICK
+  feeComplement = MAX_FEE - fee
+
+  exactInput = amountsSpecified[indexes[0]] >= 0
+  # the part of every pending amount consumed by the shared steps, with the sign of the amounts
+  amountConsumed = 0
+  amountCalculated = 0
+  pending = 0
+
+  while pending < len(indexes):
+    amountSpecifiedRemaining = amountsSpecified[indexes[pending]] - amountConsumed
+
+    if amountSpecifiedRemaining == 0 or sqrtPriceX96 == sqrtPriceLimitX96:
+      results[indexes[pending]] = (amountCalculated, sqrtPriceX96, liquidity, tick)
+      pending += 1
+      continue
+
+    tickNext, initialized = nextInitializedTickWithinOneWord(tick, zeroForOne, tickSpacing)
+
+    if tickNext < MIN_TICK:
+      tickNext = MIN_TICK
+    elif tickNext > MAX_TICK:
+      tickNext = MAX_TICK
+
+    sqrtPriceNextX96 = getSqrtRatioAtTick(tickNext)
+
+    if zeroForOne:
+      sqrtPriceTargetX96 = sqrtPriceLimitX96 if sqrtPriceNextX96 < sqrtPriceLimitX96 else sqrtPriceNextX96
+    else:
+      sqrtPriceTargetX96 = sqrtPriceLimitX96 if sqrtPriceNextX96 > sqrtPriceLimitX96 else sqrtPriceNextX96
+
+    # the amounts of a step that reaches its target
+    if sqrtPriceX96 >= sqrtPriceTargetX96:
+      amountIn = getAmount0Delta(sqrtPriceTargetX96, sqrtPriceX96, liquidity, True)
+      amountOut = getAmount1Delta(sqrtPriceTargetX96, sqrtPriceX96, liquidity, False)
+    else:
+      amountIn = getAmount1Delta(sqrtPriceX96, sqrtPriceTargetX96, liquidity, True)
+      amountOut = getAmount0Delta(sqrtPriceX96, sqrtPriceTargetX96, liquidity, False)
+
+    if exactInput:
+      reachesTarget = (amountSpecifiedRemaining * feeComplement) // MAX_FEE >= amountIn
+    else:
+      reachesTarget = -amountSpecifiedRemaining >= amountOut
+
+    if not reachesTarget:
+      # the smallest pending amount ends within this step, finish it on its own
+      result = computeSwap(
+        tickDataProvider, fee, tickSpacing, zeroForOne,
+        amountSpecifiedRemaining, sqrtPriceLimitX96,
+        sqrtPriceX96, tick, liquidity
+      )
+      results[indexes[pending]] = (amountCalculated + result[0], result[1], result[2], result[3])
+      pending += 1
+      continue
+
+    # every pending amount is large enough to complete the step
+    feeAmount = -((-amountIn * fee) // feeComplement)
+
+    if exactInput:
+      amountConsumed += amountIn + feeAmount
+      amountCalculated -= amountOut
+    else:
+      amountConsumed -= amountOut
+      amountCalculated += amountIn + feeAmount
+
+    sqrtPriceStartX96 = sqrtPriceX96
+    sqrtPriceX96 = sqrtPriceTargetX96
+
+    if sqrtPriceX96 == sqrtPriceNextX96:
+      if initialized:
+        if zeroForOne:
+          liquidity -= getTick(tickNext).liquidityNet
+        else:
+          liquidity += getTick(tickNext).liquidityNet
+
+      tick = tickNext - 1 if zeroForOne else tickNext
+
+    elif sqrtPriceX96 != sqrtPriceStartX96:
+      tick = getTickAtSqrtRatio(sqrtPriceX96)
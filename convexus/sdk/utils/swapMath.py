@@ -1,5 +1,4 @@
 from abc import ABCMeta
-from dataclasses import dataclass
 from typing import Tuple
 
 from convexus.sdk.constants import FeeAmount
@@ -10,13 +9,6 @@ MAX_FEE = 10**6
 
 class SwapMath(metaclass=ABCMeta):
 
-  @dataclass
-  class ReturnValues:
-    sqrtRatioNextX96: int
-    amountIn: int
-    amountOut: int
-    feeAmount: int
-
   @classmethod
   def computeSwapStep(
     cls,
@@ -27,61 +19,64 @@ class SwapMath(metaclass=ABCMeta):
     feePips: FeeAmount
   ) -> Tuple[int, int, int, int]:
 
-    returnValues = cls.ReturnValues(0, 0, 0, 0)
+    amountIn = 0
+    amountOut = 0
 
     zeroForOne = sqrtRatioCurrentX96 >= sqrtRatioTargetX96
     exactIn = amountRemaining >= 0
 
     if exactIn:
       amountRemainingLessFee = (amountRemaining * (MAX_FEE - feePips)) // MAX_FEE
-      a = SqrtPriceMath.getAmount0Delta(sqrtRatioTargetX96, sqrtRatioCurrentX96, liquidity, True)
-      b = SqrtPriceMath.getAmount1Delta(sqrtRatioCurrentX96, sqrtRatioTargetX96, liquidity, True)
-      returnValues.amountIn = a if zeroForOne else b
+      if zeroForOne:
+        amountIn = SqrtPriceMath.getAmount0Delta(sqrtRatioTargetX96, sqrtRatioCurrentX96, liquidity, True)
+      else:
+        amountIn = SqrtPriceMath.getAmount1Delta(sqrtRatioCurrentX96, sqrtRatioTargetX96, liquidity, True)
 
-      if amountRemainingLessFee >= returnValues.amountIn:
-        returnValues.sqrtRatioNextX96 = sqrtRatioTargetX96
+      if amountRemainingLessFee >= amountIn:
+        sqrtRatioNextX96 = sqrtRatioTargetX96
       else:
-        returnValues.sqrtRatioNextX96 = SqrtPriceMath.getNextSqrtPriceFromInput(
+        sqrtRatioNextX96 = SqrtPriceMath.getNextSqrtPriceFromInput(
           sqrtRatioCurrentX96,
           liquidity,
           amountRemainingLessFee,
           zeroForOne
         )
     else:
-      a = SqrtPriceMath.getAmount1Delta(sqrtRatioTargetX96, sqrtRatioCurrentX96, liquidity, False)
-      b = SqrtPriceMath.getAmount0Delta(sqrtRatioCurrentX96, sqrtRatioTargetX96, liquidity, False)
-      returnValues.amountOut = a if zeroForOne else b
+      if zeroForOne:
+        amountOut = SqrtPriceMath.getAmount1Delta(sqrtRatioTargetX96, sqrtRatioCurrentX96, liquidity, False)
+      else:
+        amountOut = SqrtPriceMath.getAmount0Delta(sqrtRatioCurrentX96, sqrtRatioTargetX96, liquidity, False)
       
-      if (amountRemaining * -1) >= returnValues.amountOut:
-        returnValues.sqrtRatioNextX96 = sqrtRatioTargetX96
+      if (amountRemaining * -1) >= amountOut:
+        sqrtRatioNextX96 = sqrtRatioTargetX96
       else:
-        returnValues.sqrtRatioNextX96 = SqrtPriceMath.getNextSqrtPriceFromOutput(
+        sqrtRatioNextX96 = SqrtPriceMath.getNextSqrtPriceFromOutput(
           sqrtRatioCurrentX96,
           liquidity,
           amountRemaining * -1,
           zeroForOne
         )
 
-    max = sqrtRatioTargetX96 == returnValues.sqrtRatioNextX96
+    max = sqrtRatioTargetX96 == sqrtRatioNextX96
 
     if zeroForOne:
-      b = SqrtPriceMath.getAmount0Delta(returnValues.sqrtRatioNextX96, sqrtRatioCurrentX96, liquidity, True)
-      returnValues.amountIn = returnValues.amountIn if (max and exactIn) else b
-      b = SqrtPriceMath.getAmount1Delta(returnValues.sqrtRatioNextX96, sqrtRatioCurrentX96, liquidity, False)
-      returnValues.amountOut = returnValues.amountOut if (max and not exactIn) else b
+      if not (max and exactIn):
+        amountIn = SqrtPriceMath.getAmount0Delta(sqrtRatioNextX96, sqrtRatioCurrentX96, liquidity, True)
+      if not (max and not exactIn):
+        amountOut = SqrtPriceMath.getAmount1Delta(sqrtRatioNextX96, sqrtRatioCurrentX96, liquidity, False)
     else:
-      b = SqrtPriceMath.getAmount1Delta(sqrtRatioCurrentX96, returnValues.sqrtRatioNextX96, liquidity, True)
-      returnValues.amountIn = returnValues.amountIn if (max and exactIn) else b
-      b = SqrtPriceMath.getAmount0Delta(sqrtRatioCurrentX96, returnValues.sqrtRatioNextX96, liquidity, False)
-      returnValues.amountOut = returnValues.amountOut if (max and not exactIn) else b
+      if not (max and exactIn):
+        amountIn = SqrtPriceMath.getAmount1Delta(sqrtRatioCurrentX96, sqrtRatioNextX96, liquidity, True)
+      if not (max and not exactIn):
+        amountOut = SqrtPriceMath.getAmount0Delta(sqrtRatioCurrentX96, sqrtRatioNextX96, liquidity, False)
 
-    if (not exactIn and (returnValues.amountOut > (amountRemaining * -1))):
-      returnValues.amountOut = (amountRemaining * -1)
+    if (not exactIn and (amountOut > (amountRemaining * -1))):
+      amountOut = (amountRemaining * -1)
 
-    if (exactIn and (returnValues.sqrtRatioNextX96 != sqrtRatioTargetX96)):
+    if (exactIn and (sqrtRatioNextX96 != sqrtRatioTargetX96)):
       # we didn't reach the target, so take the remainder of the maximum input as fee
-      returnValues.feeAmount = amountRemaining - returnValues.amountIn
+      feeAmount = amountRemaining - amountIn
     else:
-      returnValues.feeAmount = FullMath.mulDivRoundingUp(returnValues.amountIn, feePips, (MAX_FEE - feePips))
+      feeAmount = FullMath.mulDivRoundingUp(amountIn, feePips, (MAX_FEE - feePips))
     
-    return (returnValues.sqrtRatioNextX96, returnValues.amountIn, returnValues.amountOut, returnValues.feeAmount)
+    return (sqrtRatioNextX96, amountIn, amountOut, feeAmount)
@@ -25,6 +25,19 @@ class TickMath:
   """
   MAX_SQRT_RATIO: int = 1461446703485210103287273052203988822378723970342
 
+  """
+   * An optional table of precomputed sqrt ratios consulted by #getSqrtRatioAtTick, see #useSqrtRatioTable
+  """
+  sqrtRatioTable = None
+
+  @staticmethod
+  def useSqrtRatioTable(table) -> None:
+    """
+    * Installs a table of precomputed sqrt ratios that #getSqrtRatioAtTick looks up before computing
+    * @param table a `SqrtRatioTable`, or None to always compute the sqrt ratio
+    """
+    TickMath.sqrtRatioTable = table
+
   @staticmethod
   def getSqrtRatioAtTick(tick: int) -> int:
     """
@@ -32,7 +45,19 @@ class TickMath:
     * @param tick the tick for which to compute the sqrt ratio
     """
     assert tick >= TickMath.MIN_TICK and tick <= TickMath.MAX_TICK and type(tick) == int, 'TICK'
-    
+
+    table = TickMath.sqrtRatioTable
+    if table is not None and tick % table.tickSpacing == 0:
+      return table.getSqrtRatioAtTick(tick)
+
+    return TickMath.computeSqrtRatioAtTick(tick)
+
+  @staticmethod
+  def computeSqrtRatioAtTick(tick: int) -> int:
+    """
+    * Computes the sqrt ratio as a Q64.96 for the given tick without consulting the sqrt ratio table
+    * @param tick the tick for which to compute the sqrt ratio
+    """
     absTick: int = abs(tick)
 
     ratio: int = 0xfffcb933bd6fad37aa2d162d1a594001 if (absTick & 0x1) != 0 else 0x100000000000000000000000000000000
@@ -110,6 +135,19 @@ class TickMath:
     """
     assert sqrtRatioX96 >= TickMath.MIN_SQRT_RATIO and sqrtRatioX96 < TickMath.MAX_SQRT_RATIO, 'SQRT_RATIO'
 
+    # only a full range table can locate every tick, coarser tables only bracket it
+    table = TickMath.sqrtRatioTable
+    if table is not None and table.tickSpacing == 1:
+      return table.getTickAtSqrtRatio(sqrtRatioX96)
+
+    return TickMath.computeTickAtSqrtRatio(sqrtRatioX96)
+
+  @staticmethod
+  def computeTickAtSqrtRatio(sqrtRatioX96: int) -> int:
+    """
+    * Computes the tick corresponding to a given sqrt ratio without searching the sqrt ratio table
+    * @param sqrtRatioX96 the sqrt ratio as a Q64.96 for which to compute the tick
+    """
     sqrtRatioX128 = sqrtRatioX96 << 32
 
     msb = mostSignificantBit(sqrtRatioX128)
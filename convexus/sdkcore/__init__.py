@@ -1,12 +1,14 @@
 from .constants import *
 
 from .utils.computePriceImpact import *
+from .utils.slots import *
 from .utils.sortedInsert import *
 from .utils.sqrt import *
 
 from .entities.currency import *
 from .entities.errors import *
 from .entities.icx import *
+from .entities.tokenMetadataCache import *
 
 from .entities.fractions.currencyAmount import *
 from .entities.fractions.fraction import *
@@ -1,14 +1,19 @@
 import asyncio
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import Union
+from typing import Callable, Dict, List, Tuple, Union
 from convexus.icontoolkit.validateAndParseAddress import validateAndParseAddress
 from convexus.icontoolkit.contract import Contract
+from convexus.sdkcore.utils.slots import slotsToDict
+from convexus.sdkcore.entities.tokenMetadataCache import TokenMetadata, TokenMetadataCache, TOKEN_METADATA_CACHE
 
 class BaseCurrency(metaclass=ABCMeta):
   """
   * A currency is any fungible financial instrument, including ICX, all IRC2 tokens, and other chain-native currencies
   """
 
+  __slots__ = ('decimals', 'symbol', 'name')
+
   @property
   @abstractmethod
   def isNative(self) -> bool:
@@ -73,6 +78,8 @@ class NativeCurrency (BaseCurrency, metaclass=ABCMeta):
   """
   * Represents the native currency of the chain on which it resides, e.g.
   """
+
+  __slots__ = ()
   
   @property
   def isNative(self) -> bool:
@@ -87,11 +94,86 @@ class NativeCurrency (BaseCurrency, metaclass=ABCMeta):
     return None
 
 
+class TokenRegistry:
+  """
+  * Gives every token address a small integer identity, so that tokens are compared and hashed by integer,
+  * and interns the tokens, so that a single instance of every token can be shared, e.g. by the pools.
+  * The identities are only valid in the process that assigned them.
+  """
+
+  def __init__(self) -> None:
+    # normalized address => identity
+    self.ids: Dict[str, int] = {}
+    # identity => normalized address
+    self.addresses: List[str] = []
+    # identity => interned token
+    self.tokens: Dict[int, 'Token'] = {}
+    # the identities are allocated under the lock, so concurrent threads never give two addresses the same one
+    self.__lock = threading.Lock()
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def __len__(self) -> int:
+    return len(self.addresses)
+
+  def __contains__(self, address: str) -> bool:
+    return address in self.ids
+
+  def parse(self, address: str) -> Tuple[str, int]:
+    """
+    * Validates and normalizes an address, unless it has already been registered, and returns it along with its identity
+    * @param address the address
+    """
+    id = self.ids.get(address)
+    if id is None:
+      address = validateAndParseAddress(address)
+      id = self.ids.get(address)
+      if id is None:
+        with self.__lock:
+          id = self.ids.get(address)
+          if id is None:
+            id = len(self.addresses)
+            self.addresses.append(address)
+            self.ids[address] = id
+    return address, id
+
+  def idOf(self, address: str) -> int:
+    """
+    * Returns the identity of an address, registering it if needed
+    * @param address the address
+    """
+    return self.parse(address)[1]
+
+  def intern(self, token: 'Token') -> 'Token':
+    """
+    * Returns the interned token with the same address, interning the given token if there's none
+    * @param token the token
+    """
+    return self.tokens.setdefault(self.idOf(token.address), token)
+
+  def get(self, address: str) -> 'Token | None':
+    """
+    * Returns the interned token with the given address, if any
+    * @param address the address
+    """
+    id = self.ids.get(address)
+    if id is None:
+      id = self.ids.get(validateAndParseAddress(address))
+    return self.tokens.get(id) if id is not None else None
+
+"""
+* The registry every token takes its identity from
+"""
+TOKEN_REGISTRY = TokenRegistry()
+
 class Token(BaseCurrency, metaclass=ABCMeta):
   """
   * Represents an IRC2 token with a unique address and some metadata.
   """
 
+  __slots__ = ('address', 'id')
+
   @property
   def isNative(self) -> bool:
     return False
@@ -101,34 +183,88 @@ class Token(BaseCurrency, metaclass=ABCMeta):
     return True
 
   @staticmethod
-  async def fromContract (contract: Contract) -> 'Token':
-    if Icx.isWrappedAddress(contract.address):
+  async def fromContract (contract: Contract, cache: TokenMetadataCache = TOKEN_METADATA_CACHE) -> 'Token':
+    """
+    * Returns the token of an IRC2 contract, reading its metadata from the chain unless it's cached
+    * @param contract The IRC2 contract of the token
+    * @param cache The cache of the token metadata
+    """
+    address = TOKEN_REGISTRY.parse(contract.address)[0]
+    if Icx.isWrappedAddress(address):
       return Icx().wrapped
 
-    decimals, name, symbol = await asyncio.gather(
-      contract.decimals(), 
-      contract.name(), 
-      contract.symbol()
-    )
-    return Token(contract.address, decimals, symbol, name)
+    metadata = cache.get(address)
+    if metadata is None:
+      decimals, name, symbol = await asyncio.gather(
+        contract.decimals(), 
+        contract.name(), 
+        contract.symbol()
+      )
+      metadata = TokenMetadata(decimals, symbol, name)
+      cache.set(address, metadata)
+
+    return Token(address, metadata.decimals, metadata.symbol, metadata.name)
+
+  @staticmethod
+  async def fromContracts (
+    addresses: List[str],
+    contractOf: Callable[[str], Contract],
+    cache: TokenMetadataCache = TOKEN_METADATA_CACHE
+  ) -> List['Token']:
+    """
+    * Returns the tokens of many IRC2 contracts, reading the metadata of the tokens missing from the cache concurrently,
+    * once per token
+    * @param addresses The addresses of the tokens
+    * @param contractOf Returns the IRC2 contract of an address, only called for the tokens missing from the cache
+    * @param cache The cache of the token metadata
+    * @returns The tokens, in the order of the addresses
+    """
+    addresses = [TOKEN_REGISTRY.parse(address)[0] for address in addresses]
+    missing = [address for address in cache.missing(addresses) if not Icx.isWrappedAddress(address)]
+
+    contracts = [contractOf(address) for address in missing]
+    results = await asyncio.gather(*[
+      asyncio.gather(contract.decimals(), contract.name(), contract.symbol())
+      for contract in contracts
+    ])
+    cache.update({
+      address: TokenMetadata(decimals, symbol, name)
+      for address, (decimals, name, symbol) in zip(missing, results)
+    })
+
+    tokens = []
+    for address in addresses:
+      if Icx.isWrappedAddress(address):
+        tokens.append(Icx().wrapped)
+      else:
+        metadata = cache.get(address)
+        tokens.append(Token(address, metadata.decimals, metadata.symbol, metadata.name))
+    return tokens
 
   def __init__(self, address: str, decimals: int, symbol: str = None, name: str = None):
     super().__init__(decimals, symbol, name)
     
     """
-    * The contract address on the chain on which this token lives
+    * The contract address on the chain on which this token lives, and its identity in the token registry
     """
-    self.address = validateAndParseAddress(address)
+    self.address, self.id = TOKEN_REGISTRY.parse(address)
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
+
+  def __hash__(self) -> int:
+    return self.id
+
+  def __reduce__(self):
+    # the identity is specific to a process, it's assigned again when the token is unpickled
+    return (type(self), (self.address, self.decimals, self.symbol, self.name))
 
   def equals(self, other: 'Currency') -> bool:
     """
     * Returns true if the two tokens are equivalent, i.e. have the same address.
     * @param other other token to compare
     """
-    return other.isToken and self.address == other.address
+    return other.isToken and self.id == other.id
 
   def sortsBefore(self, other: 'Token') -> bool:
     """
@@ -137,8 +273,9 @@ class Token(BaseCurrency, metaclass=ABCMeta):
     * @throws if the tokens have the same address
     * @throws if the tokens are on different chains
     """
-    assert self.address != other.address, 'ADDRESSES'
-    return self.address.lower() < other.address.lower()
+    assert self.id != other.id, 'ADDRESSES'
+    # the addresses are normalized to lowercase
+    return self.address < other.address
 
   @property
   def wrapped(self) -> 'Token':
@@ -155,6 +292,8 @@ class Icx(NativeCurrency):
   * ICX is the main usage of a 'native' currency, i.e. for ICON mainnet and all testnets
   """
 
+  __slots__ = ()
+
   wrappedAddress: str = 'cx1111111111111111111111111111111111111111'
 
   def __init__(self):
@@ -1,11 +1,14 @@
 from typing import Union
 from convexus.icontoolkit.constants import BigintIsh
-from convexus.sdkcore.entities.fractions.fraction import Fraction
+from convexus.sdkcore.entities.fractions.fraction import Fraction, formatFixed
 from convexus.sdkcore.entities.currency import Currency
 from convexus.sdkcore.constants import MaxUint256, Rounding
+from convexus.sdkcore.utils.slots import slotsToDict
 
 class CurrencyAmount(Fraction):
 
+  __slots__ = ('currency', 'decimalScale')
+
   @staticmethod
   def fromRawAmount(currency: Currency, rawAmount: BigintIsh) -> 'CurrencyAmount':
     """
@@ -24,7 +27,7 @@ class CurrencyAmount(Fraction):
     return CurrencyAmount(currency, numerator, denominator)
 
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
   def __eq__(self, __o) -> bool:
     return super().__eq__(__o) and self.currency.equals(__o.currency) and self.decimalScale == __o.decimalScale
@@ -58,7 +61,7 @@ class CurrencyAmount(Fraction):
       decimalPlaces = self.currency.decimals
 
     assert decimalPlaces <= self.currency.decimals, 'DECIMALS'
-    return super().divide(self.decimalScale).toFixed(decimalPlaces, rounding)
+    return formatFixed(self.numerator, self.denominator * self.decimalScale, decimalPlaces, rounding)
 
   def toExact(self) -> str:
     return self.toFixed(self.currency.decimals)
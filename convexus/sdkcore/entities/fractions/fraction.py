@@ -1,22 +1,43 @@
-from typing import Union
+from contextlib import contextmanager
+from typing import Iterator, List, Sequence, Union
 from convexus.icontoolkit.BigInt import BigInt
 from convexus.icontoolkit.constants import BigintIsh
 from convexus.sdkcore.constants import Rounding
-from decimal import Decimal, getcontext, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+from math import gcd
+
+def formatFixed(numerator: int, denominator: int, decimalPlaces: int, rounding: Rounding = Rounding.ROUND_HALF_UP) -> str:
+  """
+    Formats `numerator / denominator` with `decimalPlaces` decimal places, without trailing zeroes.
+    Uses integer arithmetic only, so unlike the `decimal` module it doesn't depend on any global context
+  """
+  assert decimalPlaces >= 0, f"{decimalPlaces} is negative."
+  # the sign is kept when the value rounds to zero, e.g. "-0"
+  sign = '-' if (numerator < 0) != (denominator < 0) else ''
+  numerator = abs(numerator)
+  denominator = abs(denominator)
+
+  scale = 10 ** decimalPlaces
+  scaled, remainder = divmod(numerator * scale, denominator)
+  if remainder and (rounding == Rounding.ROUND_UP or (rounding == Rounding.ROUND_HALF_UP and remainder * 2 >= denominator)):
+    scaled += 1
+
+  integer, fractional = divmod(scaled, scale)
+  if fractional == 0:
+    return sign + str(integer)
+
+  # Remove trailing zeroes
+  return sign + str(integer) + '.' + str(fractional).zfill(decimalPlaces).rstrip('0')
 
-toSignificantRounding = {
-  Rounding.ROUND_DOWN: ROUND_DOWN,
-  Rounding.ROUND_HALF_UP: ROUND_HALF_UP,
-  Rounding.ROUND_UP: ROUND_UP
-}
+class Fraction:
 
-toFixedRounding = {
-  Rounding.ROUND_DOWN: ROUND_DOWN,
-  Rounding.ROUND_HALF_UP: ROUND_HALF_UP,
-  Rounding.ROUND_UP: ROUND_UP
-}
+  __slots__ = ('numerator', 'denominator')
 
-class Fraction:
+  # When set, the results of add, subtract, multiply and divide whose numerator or denominator is longer than
+  # this many bits are reduced by their greatest common divisor, so chained operations don't keep growing
+  # their operands. The values are the same, only their representation changes. Disabled by default.
+  # It applies to the whole process: configure it once at startup, the library never changes it.
+  # Use Fraction.normalizing to change it temporarily.
+  NORMALIZE_THRESHOLD: int | None = None
 
   def __init__(self, numerator: BigintIsh, denominator: BigintIsh = 1):
     self.numerator = BigInt(numerator)
@@ -25,6 +46,39 @@ class Fraction:
   def __eq__(self, __o) -> bool:
     return __o is not None and self.equalTo(__o)
 
+  @staticmethod
+  def __normalized (numerator: int, denominator: int) -> 'Fraction':
+    threshold = Fraction.NORMALIZE_THRESHOLD
+    if threshold is not None and (numerator.bit_length() > threshold or denominator.bit_length() > threshold):
+      divisor = gcd(numerator, denominator)
+      if divisor > 1:
+        return Fraction(numerator // divisor, denominator // divisor)
+    return Fraction(numerator, denominator)
+
+  @staticmethod
+  @contextmanager
+  def normalizing (threshold: int | None) -> Iterator[None]:
+    """
+    * Sets Fraction.NORMALIZE_THRESHOLD for the duration of a with block, and restores the previous value after it.
+    * The threshold is process-wide, so don't run fraction arithmetic on other threads in the meantime
+    * @param threshold The threshold in bits, or None to disable the normalization
+    """
+    previous = Fraction.NORMALIZE_THRESHOLD
+    Fraction.NORMALIZE_THRESHOLD = threshold
+    try:
+      yield
+    finally:
+      Fraction.NORMALIZE_THRESHOLD = previous
+
+  def normalize (self) -> 'Fraction':
+    """
+    * Returns the same fraction reduced by the greatest common divisor of its numerator and denominator
+    """
+    divisor = gcd(self.numerator, self.denominator)
+    if divisor > 1:
+      return Fraction(self.numerator // divisor, self.denominator // divisor)
+    return Fraction(self.numerator, self.denominator)
+
   @staticmethod
   def tryParseFraction (fractionish: Union[BigintIsh, 'Fraction']) -> 'Fraction':
     if isinstance(fractionish, Fraction):
@@ -48,9 +102,9 @@ class Fraction:
     otherParsed = Fraction.tryParseFraction(other)
 
     if self.denominator == otherParsed.denominator:
-      return Fraction(self.numerator + otherParsed.numerator, self.denominator)
+      return Fraction.__normalized(self.numerator + otherParsed.numerator, self.denominator)
     
-    return Fraction (
+    return Fraction.__normalized (
         (self.numerator * otherParsed.denominator)
       + (otherParsed.numerator * self.denominator),
         self.denominator * otherParsed.denominator
@@ -60,9 +114,9 @@ class Fraction:
     otherParsed = Fraction.tryParseFraction(other)
 
     if (self.denominator == otherParsed.denominator):
-      return Fraction (self.numerator - otherParsed.numerator, self.denominator)
+      return Fraction.__normalized(self.numerator - otherParsed.numerator, self.denominator)
 
-    return Fraction (
+    return Fraction.__normalized (
           (self.numerator * otherParsed.denominator)
         - (otherParsed.numerator * self.denominator)
       ,
@@ -83,29 +137,30 @@ class Fraction:
 
   def multiply(self, other: Union[BigintIsh, 'Fraction']) -> 'Fraction':
     otherParsed = Fraction.tryParseFraction(other)
-    return Fraction (self.numerator * otherParsed.numerator, self.denominator * otherParsed.denominator)
+    return Fraction.__normalized(self.numerator * otherParsed.numerator, self.denominator * otherParsed.denominator)
 
   def divide(self, other: Union[BigintIsh, 'Fraction']) -> 'Fraction':
     otherParsed = Fraction.tryParseFraction(other)
-    return Fraction (self.numerator * otherParsed.denominator, self.denominator * otherParsed.numerator)
+    return Fraction.__normalized(self.numerator * otherParsed.denominator, self.denominator * otherParsed.numerator)
 
   def toFixed(self, decimalPlaces: int, rounding: Rounding = Rounding.ROUND_HALF_UP) -> str:
-    assert decimalPlaces >= 0, f"{decimalPlaces} is negative."
-    getcontext().prec = 256
-    getcontext().rounding = toFixedRounding[rounding]
-    d = Decimal(self.numerator) / Decimal(self.denominator)
-    formatted = ("{:." + str(decimalPlaces) + "f}").format(d)
-
-    # Remove trailing zeroes
-    numbers = formatted.split('.')
-    if len(numbers) == 1:
-      return formatted
-
-    rnumbers = numbers[1].rstrip("0")
-    if len(rnumbers) == 0:
-      return numbers[0]
-
-    return numbers[0] + '.' + rnumbers
+    return formatFixed(self.numerator, self.denominator, decimalPlaces, rounding)
+
+  @staticmethod
+  def formatMany(
+    fractions: Sequence['Fraction'],
+    decimalPlaces: int | None = None,
+    rounding: Rounding = Rounding.ROUND_HALF_UP
+  ) -> List[str]:
+    """
+    * Formats many fractions at once, e.g. all the prices or amounts of a response, with their own #toFixed
+    * @param fractions the fractions, amounts, prices or percents to format
+    * @param decimalPlaces the number of decimal places, the default of every #toFixed if none. Required by plain fractions
+    * @param rounding the rounding mode
+    """
+    if decimalPlaces is None:
+      return [fraction.toFixed(rounding=rounding) for fraction in fractions]
+    return [fraction.toFixed(decimalPlaces, rounding) for fraction in fractions]
 
   @property
   def asFraction(self) -> 'Fraction':
@@ -1,7 +1,8 @@
 
 from convexus.sdkcore.constants import Rounding
-from convexus.sdkcore.entities.fractions.fraction import Fraction
+from convexus.sdkcore.entities.fractions.fraction import Fraction, formatFixed
 from convexus.icontoolkit.constants import BigintIsh
+from convexus.sdkcore.utils.slots import slotsToDict
 
 ONE_HUNDRED = Fraction(100)
 
@@ -15,13 +16,15 @@ def toPercent(fraction: Fraction) -> 'Percent':
 
 class Percent(Fraction):
 
+  __slots__ = ('isPercent',)
+
   def __init__(self, numerator: int, denominator: int = 1):
     super().__init__(numerator, denominator)
     """ This boolean prevents a fraction from being interpreted as a Percent"""
     self.isPercent = True
   
   def __repr__(self) -> str:
-    return str(self.__dict__)
+    return str(slotsToDict(self))
 
   def add(self, other: Fraction | BigintIsh) -> 'Percent':
     return toPercent(super().add(other))
@@ -36,4 +39,4 @@ class Percent(Fraction):
     return toPercent(super().divide(other))
 
   def toFixed(self, decimalPlaces: int = 2, rounding: Rounding = Rounding.ROUND_HALF_UP) -> str:
-    return super().multiply(ONE_HUNDRED).toFixed(decimalPlaces, rounding)
\ No newline at end of file
+    return formatFixed(self.numerator * ONE_HUNDRED.numerator, self.denominator, decimalPlaces, rounding)
\ No newline at end of file
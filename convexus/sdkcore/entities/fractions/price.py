@@ -2,10 +2,13 @@ from convexus.icontoolkit import BigInt
 from convexus.icontoolkit.constants import BigintIsh
 from convexus.sdkcore.constants import Rounding
 from convexus.sdkcore.entities.currency import Currency
-from convexus.sdkcore.entities.fractions.fraction import Fraction
+from convexus.sdkcore.entities.fractions.fraction import Fraction, formatFixed
 from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
 
 class Price(Fraction):
+
+  __slots__ = ('baseCurrency', 'quoteCurrency', 'scalar')
+
   def __init__(self, baseCurrency: Currency, quoteCurrency: Currency, denominator: BigintIsh, numerator: BigintIsh):
     super().__init__(numerator, denominator)
     # input i.e. denominator
@@ -60,4 +63,10 @@ class Price(Fraction):
     return self.toFixed(decimalPlaces, rounding)
 
   def toFixed(self, decimalPlaces: int = 4, rounding: Rounding = Rounding.ROUND_HALF_UP) -> str:
-    return self.adjustedForDecimals.toFixed(decimalPlaces, rounding)
+    # same as #adjustedForDecimals, without building the intermediate fraction
+    return formatFixed(
+      self.numerator * self.scalar.numerator,
+      self.denominator * self.scalar.denominator,
+      decimalPlaces,
+      rounding
+    )
@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, List
+
+@dataclass
+class TokenMetadata:
+  decimals: int
+  symbol: str | None = None
+  name: str | None = None
+
+class TokenMetadataCache:
+  """
+  * Caches the metadata of the tokens, which never changes once a token is deployed, so it's only read once from the chain.
+  * The metadata is kept in memory, and optionally persisted to a JSON file, so it's also reused across runs.
+  * The tokens are identified by their normalized address.
+  """
+
+  def __init__(self, path: str | None = None) -> None:
+    """
+    * @param path The JSON file the metadata is loaded from if it exists, and saved to whenever it's updated
+    """
+    self.path = path
+    self.metadata: Dict[str, TokenMetadata] = {}
+    if path is not None and os.path.exists(path):
+      self.load(path)
+
+  def __repr__(self) -> str:
+    return str(self.__dict__)
+
+  def __len__(self) -> int:
+    return len(self.metadata)
+
+  def __contains__(self, address: str) -> bool:
+    return address in self.metadata
+
+  def get(self, address: str) -> TokenMetadata | None:
+    """
+    * Returns the metadata of a token, if cached
+    * @param address The normalized address of the token
+    """
+    return self.metadata.get(address)
+
+  def missing(self, addresses: List[str]) -> List[str]:
+    """
+    * Returns the addresses whose metadata isn't cached, without duplicates, in order
+    * @param addresses The normalized addresses of the tokens
+    """
+    return list(dict.fromkeys(address for address in addresses if address not in self.metadata))
+
+  def set(self, address: str, metadata: TokenMetadata) -> None:
+    """
+    * Caches the metadata of a token, and saves the cache if it's backed by a file
+    * @param address The normalized address of the token
+    * @param metadata The metadata of the token
+    """
+    self.update({address: metadata})
+
+  def update(self, metadata: Dict[str, TokenMetadata]) -> None:
+    """
+    * Caches the metadata of many tokens, and saves the cache once if it's backed by a file
+    * @param metadata The metadata of the tokens by normalized address
+    """
+    if len(metadata) == 0:
+      return
+
+    self.metadata.update(metadata)
+    if self.path is not None:
+      self.save(self.path)
+
+  def load(self, path: str) -> None:
+    """
+    * Adds the metadata saved to a file by #save
+    * @param path The JSON file
+    """
+    with open(path, 'r') as file:
+      for address, (decimals, symbol, name) in json.load(file).items():
+        self.metadata[address] = TokenMetadata(decimals, symbol, name)
+
+  def save(self, path: str) -> None:
+    """
+    * Saves the metadata to a file, replacing it atomically so a concurrent reader never sees a partial file.
+    * The metadata is written to a temporary file of its own first, so concurrent writers don't overwrite each other's
+    * @param path The JSON file
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', dir=directory, prefix=name + '.', suffix='.tmp', delete=False) as file:
+      try:
+        json.dump({
+          address: [metadata.decimals, metadata.symbol, metadata.name]
+          for address, metadata in self.metadata.items()
+        }, file)
+      except BaseException as error:
+        file.close()
+        os.remove(file.name)
+        raise error
+    os.replace(file.name, path)
+
+"""
+* The cache Token#fromContract and Token#fromContracts read the metadata of the tokens from by default
+"""
+TOKEN_METADATA_CACHE = TokenMetadataCache()
@@ -0,0 +1,24 @@
+from typing import Any, Dict
+
+def slotsToDict(instance: Any) -> Dict[str, Any]:
+  """
+    Returns the attributes of an instance whose class declares `__slots__`,
+    as the `__dict__` of the same class without slots would hold them:
+    the attributes of the base classes first, private names mangled, unset attributes omitted
+  """
+  attributes = {}
+  for cls in reversed(type(instance).__mro__):
+    slots = cls.__dict__.get('__slots__', ())
+    for name in ((slots,) if isinstance(slots, str) else slots):
+      if name in ('__dict__', '__weakref__'):
+        continue
+      if name.startswith('__') and not name.endswith('__'):
+        name = '_' + cls.__name__.lstrip('_') + name
+      try:
+        attributes[name] = getattr(instance, name)
+      except AttributeError:
+        pass
+
+  # attributes of subclasses that don't declare `__slots__`
+  attributes.update(getattr(instance, '__dict__', {}))
+  return attributes
@@ -0,0 +1,69 @@
+from convexus.sdk import Pool, FeeAmount, Route, Trade, RouteInfo, TradeConstructorArgs
+from convexus.sdk import TickMath
+from convexus.sdkcore import Token, CurrencyAmount, TradeType
+from convexus.sdkcore.entities.fractions.fraction import Fraction
+from convexus.sdk.entities.factoryProvider import PoolFactoryProvider
+import random, sys, timeit
+
+class PoolAddresses(PoolFactoryProvider):
+  # Fake pool addresses, the trades only need them to be unique
+  def getPool(self, tokenA, tokenB, fee):
+    return f"{tokenA.address}-{tokenB.address}-{fee}"
+
+def makeTokens(count: int):
+  return [Token('cx%040x' % (i + 1), 18, f"T{i}", f"Token {i}") for i in range(count)]
+
+def makePool(rng: random.Random, tokenA: Token, tokenB: Token) -> Pool:
+  token0, token1 = (tokenA, tokenB) if tokenA.sortsBefore(tokenB) else (tokenB, tokenA)
+  tick = rng.randint(-50000, 50000)
+  return Pool(token0, token1, FeeAmount.MEDIUM, TickMath.getSqrtRatioAtTick(tick), 10**24, tick)
+
+def makeRoutes(rng: random.Random, hops: int, count: int):
+  # routes between the same two tokens through distinct intermediary tokens
+  tokens = makeTokens(2 + count * (hops - 1))
+  input, output = tokens[0], tokens[1]
+  routes = []
+  for i in range(count):
+    path = [input] + tokens[2 + i * (hops - 1):2 + (i + 1) * (hops - 1)] + [output]
+    routes.append([makePool(rng, path[j], path[j + 1]) for j in range(hops)])
+  return input, output, routes
+
+def bench(label: str, fn, number: int):
+  seconds = min(timeit.repeat(fn, number=number, repeat=3))
+  print(f"  {label:<12} {seconds / number * 1e6:10.2f} us")
+
+def main(thresholds):
+  rng = random.Random(0)
+  poolFactoryProvider = PoolAddresses()
+
+  for hops in [3, 4]:
+    input, output, routes = makeRoutes(rng, hops, 3)
+
+    def midPrice():
+      return Route(routes[0], input, output).midPrice
+
+    def priceImpact():
+      # the trade amounts don't need to be simulated to rank the trade
+      swaps = []
+      for pools in routes:
+        route = Route(pools, input, output)
+        amountIn = CurrencyAmount.fromRawAmount(input, 10**18)
+        # a raw amount out, a bit below the mid price like a real swap
+        amountOut = CurrencyAmount.fromRawAmount(output, route.midPrice.quote(amountIn).quotient * 997 // 1000)
+        swaps.append(RouteInfo(route, amountIn, amountOut))
+      trade = Trade.createUncheckedTradeWithMultipleRoutes(poolFactoryProvider, TradeConstructorArgs(swaps, TradeType.EXACT_INPUT))
+      return trade.priceImpact
+
+    for threshold in thresholds:
+      with Fraction.normalizing(threshold):
+        label = 'off' if threshold is None else f"{threshold} bits"
+        price = midPrice()
+        impact = priceImpact()
+        print(f"{hops} hops, normalization {label}")
+        print(f"    midPrice    {price.numerator.bit_length():>5} / {price.denominator.bit_length():>5} bits")
+        print(f"    priceImpact {impact.numerator.bit_length():>5} / {impact.denominator.bit_length():>5} bits")
+        bench('midPrice', midPrice, 2000)
+        bench('priceImpact', priceImpact, 200)
+
+if __name__ == '__main__':
+  main([None] + [int(arg) for arg in sys.argv[1:]] if len(sys.argv) > 1 else [None, 256, 0])
@@ -1,6 +1,6 @@
 from typing import List
 from convexus.icontoolkit import Contract
-from convexus.sdk import Pool, Tick
+from convexus.sdk import Pool, Tick, TickListDataProvider
 from iconsdk.icon_service import IconService
 from iconsdk.providers.http_provider import HTTPProvider
 import asyncio, sys
@@ -26,23 +26,17 @@ async def main(poolAddress: str):
   contract = Contract(poolAddress, Contract.getAbi(iconService, poolAddress), iconService, iconService, 7)
   pool = await Pool.fromContract(contract)
   ticks = await getSortedInitializedTicks(contract)
-  # index => liquidity mapping
-  tickLiquidityMapping = {tick.index: tick.liquidityNet for tick in ticks}
-  
-  # Get min/max ticks
-  minTick = ticks[0].index
-  maxTick = ticks[-1].index
+  pool.tickDataProvider = TickListDataProvider(ticks, pool.tickSpacing)
 
-  # Build data to plot
+  # Build data to plot from the liquidity between every initialized tick
   # Start with 0 liquidity on the left of the chart
+  distribution = pool.liquidityDistribution()
   data = {}
   liquidity = 0
-  for tick in range(minTick, maxTick + 1, pool.tickSpacing):
-    liquidityDelta = tickLiquidityMapping.get(tick, 0)
-    if liquidityDelta != 0:
-      data[tick-pool.tickSpacing] = liquidity // 10**18
-      liquidity += liquidityDelta
-      data[tick] = liquidity // 10**18
+  for tick, nextLiquidity in zip(distribution.ticks, distribution.liquidities):
+    data[tick-pool.tickSpacing] = liquidity // 10**18
+    liquidity = nextLiquidity
+    data[tick] = liquidity // 10**18
 
   # remap tick key to price
   data = {int(tickToPrice(pool.token0, pool.token1, k).toFixed(0)): int(v) for k, v in data.items()}
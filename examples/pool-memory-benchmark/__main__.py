@@ -0,0 +1,83 @@
+from convexus.sdk import Pool, FeeAmount, TICK_SPACINGS, Tick, TickConstructorArgs, FeeGrowthOutside, Route
+from convexus.sdk import TickMath, nearestUsableTick
+from convexus.sdkcore import Token, CurrencyAmount, Fraction, Percent
+import gc, random, sys, tracemalloc
+
+def makeTokens(count: int):
+  return [Token('cx%040x' % (i + 1), 18, f"T{i}", f"Token {i}") for i in range(count)]
+
+def makeTicks(rng: random.Random, count: int, tickSpacing: int):
+  # Fully populated ticks, as read from the chain by Tick.fromCall
+  lower = nearestUsableTick(TickMath.MIN_TICK, tickSpacing) // tickSpacing
+  upper = nearestUsableTick(TickMath.MAX_TICK, tickSpacing) // tickSpacing
+  indexes = sorted(rng.sample(range(lower, upper), count))
+  ticks = []
+  for i in range(0, count, 2):
+    liquidity = rng.randint(10**18, 10**20)
+    for index, liquidityNet in [(indexes[i], liquidity), (indexes[i + 1], -liquidity)]:
+      ticks.append(Tick(TickConstructorArgs(
+        index * tickSpacing,
+        liquidity,
+        liquidityNet,
+        FeeGrowthOutside(rng.getrandbits(128), rng.getrandbits(128)),
+        rng.getrandbits(32),
+        rng.getrandbits(160),
+        rng.getrandbits(48),
+        True
+      )))
+  return ticks
+
+def measure(build, count: int) -> float:
+  """ Returns the bytes allocated per object, and keeps the objects alive while measuring """
+  gc.collect()
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  objects = [build(i) for i in range(count)]
+  after = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  del objects
+  return (after - before) / count
+
+def main(tickCount: int, poolCount: int):
+  rng = random.Random(0)
+  fee = FeeAmount.MEDIUM
+  tickSpacing = TICK_SPACINGS[fee]
+  tokens = makeTokens(poolCount + 1)
+  ticks = [makeTicks(rng, tickCount, tickSpacing) for _ in range(poolCount)]
+
+  def makePool(i: int) -> Pool:
+    # the ticks are built with the pool, like a pool loaded from the chain
+    tickCurrent = rng.randint(-50000, 50000)
+    pool = Pool(
+      tokens[i], tokens[i + 1], fee, TickMath.getSqrtRatioAtTick(tickCurrent), 10**24, tickCurrent,
+      [Tick(TickConstructorArgs(
+        tick.index, tick.liquidityGross, tick.liquidityNet,
+        FeeGrowthOutside(tick.feeGrowthOutside.feeGrowthOutside0X128, tick.feeGrowthOutside.feeGrowthOutside1X128),
+        tick.secondsOutside, tick.secondsPerLiquidityOutsideX128, tick.tickCumulativeOutside, tick.initialized
+      )) for tick in ticks[i]]
+    )
+    pool.token0Price, pool.token1Price
+    return pool
+
+  pools = [makePool(i) for i in range(poolCount)]
+  objects = {
+    f"Pool ({tickCount} ticks)": (makePool, poolCount),
+    'Tick': (lambda i: Tick(TickConstructorArgs(
+      ticks[0][i].index, ticks[0][i].liquidityGross, ticks[0][i].liquidityNet,
+      ticks[0][i].feeGrowthOutside, ticks[0][i].secondsOutside, ticks[0][i].secondsPerLiquidityOutsideX128,
+      ticks[0][i].tickCumulativeOutside, True
+    )), tickCount),
+    'Token': (lambda i: Token('cx%040x' % (i + 1), 18), 10000),
+    'Fraction': (lambda i: Fraction(i, 3), 10000),
+    'Percent': (lambda i: Percent(i, 3), 10000),
+    'CurrencyAmount': (lambda i: CurrencyAmount.fromRawAmount(tokens[0], i), 10000),
+    'Price': (lambda i: pools[i % poolCount].priceOf(pools[i % poolCount].token0).invert(), 10000),
+    'Route (2 hops)': (lambda i: Route([pools[0], pools[1]], tokens[0], tokens[2]), 10000),
+  }
+
+  print(f"Python {sys.version.split()[0]}, bytes per object")
+  for name, (build, count) in objects.items():
+    print(f"  {name:<20} {measure(build, count):12.0f}")
+
+if __name__ == '__main__':
+  main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000, int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,56 @@
+from convexus.sdk import Pool, FeeAmount, TICK_SPACINGS, TickConstructorArgs, TickListDataProvider, TickBitmapDataProvider
+from convexus.sdk import TickMath, nearestUsableTick, encodeSqrtRatioX96
+from convexus.sdkcore import Token
+import random, sys, timeit
+
+USDC = Token('cxa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48', 6, 'USDC', 'USD Coin')
+DAI = Token('cx6b175474e89094c44da98b954eedeac495271d0f', 18, 'DAI', 'DAI Stablecoin')
+
+def makeTicks(count: int, tickSpacing: int):
+  # Positions spread around the current tick, like a real pool
+  rng = random.Random(count)
+  width = min(count * tickSpacing * 4, TickMath.MAX_TICK)
+  lower = nearestUsableTick(-width, tickSpacing) // tickSpacing
+  upper = nearestUsableTick(width, tickSpacing) // tickSpacing
+  indexes = sorted(rng.sample(range(lower, upper), count))
+  ticks = []
+  for i in range(0, count, 2):
+    liquidity = rng.randint(10**18, 10**20)
+    ticks.append(TickConstructorArgs(index=indexes[i] * tickSpacing, liquidityNet=liquidity, liquidityGross=liquidity))
+    ticks.append(TickConstructorArgs(index=indexes[i + 1] * tickSpacing, liquidityNet=-liquidity, liquidityGross=liquidity))
+  return sorted(ticks, key=lambda t: t.index)
+
+def bench(label: str, fn, number: int):
+  seconds = min(timeit.repeat(fn, number=number, repeat=3))
+  print(f"  {label:<12} {seconds / number * 1e6:10.2f} us")
+
+def main(counts):
+  fee = FeeAmount.MEDIUM
+  tickSpacing = TICK_SPACINGS[fee]
+
+  for count in counts:
+    ticks = makeTicks(count, tickSpacing)
+    liquidity = sum(t.liquidityNet for t in ticks if t.index <= 0)
+    providers = {
+      'TickList': TickListDataProvider(ticks, tickSpacing),
+      'TickBitmap': TickBitmapDataProvider(ticks, tickSpacing),
+    }
+    rng = random.Random(0)
+    probes = [rng.randint(ticks[0].index, ticks[-1].index - 1) for _ in range(1000)]
+
+    print(f"{count} initialized ticks - nextInitializedTickWithinOneWord (per step)")
+    for name, provider in providers.items():
+      def step():
+        for tick in probes:
+          provider.nextInitializedTickWithinOneWord(tick, True, tickSpacing)
+          provider.nextInitializedTickWithinOneWord(tick, False, tickSpacing)
+      seconds = min(timeit.repeat(step, number=1, repeat=3))
+      print(f"  {name:<12} {seconds / (2 * len(probes)) * 1e6:10.2f} us")
+
+    print(f"{count} initialized ticks - Pool.swap crossing the whole range")
+    for name, provider in providers.items():
+      pool = Pool(USDC, DAI, fee, encodeSqrtRatioX96(1, 1), liquidity, 0, provider)
+      bench(name, lambda: pool.swap(True, 10**30), 3)
+
+if __name__ == '__main__':
+  main([int(arg) for arg in sys.argv[1:]] or [1000, 5000, 20000])
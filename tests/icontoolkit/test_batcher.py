@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from iconsdk.exception import JSONRPCException
+from convexus.icontoolkit.expect import expect
+from convexus.icontoolkit.batcher import RpcBatcher
+from convexus.icontoolkit.contract import Contract
+from convexus.icontoolkit.transport import AsyncHTTPTransport
+from convexus.sdk.artifacts.contracts.IRC2 import IIRC2
+
+from tests.icontoolkit.test_transport import JsonRpcNode, TOKEN
+
+OWNERS = ['hx%040x' % (i + 1) for i in range(100)]
+
+def run(test, **batcher):
+  async def main():
+    async with JsonRpcNode() as node:
+      async with AsyncHTTPTransport(node.url, maxConnections=4) as transport:
+        async with RpcBatcher(transport, **batcher) as rpcBatcher:
+          return await test(node, rpcBatcher)
+  return asyncio.run(main())
+
+class TestRpcBatcher(unittest.TestCase):
+
+  def test_sendsTheConcurrentRequestsInBatches(self):
+    async def test(node, batcher):
+      contract = Contract(TOKEN, IIRC2, None, None, 1, batcher)
+      balances = await asyncio.gather(*[contract.balanceOf(owner) for owner in OWNERS])
+      return balances, [len(post) for post in node.posts]
+
+    balances, batches = run(test, maxBatchSize=40)
+    expect(balances).toEqual([(i + 1) * 1000 for i in range(100)])
+    expect(batches).toEqual([40, 40, 20])
+
+  def test_flushesAfterTheInterval(self):
+    async def test(node, batcher):
+      first = await batcher.call(TOKEN, 'name')
+      second = await asyncio.gather(batcher.call(TOKEN, 'symbol'), batcher.call(TOKEN, 'decimals'))
+      return first, second, [len(post) for post in node.posts]
+
+    expect(run(test, flushInterval=0.01)).toEqual(('Token', ['TKN', '0x12'], [1, 2]))
+
+  def test_flush(self):
+    async def test(node, batcher):
+      request = asyncio.ensure_future(batcher.call(TOKEN, 'name'))
+      await asyncio.sleep(0)
+      batcher.flush()
+      return await asyncio.wait_for(request, 1)
+
+    # the request would wait for an hour without the flush
+    expect(run(test, flushInterval=3600)).toEqual('Token')
+
+  def test_throwsTheErrorOfItsOwnRequest(self):
+    async def test(node, batcher):
+      return await asyncio.gather(
+        batcher.call(TOKEN, 'name'),
+        batcher.call(TOKEN, 'unknown'),
+        batcher.call(TOKEN, 'symbol'),
+        return_exceptions=True
+      ), len(node.posts)
+
+    (name, error, symbol), posts = run(test)
+    expect((name, symbol, posts)).toEqual(('Token', 'TKN', 1))
+    expect(isinstance(error, JSONRPCException)).toBe(True)
+    expect(error.rpc_code).toEqual(-30032)
+
+  def test_throwsTheTransportErrorsToEveryRequest(self):
+    async def main():
+      # nothing listens on the port of a closed server
+      async with JsonRpcNode() as node:
+        url = node.url
+      async with RpcBatcher(AsyncHTTPTransport(url)) as batcher:
+        return await asyncio.gather(batcher.call(TOKEN, 'name'), batcher.call(TOKEN, 'symbol'), return_exceptions=True)
+
+    errors = asyncio.run(main())
+    expect([isinstance(error, OSError) for error in errors]).toEqual([True, True])
+
+  def test_closeSendsThePendingRequests(self):
+    async def main():
+      async with JsonRpcNode() as node:
+        async with AsyncHTTPTransport(node.url) as transport:
+          batcher = RpcBatcher(transport, flushInterval=3600)
+          request = asyncio.ensure_future(batcher.call(TOKEN, 'name'))
+          await asyncio.sleep(0)
+          await batcher.close()
+          return request.done(), await request
+
+    expect(asyncio.run(main())).toEqual((True, 'Token'))
+
+  def test_throwsWithEmptyBatches(self):
+    expect(lambda: RpcBatcher(AsyncHTTPTransport('http://localhost:9000/api/v3'), 0)).toThrow(AssertionError, 'MAX_BATCH_SIZE')
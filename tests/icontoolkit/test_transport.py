@@ -0,0 +1,177 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+from iconsdk.exception import JSONRPCException
+from convexus.icontoolkit.expect import expect
+from convexus.icontoolkit.contract import Contract
+from convexus.icontoolkit.transport import AsyncHTTPTransport
+from convexus.sdk.artifacts.contracts.IRC2 import IIRC2
+
+TOKEN = 'cx0000000000000000000000000000000000000001'
+OWNER = 'hx0000000000000000000000000000000000000002'
+
+class JsonRpcNode:
+  """
+  * A local ICON node stub answering the icx_call requests of the IRC2 readonly methods over HTTP/1.1
+  """
+
+  def __init__(self, requestsPerConnection: int | None = None, chunked: bool = False) -> None:
+    self.requestsPerConnection = requestsPerConnection
+    self.chunked = chunked
+    self.connections = 0
+    self.posts = []
+    self.hosts = []
+    self.server = None
+
+  async def __aenter__(self) -> 'JsonRpcNode':
+    self.server = await asyncio.start_server(self.serve, '127.0.0.1', 0)
+    return self
+
+  async def __aexit__(self, *args) -> None:
+    self.server.close()
+    await self.server.wait_closed()
+
+  @property
+  def url(self) -> str:
+    host, port = self.server.sockets[0].getsockname()[:2]
+    return f"http://{host}:{port}/api/v3"
+
+  def answer(self, request: dict) -> dict:
+    if request['method'] != 'icx_call':
+      return {'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -32601, 'message': 'Method not found'}}
+
+    data = request['params']['data']
+    results = {
+      'name': 'Token',
+      'symbol': 'TKN',
+      'decimals': '0x12',
+      'balanceOf': hex(int(data.get('params', {}).get('_owner', 'hx0')[2:], 16) * 1000)
+    }
+    if data['method'] not in results:
+      return {'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -30032, 'message': 'Method not found: ' + data['method']}}
+    return {'jsonrpc': '2.0', 'id': request['id'], 'result': results[data['method']]}
+
+  async def serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    self.connections += 1
+    served = 0
+    try:
+      while True:
+        requestLine = await reader.readline()
+        if not requestLine:
+          break
+        headers = {}
+        while (line := await reader.readline()) not in (b'\r\n', b''):
+          name, _, value = line.decode().partition(':')
+          headers[name.strip().lower()] = value.strip()
+        payload = json.loads(await reader.readexactly(int(headers['content-length'])))
+        self.posts.append(payload)
+        self.hosts.append(headers['host'])
+
+        response = [self.answer(request) for request in payload] if isinstance(payload, list) else self.answer(payload)
+        body = json.dumps(response).encode()
+        served += 1
+        close = self.requestsPerConnection is not None and served >= self.requestsPerConnection
+        head = 'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n' + ('Connection: close\r\n' if close else '')
+        if self.chunked:
+          middle = len(body) // 2
+          writer.write((head + 'Transfer-Encoding: chunked\r\n\r\n').encode())
+          for chunk in [body[:middle], body[middle:]]:
+            writer.write(b'%x\r\n' % len(chunk) + chunk + b'\r\n')
+          writer.write(b'0\r\n\r\n')
+        else:
+          writer.write((head + f"Content-Length: {len(body)}\r\n\r\n").encode() + body)
+        await writer.drain()
+        if close:
+          break
+    except (ConnectionError, asyncio.IncompleteReadError):
+      pass
+    finally:
+      writer.close()
+
+def run(test, **node):
+  async def main():
+    async with JsonRpcNode(**node) as server:
+      async with AsyncHTTPTransport(server.url, maxConnections=4) as transport:
+        return await test(server, transport)
+  return asyncio.run(main())
+
+class TestAsyncHTTPTransport(unittest.TestCase):
+
+  def test_call(self):
+    async def test(node, transport):
+      return await transport.call(TOKEN, 'symbol', {})
+    expect(run(test)).toEqual('TKN')
+
+  def test_reusesTheConnections(self):
+    async def test(node, transport):
+      results = await asyncio.gather(*[transport.call(TOKEN, 'decimals') for _ in range(100)])
+      return results, node.connections
+    results, connections = run(test)
+    expect(results).toEqual(['0x12'] * 100)
+    # at most maxConnections connections
+    expect(connections <= 4).toBe(True)
+
+  def test_reconnectsWhenTheServerClosesTheConnection(self):
+    async def test(node, transport):
+      return [await transport.call(TOKEN, 'name') for _ in range(5)], node.connections
+    expect(run(test, requestsPerConnection=2)).toEqual((['Token'] * 5, 3))
+
+  def test_chunkedResponses(self):
+    async def test(node, transport):
+      return await asyncio.gather(*[transport.call(TOKEN, 'name') for _ in range(10)])
+    expect(run(test, chunked=True)).toEqual(['Token'] * 10)
+
+  def test_throwsTheJsonRpcErrors(self):
+    async def test(node, transport):
+      await transport.call(TOKEN, 'unknown')
+    with self.assertRaises(JSONRPCException) as cm:
+      run(test)
+    expect(cm.exception.message).toEqual('Method not found: unknown')
+    expect(cm.exception.rpc_code).toEqual(-30032)
+
+  def test_requestIds(self):
+    async def test(node, transport):
+      await transport.call(TOKEN, 'name')
+      await transport.call(TOKEN, 'name')
+      return [post['id'] for post in node.posts]
+    ids = run(test)
+    expect(ids[1] > ids[0]).toBe(True)
+
+  def test_sendsThePortInTheHostHeader(self):
+    async def test(node, transport):
+      await transport.call(TOKEN, 'name')
+      return node.hosts, node.url.split('/')[2]
+    hosts, authority = run(test)
+    expect(hosts).toEqual([authority])
+    expect(AsyncHTTPTransport('https://ctz.solidwallet.io/api/v3').authority).toEqual('ctz.solidwallet.io')
+
+  def test_timesOutWhileConnecting(self):
+    async def unreachable(*args, **kwargs):
+      await asyncio.sleep(3600)
+
+    async def main():
+      transport = AsyncHTTPTransport('http://10.255.255.1:9000/api/v3', timeout=0.05)
+      with mock.patch('asyncio.open_connection', unreachable):
+        await transport.call(TOKEN, 'name')
+
+    with self.assertRaises(asyncio.TimeoutError):
+      asyncio.run(main())
+
+  def test_throwsWithUnsupportedScheme(self):
+    expect(lambda: AsyncHTTPTransport('ws://localhost:9000/api/v3')).toThrow(AssertionError, 'SCHEME')
+
+class TestContractTransport(unittest.TestCase):
+
+  def test_readonlyCalls(self):
+    async def test(node, transport):
+      contract = Contract(TOKEN, IIRC2, None, None, 1, transport)
+      return await asyncio.gather(contract.decimals(), contract.symbol(), contract.balanceOf(OWNER)), node.posts
+
+    (decimals, symbol, balance), posts = run(test)
+    expect((decimals, symbol, balance)).toEqual((18, 'TKN', 2000))
+    expect(posts[2]['params']).toEqual({
+      'to': TOKEN,
+      'dataType': 'call',
+      'data': {'method': 'balanceOf', 'params': {'_owner': OWNER}}
+    })
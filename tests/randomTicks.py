@@ -0,0 +1,19 @@
+import random
+from convexus.sdk.entities.tick import TickConstructorArgs
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.nearestUsableTick import nearestUsableTick
+
+def randomTicks(seed: int, count: int, tickSpacing: int):
+  """
+    Returns `count` random initialized ticks of a given tick spacing, as pairs of ticks whose net liquidity cancels out
+  """
+  rng = random.Random(seed)
+  minCompressed = nearestUsableTick(TickMath.MIN_TICK, tickSpacing) // tickSpacing
+  maxCompressed = nearestUsableTick(TickMath.MAX_TICK, tickSpacing) // tickSpacing
+  indexes = sorted(rng.sample(range(minCompressed, maxCompressed + 1), count))
+  ticks = []
+  for i in range(0, count, 2):
+    liquidity = rng.randint(1, 10**20)
+    ticks.append(TickConstructorArgs(index=indexes[i] * tickSpacing, liquidityNet=liquidity, liquidityGross=liquidity))
+    ticks.append(TickConstructorArgs(index=indexes[i + 1] * tickSpacing, liquidityNet=-liquidity, liquidityGross=liquidity))
+  return sorted(ticks, key=lambda t: t.index)
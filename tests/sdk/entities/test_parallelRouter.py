@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.entities.parallelRouter import ParallelRouter
+from convexus.sdk.entities.trade import BestTradeOptions, Trade
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+
+from tests.sdk.entities.test_trade import (
+  simplePool, poolFactoryProvider, token0, token1, token2, token3, ICX, WICX,
+  pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2
+)
+
+POOLS = [pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2]
+PAIRS = [(token0, token2), (token0, token3), (token3, WICX), (token1, token0), (ICX, token3)]
+
+def summary(trades):
+  return [
+    ([pool.fee for pool in trade.swaps[0].route.pools], [token.address for token in trade.swaps[0].route.tokenPath],
+    trade.inputAmount.quotient, trade.outputAmount.quotient)
+    for trade in trades
+  ]
+
+class TestParallelRouter(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.router = ParallelRouter(poolFactoryProvider, POOLS, 2).start()
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.router.close()
+
+  def test_bestTradeExactInMatchesSequentialSearch(self):
+    for tokenIn, tokenOut in PAIRS:
+      for maxNumResults, maxHops in [(1, 3), (2, 2), (4, 3)]:
+        amountIn = CurrencyAmount.fromRawAmount(tokenIn, 10000)
+        options = BestTradeOptions(maxNumResults, maxHops)
+        expect(summary(self.router.bestTradeExactIn(amountIn, tokenOut, options))).toEqual(
+          summary(Trade.bestTradeExactIn(poolFactoryProvider, POOLS, amountIn, tokenOut, options))
+        )
+
+  def test_bestTradeExactOutMatchesSequentialSearch(self):
+    for tokenIn, tokenOut in PAIRS:
+      for maxNumResults, maxHops in [(1, 3), (2, 2), (4, 3)]:
+        amountOut = CurrencyAmount.fromRawAmount(tokenOut, 100)
+        options = BestTradeOptions(maxNumResults, maxHops)
+        expect(summary(self.router.bestTradeExactOut(tokenIn, amountOut, options))).toEqual(
+          summary(Trade.bestTradeExactOut(poolFactoryProvider, POOLS, tokenIn, amountOut, options))
+        )
+
+  def test_tradesUseTheRouterPools(self):
+    trade = self.router.bestTradeExactIn(CurrencyAmount.fromRawAmount(token0, 10000), token2)[0]
+    expect(trade.swaps[0].route.pools[0]).toBe(pool_0_2)
+
+  def test_async(self):
+    amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+    expect(summary(asyncio.run(self.router.bestTradeExactInAsync(amountIn, token3)))).toEqual(
+      summary(Trade.bestTradeExactIn(poolFactoryProvider, POOLS, amountIn, token3))
+    )
+    amountOut = CurrencyAmount.fromRawAmount(token3, 100)
+    expect(summary(asyncio.run(self.router.bestTradeExactOutAsync(token0, amountOut)))).toEqual(
+      summary(Trade.bestTradeExactOut(poolFactoryProvider, POOLS, token0, amountOut))
+    )
+
+  def test_throwsWithMaxHopsZero(self):
+    expect(lambda:
+      self.router.bestTradeExactIn(CurrencyAmount.fromRawAmount(token0, 10000), token2, BestTradeOptions(3, 0))
+    ).toThrow(AssertionError, 'MAX_HOPS')
+
+class TestParallelRouterLifecycle(unittest.TestCase):
+
+  def test_contextManager(self):
+    with ParallelRouter(poolFactoryProvider, POOLS, 1) as router:
+      expect(router.started).toBe(True)
+    expect(router.started).toBe(False)
+
+  def test_startsOnDemand(self):
+    router = ParallelRouter(poolFactoryProvider, POOLS, 1)
+    try:
+      amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+      expect(summary(router.bestTradeExactIn(amountIn, token2))).toEqual(
+        summary(Trade.bestTradeExactIn(poolFactoryProvider, POOLS, amountIn, token2))
+      )
+      expect(router.started).toBe(True)
+    finally:
+      router.close()
+
+  def test_updatePools(self):
+    with ParallelRouter(poolFactoryProvider, POOLS, 1) as router:
+      router.updatePools([pool_0_1, pool_1_2])
+      expect(router.started).toBe(True)
+      trades = router.bestTradeExactIn(CurrencyAmount.fromRawAmount(token0, 10000), token2)
+      expect(summary(trades)).toEqual(summary(Trade.bestTradeExactIn(poolFactoryProvider, [pool_0_1, pool_1_2], CurrencyAmount.fromRawAmount(token0, 10000), token2)))
+
+  def test_updatePoolsKeepsTheWorkersWithTheSameTopology(self):
+    pools = list(POOLS)
+    with ParallelRouter(poolFactoryProvider, pools, 2) as router:
+      executor = router._ParallelRouter__executor
+      for reserve in [50000, 200000]:
+        pools[1] = simplePool(
+          CurrencyAmount.fromRawAmount(token0, 100000),
+          CurrencyAmount.fromRawAmount(token2, reserve)
+        )
+        router.updatePools(pools)
+        expect(router._ParallelRouter__executor).toBe(executor)
+
+        amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+        trades = router.bestTradeExactIn(amountIn, token2)
+        expect(summary(trades)).toEqual(summary(Trade.bestTradeExactIn(poolFactoryProvider, pools, amountIn, token2)))
+        expect(router.graph.pools[1]).toBe(pools[1])
+
+  def test_updatePoolsRestartsTheWorkersWithAnotherTopology(self):
+    with ParallelRouter(poolFactoryProvider, POOLS, 1) as router:
+      executor = router._ParallelRouter__executor
+      router.updatePools([pool_0_1, pool_1_2])
+      expect(router._ParallelRouter__executor is executor).toBe(False)
+
+  def test_throwsWithEmptyPools(self):
+    router = ParallelRouter(poolFactoryProvider, [], 1)
+    expect(lambda:
+      router.bestTradeExactIn(CurrencyAmount.fromRawAmount(token0, 10000), token2)
+    ).toThrow(AssertionError, 'POOLS')
+    expect(router.started).toBe(False)
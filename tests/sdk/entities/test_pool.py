@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 
 from convexus.icontoolkit.expect import expect
@@ -9,8 +10,10 @@ from convexus.sdk.entities.pool import Pool
 from convexus.sdk.utils.tickMath import TickMath
 
 from convexus.sdk.entities.tick import TickConstructorArgs
+from convexus.sdk.entities.tickListDataProvider import TickListDataProvider
 from convexus.sdk.utils.nearestUsableTick import nearestUsableTick
 from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+from convexus.sdkcore.entities.tokenMetadataCache import TokenMetadata, TokenMetadataCache
 
 from TestPoolFactoryProvider import TestPoolFactoryProvider
 
@@ -231,4 +234,156 @@ class TestPoolSwap(unittest.TestCase):
     inputAmount, _ = self.pool.getInputAmount(outputAmount)
     expect(inputAmount.currency.equals(DAI)).toBe(True)
     expect(inputAmount.quotient).toEqual(100)
-  
\ No newline at end of file
+  
+class TestPoolSwapMany(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.pool = Pool(USDC, DAI, FeeAmount.LOW, encodeSqrtRatioX96(1, 1), ONE_ICX * 4, 0, [
+      TickConstructorArgs(
+        index= nearestUsableTick(TickMath.MIN_TICK, TICK_SPACINGS[FeeAmount.LOW]),
+        liquidityNet= ONE_ICX,
+        liquidityGross= ONE_ICX
+      ),
+      TickConstructorArgs (
+        index=nearestUsableTick(-20, TICK_SPACINGS[FeeAmount.LOW]),
+        liquidityNet=ONE_ICX * 3,
+        liquidityGross=ONE_ICX * 3
+      ),
+      TickConstructorArgs (
+        index=nearestUsableTick(20, TICK_SPACINGS[FeeAmount.LOW]),
+        liquidityNet=ONE_ICX * -3,
+        liquidityGross=ONE_ICX * 3
+      ),
+      TickConstructorArgs (
+        index=nearestUsableTick(TickMath.MAX_TICK, TICK_SPACINGS[FeeAmount.LOW]),
+        liquidityNet=ONE_ICX * -1,
+        liquidityGross=ONE_ICX
+      )
+    ])
+
+  def test_matchesSwapForEachAmount(self):
+    amounts = [0, 1, 100, 98, 10**6, 10**18, 10**24, 100]
+    for zeroForOne in [True, False]:
+      results = self.pool.swapMany(zeroForOne, amounts)
+      expect(results).toEqual([self.pool.swap(zeroForOne, amount) for amount in amounts])
+
+  def test_matchesSwapForExactOutputAmounts(self):
+    amounts = [-98, -1, -10**17, -10**6, 5, -98]
+    for zeroForOne in [True, False]:
+      results = self.pool.swapMany(zeroForOne, amounts)
+      expect(results).toEqual([self.pool.swap(zeroForOne, amount) for amount in amounts])
+
+  def test_stopsAtThePriceLimit(self):
+    limit = TickMath.getSqrtRatioAtTick(-10)
+    amounts = [10**12, 10**15, 10**20]
+    results = self.pool.swapMany(True, amounts, limit)
+    expect(results).toEqual([self.pool.swap(True, amount, limit) for amount in amounts])
+    expect(results[2].sqrtRatioX96).toEqual(limit)
+
+  def test_throwsForInvalidPriceLimit(self):
+    expect(lambda: self.pool.swapMany(True, [100], self.pool.sqrtRatioX96)).toThrow(AssertionError, 'RATIO_CURRENT')
+
+class TestPoolDepth(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.pool = Pool(USDC, DAI, FeeAmount.LOW, encodeSqrtRatioX96(1, 1), ONE_ICX * 4, 0, [
+      TickConstructorArgs(index=-100, liquidityNet=ONE_ICX, liquidityGross=ONE_ICX),
+      TickConstructorArgs(index=-20, liquidityNet=ONE_ICX * 3, liquidityGross=ONE_ICX * 3),
+      TickConstructorArgs(index=20, liquidityNet=ONE_ICX * -3, liquidityGross=ONE_ICX * 3),
+      TickConstructorArgs(index=100, liquidityNet=ONE_ICX * -1, liquidityGross=ONE_ICX),
+    ])
+
+  def test_liquidityDistribution(self):
+    distribution = self.pool.liquidityDistribution()
+    expect(distribution.ticks).toEqual([-100, -20, 20, 100])
+    expect(distribution.liquidities).toEqual([ONE_ICX, ONE_ICX * 4, ONE_ICX, 0])
+
+  def test_liquidityDistributionRequiresTicks(self):
+    noTicksPool = Pool(USDC, DAI, FeeAmount.LOW, encodeSqrtRatioX96(1, 1), 0, 0)
+    expect(lambda: noTicksPool.liquidityDistribution()).toThrow(AssertionError, 'TICKS')
+
+  def test_liquidityDistributionFollowsTheTickDataProvider(self):
+    expect(self.pool.liquidityDistribution().ticks).toEqual([-100, -20, 20, 100])
+    self.pool.tickDataProvider = TickListDataProvider([
+      TickConstructorArgs(index=-50, liquidityNet=ONE_ICX, liquidityGross=ONE_ICX),
+      TickConstructorArgs(index=50, liquidityNet=ONE_ICX * -1, liquidityGross=ONE_ICX),
+    ], TICK_SPACINGS[FeeAmount.LOW])
+
+    distribution = self.pool.liquidityDistribution()
+    expect(distribution.ticks).toEqual([-50, 50])
+    expect(distribution.liquidities).toEqual([ONE_ICX, 0])
+
+  def test_depthCurveFollowsThePrice(self):
+    levels = [TickMath.getSqrtRatioAtTick(tick) for tick in [-50, 50]]
+    before = self.pool.depthCurve(levels)
+    self.pool.sqrtRatioX96 = TickMath.getSqrtRatioAtTick(-50)
+    self.pool.tickCurrent = -50
+    self.pool.liquidity = ONE_ICX
+
+    after = self.pool.depthCurve(levels)
+    expect(after.amountsOut[0]).toEqual(0)
+    expect(after.amountsOut[1] > before.amountsOut[1]).toBe(True)
+    expect(-self.pool.swap(False, 10**30, levels[1]).amountCalculated).toEqual(after.amountsOut[1])
+
+  def test_depthCurve(self):
+    levels = [TickMath.getSqrtRatioAtTick(tick) for tick in [-150, -100, -50, 50, 100, 150]]
+    curve = self.pool.depthCurve(levels)
+    expect(curve.sqrtPricesX96).toEqual(levels)
+
+    # the depth is cumulative on both sides and stops growing beyond the initialized ticks
+    expect(curve.amountsOut[0]).toEqual(curve.amountsOut[1])
+    expect(curve.amountsOut[1] > curve.amountsOut[2] > 0).toBe(True)
+    expect(0 < curve.amountsOut[3] < curve.amountsOut[4]).toBe(True)
+    expect(curve.amountsOut[4]).toEqual(curve.amountsOut[5])
+
+    for level, amountOut in zip(levels[1:5], curve.amountsOut[1:5]):
+      zeroForOne = level < self.pool.sqrtRatioX96
+      expect(-self.pool.swap(zeroForOne, 10**30, level).amountCalculated).toEqual(amountOut)
+
+class PoolContract:
+  """ The readonly methods of a pool contract used by Pool#fromContract """
+
+  def __init__(self) -> None:
+    self.iconService = None
+    self.debugService = None
+    self.nid = 1
+    self.transport = None
+
+  async def token0(self):
+    return USDC.address
+
+  async def token1(self):
+    return DAI.address
+
+  async def slot0(self):
+    return {
+      'feeProtocol': '0x0',
+      'observationCardinality': '0x1',
+      'observationCardinalityNext': '0x1',
+      'observationIndex': '0x0',
+      'sqrtPriceX96': hex(encodeSqrtRatioX96(1, 1)),
+      'tick': '0x0',
+      'unlocked': '0x1'
+    }
+
+  async def fee(self):
+    return FeeAmount.LOW
+
+  async def liquidity(self):
+    return 10**18
+
+class TestPoolFromContract(unittest.TestCase):
+
+  def test_readsTheTokensFromTheCache(self):
+    cache = TokenMetadataCache()
+    cache.update({
+      USDC.address: TokenMetadata(6, 'USDC', 'USD Coin'),
+      DAI.address: TokenMetadata(18, 'DAI', 'DAI Stablecoin')
+    })
+    # the token contracts can't be read, their metadata must come from the cache
+    fromContract = asyncio.run(Pool.fromContract(PoolContract(), cache))
+    expect(fromContract.token0).toEqual(DAI)
+    expect(fromContract.token1.symbol).toEqual('USDC')
+    expect((fromContract.fee, fromContract.liquidity, fromContract.tickCurrent)).toEqual((FeeAmount.LOW, 10**18, 0))
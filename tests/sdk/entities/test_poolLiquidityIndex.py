@@ -0,0 +1,101 @@
+import random
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.constants import FeeAmount, TICK_SPACINGS
+from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.tick import TickConstructorArgs
+from convexus.sdk.entities.poolLiquidityIndex import PoolLiquidityIndex
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.encodeSqrtRatioX96 import encodeSqrtRatioX96
+from convexus.sdkcore.entities.currency import Token
+
+from randomTicks import randomTicks
+
+USDC = Token('cxa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48', 6, 'USDC', 'USD Coin')
+DAI = Token('cx6b175474e89094c44da98b954eedeac495271d0f', 18, 'DAI', 'DAI Stablecoin')
+
+def randomPools(seed: int):
+  rng = random.Random(seed)
+  for fee in [FeeAmount.LOW, FeeAmount.MEDIUM, FeeAmount.HIGH]:
+    ticks = randomTicks(seed + fee, 60, TICK_SPACINGS[fee])
+    for _ in range(10):
+      tick = rng.randint(-40000, 40000)
+      liquidity = sum(t.liquidityNet for t in ticks if t.index <= tick)
+      yield rng, Pool(USDC, DAI, fee, TickMath.getSqrtRatioAtTick(tick), liquidity, tick, ticks)
+
+class TestPoolLiquidityIndex(unittest.TestCase):
+
+  def test_throwsForUnevenTickList(self):
+    expect(lambda:
+      PoolLiquidityIndex(
+        [
+          TickConstructorArgs(index=-1, liquidityNet=-1, liquidityGross=1),
+          TickConstructorArgs(index=1, liquidityNet=2, liquidityGross=1),
+        ],
+        1, FeeAmount.LOW, encodeSqrtRatioX96(1, 1)
+      )
+    ).toThrow(AssertionError, 'ZERO_NET')
+
+  def test_throwsWithoutTicks(self):
+    pool = Pool(USDC, DAI, FeeAmount.MEDIUM, encodeSqrtRatioX96(1, 1), 0, 0)
+    expect(lambda: PoolLiquidityIndex.fromPool(pool)).toThrow(AssertionError, 'TICKS')
+
+  def test_emptyPool(self):
+    index = PoolLiquidityIndex([], 1, FeeAmount.LOW, encodeSqrtRatioX96(1, 1))
+    expect(index.getAmountsToSqrtPrice(encodeSqrtRatioX96(1, 4))).toEqual((0, 0))
+    expect(index.getSqrtPriceAfterInput(True, 100)).toEqual(TickMath.MIN_SQRT_RATIO + 1)
+    expect(index.getSqrtPriceAfterInput(False, 100)).toEqual(TickMath.MAX_SQRT_RATIO - 1)
+
+  def test_liquidityAt(self):
+    index = PoolLiquidityIndex(
+      [
+        TickConstructorArgs(index=-60, liquidityNet=10, liquidityGross=10),
+        TickConstructorArgs(index=0, liquidityNet=5, liquidityGross=5),
+        TickConstructorArgs(index=0, liquidityNet=-2, liquidityGross=2),
+        TickConstructorArgs(index=60, liquidityNet=-13, liquidityGross=13),
+      ],
+      60, FeeAmount.MEDIUM, encodeSqrtRatioX96(1, 1)
+    )
+    expect(index.liquidityAt(TickMath.getSqrtRatioAtTick(-61))).toEqual(0)
+    expect(index.liquidityAt(TickMath.getSqrtRatioAtTick(-60))).toEqual(10)
+    expect(index.liquidityAt(TickMath.getSqrtRatioAtTick(0))).toEqual(13)
+    expect(index.liquidityAt(TickMath.getSqrtRatioAtTick(60))).toEqual(0)
+
+  def test_amountsToSqrtPriceMatchSwap(self):
+    for rng, pool in randomPools(1):
+      index = PoolLiquidityIndex.fromPool(pool)
+      target = TickMath.getSqrtRatioAtTick(pool.tickCurrent + rng.randint(-20000, 20000))
+      zeroForOne = target < pool.sqrtRatioX96
+      amountIn, amountOut = index.getAmountsToSqrtPrice(target)
+
+      # swaps stopped by the target price as a limit
+      result = pool.swap(zeroForOne, -10**40, target)
+      expect(result.sqrtRatioX96).toEqual(target)
+      expect(abs(result.amountCalculated - amountIn) <= 10).toBe(True)
+      result = pool.swap(zeroForOne, 10**40, target)
+      expect(result.sqrtRatioX96).toEqual(target)
+      expect(abs(-result.amountCalculated - amountOut) <= 10).toBe(True)
+
+  def test_sqrtPriceAfterOutputMatchesSwap(self):
+    for rng, pool in randomPools(2):
+      index = PoolLiquidityIndex.fromPool(pool)
+      zeroForOne = rng.random() < 0.5
+      amountOut = rng.randint(1, 10**22)
+      expected = pool.swap(zeroForOne, -amountOut).sqrtRatioX96
+      expect(index.getSqrtPriceAfterOutput(zeroForOne, amountOut)).toEqual(expected)
+
+  def test_sqrtPriceAfterInputMatchesSwap(self):
+    for rng, pool in randomPools(3):
+      index = PoolLiquidityIndex.fromPool(pool)
+      zeroForOne = rng.random() < 0.5
+      amountIn = rng.randint(1, 10**22)
+      expected = pool.swap(zeroForOne, amountIn).sqrtRatioX96
+      # the fee is rounded once per swap step, which only moves the price by a negligible amount
+      expect(abs(index.getSqrtPriceAfterInput(zeroForOne, amountIn) - expected) <= expected >> 64).toBe(True)
+
+  def test_amountsBeyondTheLiquidityGoToThePriceLimit(self):
+    for rng, pool in randomPools(4):
+      index = PoolLiquidityIndex.fromPool(pool)
+      expect(index.getSqrtPriceAfterInput(True, 10**60)).toEqual(TickMath.MIN_SQRT_RATIO + 1)
+      expect(index.getSqrtPriceAfterInput(False, 10**60)).toEqual(TickMath.MAX_SQRT_RATIO - 1)
+      expect(index.getSqrtPriceAfterInput(True, 0)).toEqual(pool.sqrtRatioX96)
@@ -0,0 +1,188 @@
+import asyncio
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.constants import FeeAmount
+from convexus.sdk.entities.poolLoader import PoolLoader
+from convexus.sdk.utils.encodeSqrtRatioX96 import encodeSqrtRatioX96
+from convexus.sdkcore.entities.currency import Icx
+from convexus.sdkcore.entities.tokenMetadataCache import TokenMetadata, TokenMetadataCache
+
+TOKENS = ['cx000000000000000000000000000000000000000' + str(i) for i in range(1, 5)]
+POOLS = {
+  'cx00000000000000000000000000000000000000a1': (TOKENS[0], TOKENS[1]),
+  'cx00000000000000000000000000000000000000a2': (TOKENS[0], TOKENS[2]),
+  'cx00000000000000000000000000000000000000a3': (TOKENS[1], TOKENS[2]),
+  'cx00000000000000000000000000000000000000a4': (TOKENS[2], Icx.wrappedAddress),
+}
+# 5 initialized ticks around the current tick
+TICKS = [(-120, 100), (-60, 50), (0, -20), (60, -30), (120, -100)]
+
+class Node:
+  """ Serves the readonly methods of the contracts, recording the requests and how many are in flight """
+
+  def __init__(self, delays: dict | None = None) -> None:
+    """
+    * @param delays The time in seconds the requests to a contract take, by address, 1ms by default
+    """
+    self.requests = []
+    self.inFlight = 0
+    self.maxInFlight = 0
+    self.delays = delays or {}
+
+  async def call(self, address: str, method: str, result):
+    self.requests.append((address, method))
+    self.inFlight += 1
+    self.maxInFlight = max(self.maxInFlight, self.inFlight)
+    await asyncio.sleep(self.delays.get(address, 0.001))
+    self.inFlight -= 1
+    return result
+
+class NodeContract:
+
+  def __init__(self, node: Node, address: str) -> None:
+    self.node = node
+    self.address = address
+
+  def __getattr__(self, method: str):
+    return lambda *args: self.node.call(self.address, method, self.result(method, *args))
+
+  def result(self, method: str, *args):
+    if self.address not in POOLS:
+      return {'decimals': 18, 'name': 'Token ' + self.address[-1], 'symbol': 'T' + self.address[-1]}[method]
+
+    if method == 'ticksInitializedRange':
+      start, end = args
+      # the ticks of a page aren't sorted
+      return [{
+        'index': hex(index),
+        'liquidityGross': hex(abs(liquidityNet)),
+        'liquidityNet': hex(liquidityNet),
+        'feeGrowthOutside0X128': '0x0',
+        'feeGrowthOutside1X128': '0x0',
+        'secondsOutside': '0x0',
+        'secondsPerLiquidityOutsideX128': '0x0',
+        'tickCumulativeOutside': '0x0',
+        'initialized': '0x1'
+      } for index, liquidityNet in reversed(TICKS[start:end])]
+
+    token0, token1 = POOLS[self.address]
+    return {
+      'token0': token0,
+      'token1': token1,
+      'slot0': {
+        'feeProtocol': '0x0',
+        'observationCardinality': '0x1',
+        'observationCardinalityNext': '0x1',
+        'observationIndex': '0x0',
+        'sqrtPriceX96': hex(encodeSqrtRatioX96(1, 1)),
+        'tick': '0x0',
+        'unlocked': '0x1'
+      },
+      'fee': FeeAmount.MEDIUM,
+      'liquidity': 70,
+      'ticksInitializedSize': len(TICKS)
+    }[method]
+
+class NodePoolLoader(PoolLoader):
+
+  def __init__(self, node: Node, **kwargs) -> None:
+    super().__init__(None, None, 1, **kwargs)
+    self.node = node
+
+  def contractOf(self, address, abi):
+    return NodeContract(self.node, address)
+
+class CountingTokenMetadataCache(TokenMetadataCache):
+  """ A file backed cache counting how many times it's saved, without writing any file """
+
+  def __init__(self) -> None:
+    super().__init__('tokens.json')
+    self.saves = 0
+
+  def save(self, path: str) -> None:
+    self.saves += 1
+
+async def loadAll(loader: PoolLoader, addresses, ticks: bool = False):
+  return [result async for result in loader.loadMany(addresses, ticks)]
+
+class TestPoolLoader(unittest.TestCase):
+
+  def test_loadsEveryPoolOnce(self):
+    node = Node()
+    loader = NodePoolLoader(node, tokenMetadataCache=TokenMetadataCache())
+    results = asyncio.run(loadAll(loader, list(POOLS) + list(POOLS)[:2]))
+    expect(sorted(address for address, _ in results)).toEqual(sorted(POOLS))
+    for address, pool in results:
+      tokens = sorted(POOLS[address])
+      expect([pool.token0.address, pool.token1.address]).toEqual(tokens)
+      expect((pool.fee, pool.liquidity, pool.tickCurrent)).toEqual((FeeAmount.MEDIUM, 70, 0))
+    expect(len([request for request in node.requests if request[0] in POOLS])).toEqual(5 * len(POOLS))
+
+  def test_readsEveryTokenOnce(self):
+    node = Node()
+    loader = NodePoolLoader(node, tokenMetadataCache=TokenMetadataCache())
+    results = dict(asyncio.run(loadAll(loader, list(POOLS))))
+    tokenRequests = [request for request in node.requests if request[0] not in POOLS]
+    # the wrapped ICX isn't read
+    expect(sorted(tokenRequests)).toEqual(sorted((token, method) for token in TOKENS[:3] for method in ['decimals', 'name', 'symbol']))
+    expect(results[list(POOLS)[3]].token1.symbol).toEqual('ICX')
+    expect(results[list(POOLS)[0]].token0.symbol).toEqual('T1')
+
+  def test_readsOnlyTheTokensMissingFromTheCache(self):
+    node = Node()
+    cache = TokenMetadataCache()
+    cache.update({TOKENS[0]: TokenMetadata(6, 'CACHED'), TOKENS[1]: TokenMetadata(6, 'CACHED')})
+    loader = NodePoolLoader(node, tokenMetadataCache=cache)
+    results = dict(asyncio.run(loadAll(loader, list(POOLS))))
+    expect(sorted(set(request[0] for request in node.requests if request[0] not in POOLS))).toEqual([TOKENS[2]])
+    expect(results[list(POOLS)[0]].token0.symbol).toEqual('CACHED')
+    expect(cache.get(TOKENS[2])).toEqual(TokenMetadata(18, 'T3', 'Token 3'))
+
+  def test_savesTheCacheOnce(self):
+    cache = CountingTokenMetadataCache()
+    asyncio.run(loadAll(NodePoolLoader(Node(), tokenMetadataCache=cache), list(POOLS)))
+    expect(len(cache)).toEqual(3)
+    expect(cache.saves).toEqual(1)
+
+  def test_yieldsThePoolsWithoutWaitingForTheSlowerOnes(self):
+    slow = list(POOLS)[0]
+    node = Node({slow: 0.5})
+    cache = CountingTokenMetadataCache()
+    loader = NodePoolLoader(node, tokenMetadataCache=cache)
+
+    async def run():
+      start = asyncio.get_running_loop().time()
+      loaded = []
+      async for address, _ in loader.loadMany(list(POOLS)):
+        loaded.append((address, asyncio.get_running_loop().time() - start))
+      return loaded
+
+    loaded = asyncio.run(run())
+    expect(loaded[-1][0]).toEqual(slow)
+    expect(all(elapsed < 0.25 for _, elapsed in loaded[:-1])).toBe(True)
+    expect(cache.saves).toEqual(1)
+
+  def test_loadsThePoolsOfDifferentlyCasedAddressesOnce(self):
+    node = Node()
+    loader = NodePoolLoader(node, tokenMetadataCache=TokenMetadataCache())
+    address = list(POOLS)[0]
+    results = asyncio.run(loadAll(loader, [address, address.upper(), ' ' + address]))
+    expect([result[0] for result in results]).toEqual([address])
+    expect(node.requests.count((address, 'slot0'))).toEqual(1)
+
+  def test_capsTheRequestsInFlight(self):
+    node = Node()
+    asyncio.run(loadAll(NodePoolLoader(node, maxConcurrency=3, tokenMetadataCache=TokenMetadataCache()), list(POOLS), True))
+    expect(node.maxInFlight).toEqual(3)
+
+  def test_loadsTheTicksInPages(self):
+    node = Node()
+    loader = NodePoolLoader(node, ticksPageSize=2, tokenMetadataCache=TokenMetadataCache())
+    results = asyncio.run(loadAll(loader, list(POOLS)[:1], True))
+    pool = results[0][1]
+    expect([tick.index for tick in pool.tickDataProvider.ticks]).toEqual([index for index, _ in TICKS])
+    expect([tick.liquidityNet for tick in pool.tickDataProvider.ticks]).toEqual([liquidityNet for _, liquidityNet in TICKS])
+    expect(node.requests.count((list(POOLS)[0], 'ticksInitializedRange'))).toEqual(3)
+
+  def test_throwsWithoutConcurrency(self):
+    expect(lambda: NodePoolLoader(Node(), maxConcurrency=0)).toThrow(AssertionError, 'MAX_CONCURRENCY')
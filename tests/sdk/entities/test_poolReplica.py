@@ -0,0 +1,202 @@
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.constants import FeeAmount
+from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.tick import TickConstructorArgs
+from convexus.sdk.entities.poolReplica import PoolReplica
+from convexus.sdk.entities.eventlogs import Swap, Mint, Burn
+from convexus.sdk.utils.encodeSqrtRatioX96 import encodeSqrtRatioX96
+from convexus.sdkcore.entities.currency import Token
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+
+ONE_ICX = 10**18
+USDC = Token('cxa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48', 6, 'USDC', 'USD Coin')
+DAI = Token('cx6b175474e89094c44da98b954eedeac495271d0f', 18, 'DAI', 'DAI Stablecoin')
+SENDER = 'hx0000000000000000000000000000000000000001'
+POOL = 'cx0000000000000000000000000000000000000002'
+
+def swapEventLog(amount0: int, amount1: int, pool: Pool):
+  return {
+    'scoreAddress': POOL,
+    'indexed': ['Swap(Address,Address,int,int,int,int,int)', SENDER, SENDER],
+    'data': [hex(amount0), hex(amount1), hex(pool.sqrtRatioX96), hex(pool.liquidity), hex(pool.tickCurrent)]
+  }
+
+def mintEventLog(tickLower: int, tickUpper: int, amount: int):
+  return {
+    'scoreAddress': POOL,
+    'indexed': ['Mint(Address,int,int,Address,int,int,int)', SENDER, hex(tickLower), hex(tickUpper)],
+    'data': [SENDER, hex(amount), hex(1), hex(2)]
+  }
+
+def burnEventLog(tickLower: int, tickUpper: int, amount: int):
+  return {
+    'scoreAddress': POOL,
+    'indexed': ['Burn(Address,int,int,int,int,int)', SENDER, hex(tickLower), hex(tickUpper)],
+    'data': [hex(amount), hex(1), hex(2)]
+  }
+
+def tickUpdateEventLog(index: int, liquidityGross: int, liquidityNet: int):
+  return {
+    'scoreAddress': POOL,
+    'indexed': ['TickUpdate(int,int,int,int,int,int,int,int,bool)', hex(index)],
+    'data': [hex(liquidityGross), hex(liquidityNet), hex(3), hex(4), hex(5), hex(6), hex(7), hex(int(liquidityGross > 0))]
+  }
+
+def intrinsicsUpdateEventLog(sqrtPriceX96: int, tick: int, liquidity: int):
+  return {
+    'scoreAddress': POOL,
+    'indexed': ['IntrinsicsUpdate(int,int,int)'],
+    'data': [hex(sqrtPriceX96), hex(tick), hex(liquidity)]
+  }
+
+def mintEventLogs(tickLower: int, tickUpper: int, amount: int, ticks: dict, liquidity: int):
+  """ The eventlogs of a mint in range, in the order the pool contract emits them """
+  return [
+    tickUpdateEventLog(tickLower, ticks[tickLower] + amount, ticks[tickLower] + amount),
+    tickUpdateEventLog(tickUpper, ticks[tickUpper] + amount, -ticks[tickUpper] - amount),
+    intrinsicsUpdateEventLog(encodeSqrtRatioX96(1, 1), 0, liquidity + amount),
+    mintEventLog(tickLower, tickUpper, amount)
+  ]
+
+class TestEventLogs(unittest.TestCase):
+
+  def test_decodeSwap(self):
+    pool = Pool(USDC, DAI, FeeAmount.MEDIUM, encodeSqrtRatioX96(1, 1), ONE_ICX, -1)
+    swap = Swap.fromEventLog(swapEventLog(100, -98, pool))
+    expect(swap.amount0).toEqual(100)
+    expect(swap.amount1).toEqual(-98)
+    expect(swap.sqrtPriceX96).toEqual(pool.sqrtRatioX96)
+    expect(swap.liquidity).toEqual(ONE_ICX)
+    expect(swap.tick).toEqual(-1)
+
+  def test_decodeMintAndBurn(self):
+    mint = Mint.fromEventLog(mintEventLog(-60, 120, ONE_ICX))
+    expect((mint.tickLower, mint.tickUpper, mint.amount, mint.amount0, mint.amount1)).toEqual((-60, 120, ONE_ICX, 1, 2))
+    burn = Burn.fromEventLog(burnEventLog(-60, 120, ONE_ICX))
+    expect((burn.tickLower, burn.tickUpper, burn.amount, burn.amount0, burn.amount1)).toEqual((-60, 120, ONE_ICX, 1, 2))
+
+class TestPoolReplica(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.replica = PoolReplica(USDC, DAI, FeeAmount.MEDIUM, encodeSqrtRatioX96(1, 1), ONE_ICX, 0, [
+      TickConstructorArgs(index=-600, liquidityNet=ONE_ICX, liquidityGross=ONE_ICX),
+      TickConstructorArgs(index=600, liquidityNet=ONE_ICX * -1, liquidityGross=ONE_ICX),
+    ], liquidityDeltas=True)
+
+  def test_mintInRange(self):
+    expect(self.replica.applyEventLog(mintEventLog(-60, 120, ONE_ICX))).toBe(True)
+    expect(self.replica.liquidity).toEqual(ONE_ICX * 2)
+    expect(self.replica.tickIndexes).toEqual([-600, -60, 120, 600])
+    expect(self.replica.ticks[-60].liquidityNet).toEqual(ONE_ICX)
+    expect(self.replica.ticks[120].liquidityNet).toEqual(ONE_ICX * -1)
+
+  def test_mintOutOfRange(self):
+    self.replica.applyEventLog(mintEventLog(60, 120, ONE_ICX))
+    expect(self.replica.liquidity).toEqual(ONE_ICX)
+    expect(self.replica.tickIndexes).toEqual([-600, 60, 120, 600])
+
+  def test_mintOnExistingTick(self):
+    self.replica.applyEventLog(mintEventLog(-600, 600, ONE_ICX))
+    expect(self.replica.liquidity).toEqual(ONE_ICX * 2)
+    expect(self.replica.tickIndexes).toEqual([-600, 600])
+    expect(self.replica.ticks[-600].liquidityGross).toEqual(ONE_ICX * 2)
+
+  def test_burnRemovesUninitializedTicks(self):
+    self.replica.applyEventLog(mintEventLog(-60, 120, ONE_ICX))
+    self.replica.applyEventLog(burnEventLog(-60, 120, ONE_ICX))
+    expect(self.replica.liquidity).toEqual(ONE_ICX)
+    expect(self.replica.tickIndexes).toEqual([-600, 600])
+
+  def test_burnMoreThanMinted(self):
+    expect(lambda: self.replica.applyEventLog(burnEventLog(-60, 120, ONE_ICX))).toThrow(AssertionError, 'LIQUIDITY_GROSS')
+
+  def test_ignoresUntrackedEventLogs(self):
+    expect(self.replica.applyEventLog({'indexed': ['Collect(Address,int,int,Address,int,int)'], 'data': []})).toBe(False)
+
+  def test_snapshotsAreImmutable(self):
+    before = self.replica.pool
+    expect(self.replica.pool).toBe(before)
+    self.replica.applyEventLog(mintEventLog(-60, 120, ONE_ICX))
+    after = self.replica.pool
+    expect(after is before).toBe(False)
+    expect(before.liquidity).toEqual(ONE_ICX)
+    expect(after.liquidity).toEqual(ONE_ICX * 2)
+    expect(len(before.tickDataProvider.ticks)).toEqual(2)
+    expect(len(after.tickDataProvider.ticks)).toEqual(4)
+
+  def test_swapsKeepTheTickDataProvider(self):
+    pool = self.replica.pool
+    _, next = pool.getOutputAmount(CurrencyAmount.fromRawAmount(USDC, 10**15))
+    self.replica.applyEventLog(swapEventLog(10**15, -1, next))
+    expect(self.replica.pool.tickDataProvider).toBe(pool.tickDataProvider)
+
+  def test_followsSwaps(self):
+    self.replica.applyEventLog(mintEventLog(-60, 120, ONE_ICX))
+    pool = self.replica.pool
+    for amount in [CurrencyAmount.fromRawAmount(USDC, 10**16), CurrencyAmount.fromRawAmount(DAI, 10**17), CurrencyAmount.fromRawAmount(USDC, 3 * 10**16)]:
+      _, pool = pool.getOutputAmount(amount)
+      self.replica.applyEventLog(swapEventLog(1, -1, pool))
+
+    snapshot = self.replica.pool
+    expect((snapshot.sqrtRatioX96, snapshot.liquidity, snapshot.tickCurrent)).toEqual((pool.sqrtRatioX96, pool.liquidity, pool.tickCurrent))
+    amount = CurrencyAmount.fromRawAmount(DAI, 10**16)
+    expect(snapshot.getOutputAmount(amount)[0]).toEqual(pool.getOutputAmount(amount)[0])
+
+  def test_fromPool(self):
+    replica = PoolReplica.fromPool(self.replica.pool)
+    expect(replica.tickIndexes).toEqual([-600, 600])
+    expect(replica.pool.token0).toEqual(self.replica.token0)
+
+  def test_ignoresTheAbsoluteUpdates(self):
+    expect(self.replica.applyEventLog(intrinsicsUpdateEventLog(encodeSqrtRatioX96(1, 1), 0, ONE_ICX * 5))).toBe(False)
+    expect(self.replica.applyEventLog(tickUpdateEventLog(-60, ONE_ICX, ONE_ICX))).toBe(False)
+    expect((self.replica.liquidity, self.replica.tickIndexes)).toEqual((ONE_ICX, [-600, 600]))
+
+class TestPoolReplicaAbsoluteUpdates(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.replica = PoolReplica(USDC, DAI, FeeAmount.MEDIUM, encodeSqrtRatioX96(1, 1), ONE_ICX, 0, [
+      TickConstructorArgs(index=-600, liquidityNet=ONE_ICX, liquidityGross=ONE_ICX),
+      TickConstructorArgs(index=600, liquidityNet=ONE_ICX * -1, liquidityGross=ONE_ICX),
+    ], address=POOL)
+
+  def test_mintInRange(self):
+    eventlogs = mintEventLogs(-60, 120, ONE_ICX, {-60: 0, 120: 0}, ONE_ICX)
+    expect([self.replica.applyEventLog(eventlog) for eventlog in eventlogs]).toEqual([True, True, True, False])
+    expect(self.replica.liquidity).toEqual(ONE_ICX * 2)
+    expect(self.replica.tickIndexes).toEqual([-600, -60, 120, 600])
+    expect((self.replica.ticks[-60].liquidityGross, self.replica.ticks[-60].liquidityNet)).toEqual((ONE_ICX, ONE_ICX))
+    expect((self.replica.ticks[120].liquidityGross, self.replica.ticks[120].liquidityNet)).toEqual((ONE_ICX, ONE_ICX * -1))
+    expect(self.replica.ticks[-60].feeGrowthOutside.feeGrowthOutside0X128).toEqual(3)
+
+  def test_mintOnExistingTicks(self):
+    self.replica.applyEventLogs(mintEventLogs(-600, 600, ONE_ICX, {-600: ONE_ICX, 600: ONE_ICX}, ONE_ICX))
+    expect(self.replica.liquidity).toEqual(ONE_ICX * 2)
+    expect(self.replica.tickIndexes).toEqual([-600, 600])
+    expect((self.replica.ticks[-600].liquidityGross, self.replica.ticks[-600].liquidityNet)).toEqual((ONE_ICX * 2, ONE_ICX * 2))
+    expect((self.replica.ticks[600].liquidityGross, self.replica.ticks[600].liquidityNet)).toEqual((ONE_ICX * 2, ONE_ICX * -2))
+
+  def test_burnRemovesUninitializedTicks(self):
+    self.replica.applyEventLogs(mintEventLogs(-60, 120, ONE_ICX, {-60: 0, 120: 0}, ONE_ICX))
+    self.replica.applyEventLogs([
+      tickUpdateEventLog(-60, 0, 0),
+      tickUpdateEventLog(120, 0, 0),
+      intrinsicsUpdateEventLog(encodeSqrtRatioX96(1, 1), 0, ONE_ICX),
+      burnEventLog(-60, 120, ONE_ICX)
+    ])
+    expect(self.replica.liquidity).toEqual(ONE_ICX)
+    expect(self.replica.tickIndexes).toEqual([-600, 600])
+
+  def test_ignoresTheEventLogsOfOtherContracts(self):
+    pool = self.replica.pool
+    _, next = pool.getOutputAmount(CurrencyAmount.fromRawAmount(USDC, 10**15))
+    eventlogs = [swapEventLog(10**15, -1, next), *mintEventLogs(-60, 120, ONE_ICX, {-60: 0, 120: 0}, ONE_ICX)]
+    for eventlog in eventlogs:
+      expect(self.replica.applyEventLog(dict(eventlog, scoreAddress='cx0000000000000000000000000000000000000003'))).toBe(False)
+
+    expect(self.replica.pool).toBe(pool)
+    expect(self.replica.applyEventLog(eventlogs[0])).toBe(True)
+    expect(self.replica.sqrtRatioX96).toEqual(next.sqrtRatioX96)
@@ -0,0 +1,93 @@
+import mmap
+import os
+import random
+import tempfile
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.constants import FeeAmount, TICK_SPACINGS
+from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.tickListDataProvider import TickListDataProvider
+from convexus.sdk.entities.poolSnapshot import PoolSnapshot, SnapshotTickDataProvider
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.encodeSqrtRatioX96 import encodeSqrtRatioX96
+from convexus.sdkcore.entities.currency import Token
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+
+from randomTicks import randomTicks
+
+USDC = Token('cxa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48', 6, 'USDC', 'USD Coin')
+DAI = Token('cx6b175474e89094c44da98b954eedeac495271d0f', 18, 'DAI', 'DAI Stablecoin')
+
+def randomPool(seed: int, fee: FeeAmount = FeeAmount.MEDIUM):
+  ticks = randomTicks(seed, 200, TICK_SPACINGS[fee])
+  tick = random.Random(seed).randint(-40000, 40000)
+  liquidity = sum(t.liquidityNet for t in ticks if t.index <= tick)
+  return Pool(USDC, DAI, fee, TickMath.getSqrtRatioAtTick(tick), liquidity, tick, ticks)
+
+class TestPoolSnapshot(unittest.TestCase):
+
+  def test_roundTrip(self):
+    pool = randomPool(1)
+    loaded = Pool.fromSnapshot(pool.toSnapshot())
+    expect(loaded.token0.address).toEqual(pool.token0.address)
+    expect((loaded.token1.decimals, loaded.token1.symbol, loaded.token1.name)).toEqual((pool.token1.decimals, pool.token1.symbol, pool.token1.name))
+    expect((loaded.fee, loaded.sqrtRatioX96, loaded.liquidity, loaded.tickCurrent)).toEqual((pool.fee, pool.sqrtRatioX96, pool.liquidity, pool.tickCurrent))
+    expect([(t.index, t.liquidityNet, t.liquidityGross) for t in loaded.tickDataProvider.ticks]).toEqual(
+      [(t.index, t.liquidityNet, t.liquidityGross) for t in pool.tickDataProvider.ticks]
+    )
+
+  def test_tokensWithoutSymbolAndName(self):
+    tokenA = Token('cx0000000000000000000000000000000000000001', 18)
+    tokenB = Token('cx0000000000000000000000000000000000000002', 0, 'B', '')
+    pool = Pool(tokenA, tokenB, FeeAmount.LOW, encodeSqrtRatioX96(1, 1), 0, 0, [])
+    loaded = Pool.fromSnapshot(pool.toSnapshot())
+    expect((loaded.token0.symbol, loaded.token0.name)).toEqual((None, None))
+    expect((loaded.token1.decimals, loaded.token1.symbol, loaded.token1.name)).toEqual((0, 'B', ''))
+    expect(len(loaded.tickDataProvider)).toEqual(0)
+
+  def test_snapshotOfASnapshotIsIdentical(self):
+    snapshot = randomPool(2).toSnapshot()
+    expect(Pool.fromSnapshot(snapshot).toSnapshot()).toEqual(snapshot)
+
+  def test_throwsForInvalidBuffers(self):
+    snapshot = randomPool(3).toSnapshot()
+    expect(lambda: Pool.fromSnapshot(b'CVXSQRT\x00' + snapshot[8:])).toThrow(AssertionError, 'SNAPSHOT_MAGIC')
+    expect(lambda: Pool.fromSnapshot(snapshot[:8] + b'\x02' + snapshot[9:])).toThrow(AssertionError, 'SNAPSHOT_VERSION')
+    expect(lambda: Pool.fromSnapshot(snapshot[:-1])).toThrow(AssertionError, 'SNAPSHOT_SIZE')
+
+  def test_providerMatchesTickList(self):
+    for fee in [FeeAmount.LOW, FeeAmount.MEDIUM, FeeAmount.HIGH]:
+      tickSpacing = TICK_SPACINGS[fee]
+      pool = randomPool(fee, fee)
+      provider = PoolSnapshot.decode(pool.toSnapshot()).tickDataProvider
+      expected = TickListDataProvider(pool.tickDataProvider.ticks, tickSpacing)
+      rng = random.Random(fee)
+      for _ in range(500):
+        tick = rng.randint(TickMath.MIN_TICK, TickMath.MAX_TICK - 1)
+        for lte in [True, False]:
+          if (lte and tick < expected.ticks[0].index) or (not lte and tick >= expected.ticks[-1].index):
+            continue
+          expect(provider.nextInitializedTickWithinOneWord(tick, lte, tickSpacing)).toEqual(
+            expected.nextInitializedTickWithinOneWord(tick, lte, tickSpacing)
+          )
+      for tick in expected.ticks:
+        expect(provider.getTick(tick.index).liquidityNet).toEqual(tick.liquidityNet)
+      expect(lambda: provider.getTick(expected.ticks[0].index + 1)).toThrow(AssertionError, 'NOT_CONTAINED')
+
+  def test_swapsMatchTheOriginalPool(self):
+    pool = randomPool(4)
+    loaded = Pool.fromSnapshot(pool.toSnapshot())
+    for amount in [CurrencyAmount.fromRawAmount(USDC, 10**20), CurrencyAmount.fromRawAmount(DAI, 10**22)]:
+      expect(loaded.getOutputAmount(amount)[0]).toEqual(pool.getOutputAmount(amount)[0])
+
+  def test_loadsFromAMemoryMap(self):
+    pool = randomPool(5)
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'pool.bin')
+      with open(path, 'wb') as f:
+        f.write(pool.toSnapshot())
+      with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+      loaded = Pool.fromSnapshot(buffer)
+      expect(isinstance(loaded.tickDataProvider, SnapshotTickDataProvider)).toBe(True)
+      expect(loaded.swap(True, 10**18)).toEqual(pool.swap(True, 10**18))
@@ -0,0 +1,75 @@
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.entities.quoteCache import QuoteCache
+from convexus.sdk.entities.route import Route
+from convexus.sdk.entities.trade import RouteAmount, Trade
+from convexus.sdkcore.constants import TradeType
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+
+from tests.sdk.entities.test_trade import (
+  poolFactoryProvider, token0, token1, token2, token3,
+  pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3
+)
+
+def moved(pool, token, amount):
+  return pool.getOutputAmount(CurrencyAmount.fromRawAmount(token, amount))[1]
+
+class TestQuoteCache(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.cache = QuoteCache(poolFactoryProvider)
+    self.amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+    self.amountOut = CurrencyAmount.fromRawAmount(token3, 1000)
+    self.cache.set('0-2', Trade.fromRoute(poolFactoryProvider, Route([pool_0_1, pool_1_2], token0, token2), self.amountIn, TradeType.EXACT_INPUT))
+    self.cache.set('0-3', Trade.fromRoute(poolFactoryProvider, Route([pool_0_3], token0, token3), self.amountIn, TradeType.EXACT_INPUT))
+    self.cache.set('out', Trade.fromRoute(poolFactoryProvider, Route([pool_0_1, pool_1_3], token0, token3), self.amountOut, TradeType.EXACT_OUTPUT))
+
+  def test_tracksDependencies(self):
+    expect(len(self.cache)).toEqual(3)
+    expect(self.cache.dependentsOf([pool_0_1])).toEqual({'0-2', 'out'})
+    expect(self.cache.dependentsOf([pool_0_3, pool_1_2])).toEqual({'0-2', '0-3'})
+    expect(self.cache.dependentsOf([pool_0_2])).toEqual(set())
+
+  def test_remove(self):
+    trade = self.cache.get('0-3')
+    expect(self.cache.remove('0-3')).toBe(trade)
+    expect('0-3' in self.cache).toBe(False)
+    expect(self.cache.dependentsOf([pool_0_3])).toEqual(set())
+    expect(self.cache.remove('0-3')).toEqual(None)
+
+  def test_setReplacesTheDependencies(self):
+    self.cache.set('0-3', Trade.fromRoute(poolFactoryProvider, Route([pool_0_1, pool_1_3], token0, token3), self.amountIn, TradeType.EXACT_INPUT))
+    expect(self.cache.dependentsOf([pool_0_3])).toEqual(set())
+    expect(self.cache.dependentsOf([pool_1_3])).toEqual({'0-3', 'out'})
+
+  def test_updateOnlyQuotesTheDependents(self):
+    unaffected = self.cache.get('0-3')
+    updated = moved(pool_0_1, token0, 20000)
+    expect(self.cache.update([updated])).toEqual(['0-2', 'out'])
+    expect(self.cache.get('0-3')).toBe(unaffected)
+
+    expected = Trade.fromRoute(poolFactoryProvider, Route([updated, pool_1_2], token0, token2), self.amountIn, TradeType.EXACT_INPUT)
+    expect(self.cache.get('0-2').outputAmount).toEqual(expected.outputAmount)
+    expect(self.cache.get('0-2').swaps[0].route.pools[0]).toBe(updated)
+    expect(self.cache.get('0-2').outputAmount.lessThan(Trade.fromRoute(poolFactoryProvider, Route([pool_0_1, pool_1_2], token0, token2), self.amountIn, TradeType.EXACT_INPUT).outputAmount)).toBe(True)
+
+    expected = Trade.fromRoute(poolFactoryProvider, Route([updated, pool_1_3], token0, token3), self.amountOut, TradeType.EXACT_OUTPUT)
+    expect(self.cache.get('out').inputAmount).toEqual(expected.inputAmount)
+    expect(self.cache.get('out').outputAmount).toEqual(self.amountOut)
+
+  def test_updateUnknownPool(self):
+    expect(self.cache.update([moved(pool_0_2, token0, 100)])).toEqual([])
+
+  def test_updateTradesWithMultipleRoutes(self):
+    trade = Trade.fromRoutes(poolFactoryProvider, [
+      RouteAmount(Route([pool_0_2], token0, token2), CurrencyAmount.fromRawAmount(token0, 6000)),
+      RouteAmount(Route([pool_0_1, pool_1_2], token0, token2), CurrencyAmount.fromRawAmount(token0, 4000)),
+    ], TradeType.EXACT_INPUT)
+    self.cache.set('split', trade)
+    updated = moved(pool_1_2, token1, 10000)
+    expect(self.cache.update([updated])).toEqual(['0-2', 'split'])
+    requoted = self.cache.get('split')
+    expect(requoted.inputAmount).toEqual(trade.inputAmount)
+    expect(requoted.swaps[0].outputAmount).toEqual(trade.swaps[0].outputAmount)
+    expect(requoted.swaps[1].outputAmount.equalTo(trade.swaps[1].outputAmount)).toBe(False)
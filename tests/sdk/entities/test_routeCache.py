@@ -0,0 +1,95 @@
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.entities.routeCache import RouteCache
+from convexus.sdk.entities.trade import BestTradeOptions, Trade
+from convexus.sdkcore.constants import TradeType
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+
+from tests.sdk.entities.test_trade import (
+  poolFactoryProvider, simplePool, token0, token1, token2, token3, ICX, WICX,
+  pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2
+)
+
+POOLS = [pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2]
+PAIRS = [(token0, token2), (token0, token3), (token3, WICX), (token1, token0), (ICX, token3), (token2, ICX)]
+
+def summary(trades):
+  return [
+    ([pool.fee for pool in trade.swaps[0].route.pools], [token.address for token in trade.swaps[0].route.tokenPath],
+    trade.inputAmount.quotient, trade.outputAmount.quotient)
+    for trade in trades
+  ]
+
+class TestRouteCache(unittest.TestCase):
+
+  def test_enumeratesEveryRoute(self):
+    cache = RouteCache(POOLS)
+    expect([route.pools for route in cache.getRoutes(token0, token2, 2)]).toEqual([
+      [pool_0_1, pool_1_2],
+      [pool_0_2],
+      [pool_wicx_0, pool_wicx_2]
+    ])
+    expect([route.pools for route in cache.getRoutes(token0, token2, 1)]).toEqual([[pool_0_2]])
+    expect(len(cache.getRoutes(token0, token2, 3))).toEqual(6)
+
+  def test_routesKeepTheCurrencies(self):
+    routes = RouteCache(POOLS).getRoutes(ICX, token1, 2)
+    expect(len(routes)).toEqual(3)
+    for route in routes:
+      expect(route.input).toEqual(ICX)
+      expect(route.output).toEqual(token1)
+
+  def test_enumeratesOnce(self):
+    cache = RouteCache(POOLS)
+    routes = cache.getRoutes(token0, token3, 3)
+    expect(cache.getRoutes(token0, token3, 3)).toBe(routes)
+    cache.getRoutes(token0, token3, 3, TradeType.EXACT_OUTPUT)
+    expect((cache.hits, cache.misses, len(cache))).toEqual((1, 2, 2))
+
+  def test_throwsWithMaxHopsZero(self):
+    expect(lambda: RouteCache(POOLS).getRoutes(token0, token2, 0)).toThrow(AssertionError, 'MAX_HOPS')
+
+  def test_bestTradeExactInMatchesSearch(self):
+    cache = RouteCache(POOLS)
+    for tokenIn, tokenOut in PAIRS:
+      for maxNumResults, maxHops in [(1, 3), (2, 2), (4, 3)]:
+        for amount in [100, 10000, 1000000]:
+          amountIn = CurrencyAmount.fromRawAmount(tokenIn, amount)
+          options = BestTradeOptions(maxNumResults, maxHops)
+          expect(summary(cache.bestTradeExactIn(poolFactoryProvider, amountIn, tokenOut, options))).toEqual(
+            summary(Trade.bestTradeExactIn(poolFactoryProvider, POOLS, amountIn, tokenOut, options))
+          )
+
+  def test_bestTradeExactOutMatchesSearch(self):
+    cache = RouteCache(POOLS)
+    for tokenIn, tokenOut in PAIRS:
+      for maxNumResults, maxHops in [(1, 3), (2, 2), (4, 3)]:
+        for amount in [10, 100, 1000]:
+          amountOut = CurrencyAmount.fromRawAmount(tokenOut, amount)
+          options = BestTradeOptions(maxNumResults, maxHops)
+          expect(summary(cache.bestTradeExactOut(poolFactoryProvider, tokenIn, amountOut, options))).toEqual(
+            summary(Trade.bestTradeExactOut(poolFactoryProvider, POOLS, tokenIn, amountOut, options))
+          )
+
+  def test_updatingThePoolStateKeepsTheRoutes(self):
+    cache = RouteCache(POOLS)
+    cache.getRoutes(token0, token2, 3)
+    _, updated = pool_0_2.getOutputAmount(CurrencyAmount.fromRawAmount(token0, 50000))
+    pools = [updated if pool is pool_0_2 else pool for pool in POOLS]
+    expect(cache.updatePools(pools)).toBe(False)
+    expect(len(cache)).toEqual(1)
+
+    amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+    expect(summary(cache.bestTradeExactIn(poolFactoryProvider, amountIn, token2))).toEqual(
+      summary(Trade.bestTradeExactIn(poolFactoryProvider, pools, amountIn, token2))
+    )
+    expect(cache.misses).toEqual(1)
+    expect(any(updated in route.pools for route in cache.getRoutes(token0, token2, 3))).toBe(True)
+
+  def test_changingThePoolUniverseClearsTheRoutes(self):
+    cache = RouteCache(POOLS)
+    cache.getRoutes(token0, token2, 3)
+    pool_2_3 = simplePool(CurrencyAmount.fromRawAmount(token2, 100000), CurrencyAmount.fromRawAmount(token3, 100000))
+    expect(cache.updatePools(POOLS + [pool_2_3])).toBe(True)
+    expect(len(cache)).toEqual(0)
+    expect(any(pool_2_3 in route.pools for route in cache.getRoutes(token0, token2, 3))).toBe(True)
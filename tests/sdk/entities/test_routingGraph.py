@@ -0,0 +1,116 @@
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.entities.routingGraph import RoutingGraph
+from convexus.sdk.entities.swapCache import SwapCache
+from convexus.sdk.entities.trade import BestTradeOptions, Trade
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+from convexus.sdkcore.entities.fractions.fraction import Fraction
+
+from tests.sdk.entities.test_trade import (
+  poolFactoryProvider, token0, token1, token2, token3, WICX,
+  pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2
+)
+
+POOLS = [pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2]
+
+def routes(trades):
+  return [[pool.fee for pool in trade.swaps[0].route.pools] + [token.address for token in trade.swaps[0].route.tokenPath] for trade in trades]
+
+class TestRoutingGraph(unittest.TestCase):
+
+  def test_listsPoolsPerTokenInOrder(self):
+    graph = RoutingGraph(POOLS)
+    expect(len(graph)).toEqual(len(POOLS))
+    expect(graph.poolsOf(token0)).toEqual([0, 1, 2, 5])
+    expect(graph.poolsOf(token3)).toEqual([2, 4])
+    expect(graph.poolsOf(WICX)).toEqual([5, 6, 7])
+
+  def test_unknownToken(self):
+    expect(RoutingGraph([pool_0_1]).poolsOf(token2)).toEqual([])
+
+  def test_throwsWithEmptyGraph(self):
+    expect(lambda:
+      Trade.bestTradeExactIn(poolFactoryProvider, RoutingGraph([]), CurrencyAmount.fromRawAmount(token0, 10000), token2)
+    ).toThrow(AssertionError, 'POOLS')
+
+  def test_bestTradeExactInMatchesPoolList(self):
+    graph = RoutingGraph(POOLS)
+    for tokenIn, tokenOut in [(token0, token2), (token0, token3), (token3, WICX), (token1, token0)]:
+      for maxHops in [1, 2, 3]:
+        amountIn = CurrencyAmount.fromRawAmount(tokenIn, 10000)
+        options = BestTradeOptions(maxNumResults=4, maxHops=maxHops)
+        expect(routes(Trade.bestTradeExactIn(poolFactoryProvider, graph, amountIn, tokenOut, options))).toEqual(
+          routes(Trade.bestTradeExactIn(poolFactoryProvider, POOLS, amountIn, tokenOut, options))
+        )
+
+  def test_bestTradeExactOutMatchesPoolList(self):
+    graph = RoutingGraph(POOLS)
+    for tokenIn, tokenOut in [(token0, token2), (token0, token3), (token3, WICX), (token1, token0)]:
+      for maxHops in [1, 2, 3]:
+        amountOut = CurrencyAmount.fromRawAmount(tokenOut, 100)
+        options = BestTradeOptions(maxNumResults=4, maxHops=maxHops)
+        expect(routes(Trade.bestTradeExactOut(poolFactoryProvider, graph, tokenIn, amountOut, options))).toEqual(
+          routes(Trade.bestTradeExactOut(poolFactoryProvider, POOLS, tokenIn, amountOut, options))
+        )
+
+  def test_midPriceBounds(self):
+    bounds = RoutingGraph(POOLS).midPriceBounds(token1, 2)
+    expect(bounds[0]).toEqual({token1.address: Fraction(1)})
+    expect(bounds[1][token0.address]).toEqual(pool_0_1.priceOf(token0).asFraction)
+    expect(token3.address in bounds[0]).toBe(False)
+    # two hops improve or keep the rate of a single hop
+    expect(bounds[2][token0.address].lessThan(bounds[1][token0.address])).toBe(False)
+    expect(RoutingGraph([pool_0_2]).midPriceBounds(token1, 3)[3]).toEqual({token1.address: Fraction(1)})
+
+  def test_midPriceBoundsBoundTheOutput(self):
+    graph = RoutingGraph(POOLS)
+    for tokenIn, tokenOut in [(token0, token2), (token0, token3), (token3, WICX), (token1, token0)]:
+      bounds = graph.midPriceBounds(tokenOut, 3)
+      amountIn = CurrencyAmount.fromRawAmount(tokenIn, 10000)
+      for trade in Trade.bestTradeExactIn(poolFactoryProvider, graph, amountIn, tokenOut, BestTradeOptions(10, 3)):
+        expect(bounds[3][tokenIn.address].multiply(amountIn.quotient).lessThan(trade.outputAmount.quotient)).toBe(False)
+
+  def test_pruningMatchesExhaustiveSearch(self):
+    graph = RoutingGraph(POOLS)
+    for tokenIn, tokenOut in [(token0, token2), (token0, token3), (token3, WICX), (token1, token0), (WICX, token3)]:
+      for maxNumResults in [1, 2, 4]:
+        for maxHops in [1, 2, 3]:
+          for amount in [100, 10000, 1000000]:
+            amountIn = CurrencyAmount.fromRawAmount(tokenIn, amount)
+            expect(routes(Trade.bestTradeExactIn(poolFactoryProvider, graph, amountIn, tokenOut, BestTradeOptions(maxNumResults, maxHops, True)))).toEqual(
+              routes(Trade.bestTradeExactIn(poolFactoryProvider, graph, amountIn, tokenOut, BestTradeOptions(maxNumResults, maxHops)))
+            )
+
+  def test_pruningSkipsSimulations(self):
+    graph = RoutingGraph(POOLS)
+    amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+    pruned, exhaustive = SwapCache(), SwapCache()
+    Trade.bestTradeExactIn(poolFactoryProvider, graph, amountIn, token3, BestTradeOptions(1, 3, True), cache=pruned)
+    Trade.bestTradeExactIn(poolFactoryProvider, graph, amountIn, token3, BestTradeOptions(1, 3), cache=exhaustive)
+    expect(pruned.misses < exhaustive.misses).toBe(True)
+
+  def test_positionsOf(self):
+    graph = RoutingGraph(POOLS)
+    expect(graph.positionsOf([])).toEqual(set())
+    expect(graph.positionsOf([pool_1_2, pool_0_1])).toEqual({0, 3})
+    expect(RoutingGraph([pool_0_1]).positionsOf([pool_1_2])).toEqual(set())
+
+  def test_currentPoolsAreNotRevisited(self):
+    graph = RoutingGraph(POOLS)
+    amountOut, _ = pool_0_1.getOutputAmount(CurrencyAmount.fromRawAmount(token0, 10000))
+    trades = Trade.bestTradeExactIn(poolFactoryProvider, graph, CurrencyAmount.fromRawAmount(token0, 10000), token2, BestTradeOptions(10, 2), [pool_0_1], amountOut)
+    expect(len(trades) > 0).toBe(True)
+    for trade in trades:
+      expect(trade.swaps[0].route.pools.count(pool_0_1)).toEqual(1)
+
+  def test_pathsExactIn(self):
+    graph = RoutingGraph(POOLS)
+    expect(graph.pathsExactIn(token0, token2, 1)).toEqual([[1]])
+    expect(graph.pathsExactIn(token0, token2, 2)).toEqual([[0, 3], [1], [5, 7]])
+    expect(graph.pathsExactIn(token2, token0, 2)).toEqual([[1], [3, 0], [7, 5]])
+    expect(RoutingGraph([pool_0_1]).pathsExactIn(token0, token2, 3)).toEqual([])
+
+  def test_pathsExactOut(self):
+    graph = RoutingGraph(POOLS)
+    expect(graph.pathsExactOut(token0, token2, 2)).toEqual([[1], [0, 3], [5, 7]])
+    expect(sorted(graph.pathsExactOut(token0, token2, 3))).toEqual(sorted(graph.pathsExactIn(token0, token2, 3)))
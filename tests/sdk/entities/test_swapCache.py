@@ -0,0 +1,83 @@
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.entities.route import Route
+from convexus.sdk.entities.swapCache import SwapCache
+from convexus.sdk.entities.trade import BestTradeOptions, RouteAmount, Trade
+from convexus.sdkcore.constants import TradeType
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+
+from tests.sdk.entities.test_trade import (
+  poolFactoryProvider, token0, token1, token2, token3, WICX,
+  pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2
+)
+
+POOLS = [pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2]
+
+def amounts(trades):
+  return [(trade.inputAmount.quotient, trade.outputAmount.quotient) for trade in trades]
+
+class TestSwapCache(unittest.TestCase):
+
+  def test_simulatesOnce(self):
+    cache = SwapCache()
+    amount = CurrencyAmount.fromRawAmount(token0, 10000)
+    first = cache.getOutputAmount(pool_0_1, amount)
+    second = cache.getOutputAmount(pool_0_1, CurrencyAmount.fromRawAmount(token0, 10000))
+    expect(second).toBe(first)
+    expect(first[0]).toEqual(pool_0_1.getOutputAmount(amount)[0])
+    expect((cache.hits, cache.misses, len(cache))).toEqual((1, 1, 1))
+
+  def test_keysByPoolDirectionAndAmount(self):
+    cache = SwapCache()
+    cache.getOutputAmount(pool_0_1, CurrencyAmount.fromRawAmount(token0, 10000))
+    cache.getOutputAmount(pool_0_1, CurrencyAmount.fromRawAmount(token1, 10000))
+    cache.getOutputAmount(pool_0_1, CurrencyAmount.fromRawAmount(token0, 10001))
+    cache.getOutputAmount(pool_0_2, CurrencyAmount.fromRawAmount(token0, 10000))
+    cache.getInputAmount(pool_0_1, CurrencyAmount.fromRawAmount(token0, 10000))
+    expect((cache.hits, cache.misses, len(cache))).toEqual((0, 5, 5))
+
+  def test_clear(self):
+    cache = SwapCache()
+    cache.getInputAmount(pool_0_1, CurrencyAmount.fromRawAmount(token1, 100))
+    cache.getInputAmount(pool_0_1, CurrencyAmount.fromRawAmount(token1, 100))
+    cache.clear()
+    expect((cache.hits, cache.misses, len(cache))).toEqual((0, 0, 0))
+
+  def test_fromRouteReusesTheSearch(self):
+    cache = SwapCache()
+    amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+    trades = Trade.bestTradeExactIn(poolFactoryProvider, POOLS, amountIn, token2, BestTradeOptions(3, 3), cache=cache)
+    misses = cache.misses
+    for trade in trades:
+      Trade.fromRoute(poolFactoryProvider, trade.swaps[0].route, amountIn, TradeType.EXACT_INPUT, cache)
+    expect(cache.misses).toEqual(misses)
+
+  def test_bestTradeExactInIsUnchanged(self):
+    for tokenIn, tokenOut in [(token0, token2), (token0, token3), (token3, WICX), (WICX, token1)]:
+      amountIn = CurrencyAmount.fromRawAmount(tokenIn, 10000)
+      cache = SwapCache()
+      cached = Trade.bestTradeExactIn(poolFactoryProvider, POOLS, amountIn, tokenOut, BestTradeOptions(4, 3), cache=cache)
+      expect(amounts(cached)).toEqual(amounts([
+        Trade.fromRoute(poolFactoryProvider, trade.swaps[0].route, amountIn, TradeType.EXACT_INPUT) for trade in cached
+      ]))
+      # building the trades only hits the cache
+      expect(cache.hits >= sum(len(trade.swaps[0].route.pools) for trade in cached)).toBe(True)
+
+  def test_bestTradeExactOutIsUnchanged(self):
+    for tokenIn, tokenOut in [(token0, token2), (token0, token3), (token3, WICX), (WICX, token1)]:
+      amountOut = CurrencyAmount.fromRawAmount(tokenOut, 100)
+      cache = SwapCache()
+      cached = Trade.bestTradeExactOut(poolFactoryProvider, POOLS, tokenIn, amountOut, BestTradeOptions(4, 3), cache=cache)
+      expect(amounts(cached)).toEqual(amounts([
+        Trade.fromRoute(poolFactoryProvider, trade.swaps[0].route, amountOut, TradeType.EXACT_OUTPUT) for trade in cached
+      ]))
+      expect(cache.hits >= sum(len(trade.swaps[0].route.pools) for trade in cached)).toBe(True)
+
+  def test_fromRoutesUsesTheCache(self):
+    cache = SwapCache()
+    route = Route([pool_0_1, pool_1_2], token0, token2)
+    amountIn = CurrencyAmount.fromRawAmount(token0, 10000)
+    expected = Trade.fromRoute(poolFactoryProvider, route, amountIn, TradeType.EXACT_INPUT, cache)
+    trade = Trade.fromRoutes(poolFactoryProvider, [RouteAmount(route, amountIn)], TradeType.EXACT_INPUT, cache)
+    expect((cache.hits, cache.misses)).toEqual((2, 2))
+    expect(trade.outputAmount).toEqual(expected.outputAmount)
@@ -1,6 +1,6 @@
 import unittest
 from convexus.icontoolkit.expect import expect
-from convexus.sdk.entities.tick import Tick, TickConstructorArgs
+from convexus.sdk.entities.tick import FeeGrowthOutside, Tick, TickConstructorArgs
 from convexus.sdk.utils.tickMath import TickMath
 
 class TestTick(unittest.TestCase):
@@ -18,3 +18,11 @@ class TestTick(unittest.TestCase):
       liquidityNet=0
     ))).toThrow(AssertionError, 'TICK')
 
+    def test_repr(self):
+      tick = Tick(TickConstructorArgs(-60, 5, 6, FeeGrowthOutside(1, 2), 3, 4, 5, True))
+      expect(hasattr(tick, '__dict__')).toBe(False)
+      expect(repr(tick)).toEqual(
+        "{'index': -60, 'liquidityGross': 5, 'liquidityNet': 6, "
+        "'feeGrowthOutside': {'feeGrowthOutside0X128': 1, 'feeGrowthOutside1X128': 2}, "
+        "'secondsOutside': 3, 'secondsPerLiquidityOutsideX128': 4, 'tickCumulativeOutside': 5, 'initialized': True}"
+      )
@@ -0,0 +1,91 @@
+import random
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.constants import FeeAmount, TICK_SPACINGS
+from convexus.sdk.entities.pool import Pool
+from convexus.sdk.entities.tick import TickConstructorArgs
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.encodeSqrtRatioX96 import encodeSqrtRatioX96
+from convexus.sdkcore.entities.currency import Token
+
+from convexus.sdk.entities.tickBitmapDataProvider import TickBitmapDataProvider
+from convexus.sdk.entities.tickListDataProvider import TickListDataProvider
+from randomTicks import randomTicks
+
+USDC = Token('cxa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48', 6, 'USDC', 'USD Coin')
+DAI = Token('cx6b175474e89094c44da98b954eedeac495271d0f', 18, 'DAI', 'DAI Stablecoin')
+
+class TestTickBitmapDataProvider(unittest.TestCase):
+
+  def test_canTakeAnEmptyListOfTicks(self):
+    provider = TickBitmapDataProvider([], 1)
+    expect(provider.nextInitializedTickWithinOneWord(0, True, 1)).toEqual((0, False))
+    expect(provider.nextInitializedTickWithinOneWord(0, False, 1)).toEqual((255, False))
+
+  def test_throwsFor0TickSpacing(self):
+    expect(lambda: TickBitmapDataProvider([], 0)).toThrow(AssertionError, 'TICK_SPACING_NONZERO')
+
+  def test_throwsForUnevenTickList(self):
+    expect(lambda:
+        TickBitmapDataProvider(
+          [
+            TickConstructorArgs(index=-1, liquidityNet=-1, liquidityGross=1),
+            TickConstructorArgs(index=1, liquidityNet=2, liquidityGross=1),
+          ],
+          1
+        )
+    ).toThrow(AssertionError, 'ZERO_NET')
+
+  def test_throwsIfTickNotInList(self):
+    provider = TickBitmapDataProvider(
+      [
+        TickConstructorArgs(index=-1, liquidityNet=-1, liquidityGross=1),
+        TickConstructorArgs(index=1, liquidityNet=1, liquidityGross=1),
+      ],
+      1
+    )
+    expect(lambda: provider.getTick(0)).toThrow(AssertionError, 'NOT_CONTAINED')
+
+  def test_throwsForMismatchedTickSpacing(self):
+    provider = TickBitmapDataProvider([], 60)
+    expect(lambda: provider.nextInitializedTickWithinOneWord(0, True, 10)).toThrow(AssertionError, 'TICK_SPACING')
+
+  def test_getsTheTicksFromTheList(self):
+    provider = TickBitmapDataProvider(
+      [
+        TickConstructorArgs(index=-1, liquidityNet=-1, liquidityGross=1),
+        TickConstructorArgs(index=1, liquidityNet=1, liquidityGross=1),
+      ],
+      1
+    )
+    expect(provider.getTick(-1).liquidityNet).toEqual(-1)
+    expect(provider.getTick(1).liquidityNet).toEqual(1)
+
+  def test_matchesTickListDataProvider(self):
+    for tickSpacing in TICK_SPACINGS.values():
+      ticks = randomTicks(tickSpacing, 200, tickSpacing)
+      bitmapProvider = TickBitmapDataProvider(ticks, tickSpacing)
+      listProvider = TickListDataProvider(ticks, tickSpacing)
+      rng = random.Random(tickSpacing)
+      probes = [t.index + d for t in ticks for d in (-tickSpacing, -1, 0, 1, tickSpacing)]
+      probes += [rng.randint(TickMath.MIN_TICK, TickMath.MAX_TICK) for _ in range(500)]
+      for tick in probes:
+        if tick < TickMath.MIN_TICK or tick > TickMath.MAX_TICK:
+          continue
+        for lte in (True, False):
+          # the tick list provider cannot answer queries outside of its tick range
+          if (lte and tick < ticks[0].index) or (not lte and tick >= ticks[-1].index):
+            continue
+          expect(bitmapProvider.nextInitializedTickWithinOneWord(tick, lte, tickSpacing)).toEqual(
+            listProvider.nextInitializedTickWithinOneWord(tick, lte, tickSpacing)
+          )
+
+  def test_swapsLikeTickListDataProvider(self):
+    tickSpacing = TICK_SPACINGS[FeeAmount.MEDIUM]
+    ticks = randomTicks(1, 400, tickSpacing)
+    liquidity = sum(t.liquidityNet for t in ticks if t.index <= 0)
+    bitmapPool = Pool(USDC, DAI, FeeAmount.MEDIUM, encodeSqrtRatioX96(1, 1), liquidity, 0, TickBitmapDataProvider(ticks, tickSpacing))
+    listPool = Pool(USDC, DAI, FeeAmount.MEDIUM, encodeSqrtRatioX96(1, 1), liquidity, 0, ticks)
+    for zeroForOne in (True, False):
+      for amount in (10**6, 10**18, 10**24, -10**6, -10**18):
+        expect(bitmapPool.swap(zeroForOne, amount)).toEqual(listPool.swap(zeroForOne, amount))
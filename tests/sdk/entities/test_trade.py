@@ -15,8 +15,9 @@ from convexus.sdkcore.entities.fractions.percent import Percent
 from convexus.sdkcore.entities.fractions.price import Price
 from convexus.sdkcore.entities.icx import Icx
 from convexus.sdk.entities.route import Route
+from convexus.sdk.entities.swapCache import SwapCache
 
-from convexus.sdk.entities.trade import BestTradeOptions, RouteInfo, Trade, RouteAmount, TradeConstructorArgs, UncheckedTradeConstructorArguments
+from convexus.sdk.entities.trade import BestSplitTradeOptions, BestTradeOptions, BestTradeRequest, RouteInfo, Trade, RouteAmount, TradeConstructorArgs, UncheckedTradeConstructorArguments
 from convexus.sdkcore.utils.sqrt import sqrt
 from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
 from convexus.sdk.entities.tick import TickConstructorArgs, Tick
@@ -1052,3 +1053,132 @@ class TestTradeMinimumAmountOutExactOutput(unittest.TestCase):
     expect(result[1].swaps[0].route.tokenPath).toEqual([token3, token1, token0, WICX])
     expect(result[1].outputAmount.currency).toEqual(ICX)
 
+
+class TestBestSplitTrade(unittest.TestCase):
+
+  routes = [
+    Route([pool_0_2], token0, token2),
+    Route([pool_0_1, pool_1_2], token0, token2),
+    Route([pool_0_3, pool_1_3, pool_1_2], token0, token2)
+  ]
+
+  def test_throwsWithEmptyRoutes(self):
+    expect(lambda:
+      Trade.bestSplitTradeExactIn(poolFactoryProvider, [], CurrencyAmount.fromRawAmount(token0, 100))
+    ).toThrow(AssertionError, 'ROUTES')
+
+  def test_throwsWithInvalidDistribution(self):
+    expect(lambda:
+      Trade.bestSplitTradeExactIn(poolFactoryProvider, self.routes, CurrencyAmount.fromRawAmount(token0, 100), BestSplitTradeOptions(30))
+    ).toThrow(AssertionError, 'DISTRIBUTION_PERCENT')
+
+  def test_throwsWithMismatchedCurrencies(self):
+    expect(lambda:
+      Trade.bestSplitTradeExactIn(poolFactoryProvider, self.routes, CurrencyAmount.fromRawAmount(token1, 100))
+    ).toThrow(AssertionError, 'INPUT')
+    expect(lambda:
+      Trade.bestSplitTradeExactOut(poolFactoryProvider, self.routes, CurrencyAmount.fromRawAmount(token1, 100))
+    ).toThrow(AssertionError, 'OUTPUT')
+
+  def test_smallAmountInUsesASingleRoute(self):
+    trade = Trade.bestSplitTradeExactIn(poolFactoryProvider, self.routes, CurrencyAmount.fromRawAmount(token0, 100))
+    expect(len(trade.swaps)).toEqual(1)
+    expect(trade.swaps[0].route.pools).toEqual([pool_0_2])
+    expect(trade.outputAmount.quotient).toEqual(108)
+
+  def test_largeAmountInIsSplit(self):
+    amountIn = CurrencyAmount.fromRawAmount(token0, 50000)
+    trade = Trade.bestSplitTradeExactIn(poolFactoryProvider, self.routes, amountIn)
+    expect(len(trade.swaps)).toEqual(2)
+    expect(trade.inputAmount).toEqual(amountIn)
+    expect([swap.inputAmount.quotient for swap in trade.swaps]).toEqual([40000, 10000])
+    expect(trade.outputAmount.quotient).toEqual(38364)
+    best = Trade.bestTradeExactIn(poolFactoryProvider, [pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3], amountIn, token2)[0]
+    expect(trade.outputAmount.greaterThan(best.outputAmount)).toBe(True)
+
+  def test_largeAmountOutIsSplit(self):
+    amountOut = CurrencyAmount.fromRawAmount(token2, 50000)
+    trade = Trade.bestSplitTradeExactOut(poolFactoryProvider, self.routes, amountOut)
+    expect(len(trade.swaps)).toEqual(3)
+    expect(trade.outputAmount).toEqual(amountOut)
+    expect(trade.inputAmount.quotient).toEqual(72391)
+    expect(trade.inputAmount.lessThan(Trade.fromRoute(poolFactoryProvider, self.routes[0], amountOut, TradeType.EXACT_OUTPUT).inputAmount)).toBe(True)
+
+  def test_routesSharingPoolsAreCombined(self):
+    # both routes end with pool_1_2
+    amountIn = CurrencyAmount.fromRawAmount(token0, 50000)
+    trade = Trade.bestSplitTradeExactIn(poolFactoryProvider, self.routes[1:], amountIn)
+    expect([swap.inputAmount.quotient for swap in trade.swaps]).toEqual([35000, 15000])
+    for route in self.routes[1:]:
+      single = Trade.fromRoute(poolFactoryProvider, route, amountIn, TradeType.EXACT_INPUT)
+      expect(trade.outputAmount.greaterThan(single.outputAmount)).toBe(True)
+
+    # the second route swaps through the state of pool_1_2 left by the first one
+    first, second = trade.swaps
+    _, pool_1_2_after = pool_1_2.getOutputAmount(CurrencyAmount.fromRawAmount(token1, pool_0_1.getOutputAmount(first.inputAmount)[0].quotient))
+    amount = second.inputAmount
+    for pool in [pool_0_3, pool_1_3, pool_1_2_after]:
+      amount, _ = pool.getOutputAmount(amount)
+    expect(second.outputAmount.quotient).toEqual(amount.quotient)
+    expect(trade.outputAmount.quotient).toEqual(first.outputAmount.quotient + amount.quotient)
+
+  def test_optionsLimitTheSplit(self):
+    amountIn = CurrencyAmount.fromRawAmount(token0, 50000)
+    single = Trade.fromRoute(poolFactoryProvider, self.routes[0], amountIn, TradeType.EXACT_INPUT)
+    for options in [BestSplitTradeOptions(100), BestSplitTradeOptions(5, 1)]:
+      trade = Trade.bestSplitTradeExactIn(poolFactoryProvider, self.routes, amountIn, options)
+      expect(len(trade.swaps)).toEqual(1)
+      expect(trade.outputAmount).toEqual(single.outputAmount)
+
+  def test_nativeInput(self):
+    routes = [Route([pool_wicx_0], ICX, token0), Route([pool_wicx_1, pool_0_1], ICX, token0)]
+    trade = Trade.bestSplitTradeExactIn(poolFactoryProvider, routes, CurrencyAmount.fromRawAmount(ICX, 50000))
+    expect(trade.inputAmount.currency).toEqual(ICX)
+    expect(trade.outputAmount.currency).toEqual(token0)
+
+class TestBestTradesBatch(unittest.TestCase):
+
+  pools = [pool_0_1, pool_0_2, pool_0_3, pool_1_2, pool_1_3, pool_wicx_0, pool_wicx_1, pool_wicx_2]
+
+  def test_throwsWithEmptyPools(self):
+    expect(lambda:
+      Trade.bestTradesBatch(poolFactoryProvider, [], [BestTradeRequest(CurrencyAmount.fromRawAmount(token0, 100), token2)])
+    ).toThrow(AssertionError, 'POOLS')
+
+  def test_emptyBatch(self):
+    expect(Trade.bestTradesBatch(poolFactoryProvider, self.pools, [])).toEqual([])
+
+  def test_matchesTheSearchInRequestOrder(self):
+    requests = [
+      BestTradeRequest(CurrencyAmount.fromRawAmount(token0, 10000), token2),
+      BestTradeRequest(CurrencyAmount.fromRawAmount(token3, 100), ICX, TradeType.EXACT_OUTPUT),
+      BestTradeRequest(CurrencyAmount.fromRawAmount(ICX, 100), token3),
+      BestTradeRequest(CurrencyAmount.fromRawAmount(token0, 500), token2),
+      BestTradeRequest(CurrencyAmount.fromRawAmount(token2, 100), token0, TradeType.EXACT_OUTPUT),
+      BestTradeRequest(CurrencyAmount.fromRawAmount(token0, 10000), token2),
+    ]
+    options = BestTradeOptions(4, 3)
+    batch = Trade.bestTradesBatch(poolFactoryProvider, self.pools, requests, options)
+    expect(len(batch)).toEqual(len(requests))
+
+    for request, trades in zip(requests, batch):
+      if request.tradeType == TradeType.EXACT_INPUT:
+        expected = Trade.bestTradeExactIn(poolFactoryProvider, self.pools, request.amount, request.currency, options)
+      else:
+        expected = Trade.bestTradeExactOut(poolFactoryProvider, self.pools, request.currency, request.amount, options)
+      expect([(trade.swaps[0].route.pools, trade.inputAmount, trade.outputAmount) for trade in trades]).toEqual(
+        [(trade.swaps[0].route.pools, trade.inputAmount, trade.outputAmount) for trade in expected]
+      )
+
+  def test_sharesSimulations(self):
+    cache = SwapCache()
+    requests = [BestTradeRequest(CurrencyAmount.fromRawAmount(token0, 10000), currency) for currency in [token1, token2, token3, token1]]
+    Trade.bestTradesBatch(poolFactoryProvider, self.pools, requests, BestTradeOptions(3, 2), cache)
+    # token0 first hops are shared by the requests of the three pairs, and the last request is a duplicate
+    misses = cache.misses
+    separate = 0
+    for request in requests:
+      separateCache = SwapCache()
+      Trade.bestTradeExactIn(poolFactoryProvider, self.pools, request.amount, request.currency, BestTradeOptions(3, 2), cache=separateCache)
+      separate += separateCache.misses
+    expect(misses < separate).toBe(True)
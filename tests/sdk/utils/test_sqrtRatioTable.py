@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.constants import FeeAmount, TICK_SPACINGS
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.sqrtRatioTable import SqrtRatioTable
+
+tickSpacing = TICK_SPACINGS[FeeAmount.HIGH]
+table = SqrtRatioTable.build(tickSpacing)
+
+class TestSqrtRatioTable(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.directory = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.directory.name, 'sqrtRatios.bin')
+
+  def tearDown(self):
+    TickMath.useSqrtRatioTable(None)
+    self.directory.cleanup()
+    super().tearDown()
+
+  def test_coversEveryUsableTick(self):
+    expect(table.minTick).toEqual(-887200)
+    expect(table.maxTick).toEqual(887200)
+    expect(len(table)).toEqual(887200 * 2 // tickSpacing + 1)
+
+  def test_matchesComputedSqrtRatios(self):
+    for tick in range(table.minTick, table.maxTick + 1, tickSpacing):
+      expect(table.getSqrtRatioAtTick(tick)).toEqual(TickMath.computeSqrtRatioAtTick(tick))
+
+  def test_fullRangeTableCoversMinAndMaxTick(self):
+    expect(SqrtRatioTable.minUsableTick(1)).toEqual(TickMath.MIN_TICK)
+    expect(SqrtRatioTable.maxUsableTick(1)).toEqual(TickMath.MAX_TICK)
+
+  def test_throwsForTickNotInTable(self):
+    expect(lambda: table.getSqrtRatioAtTick(tickSpacing + 1)).toThrow(AssertionError, 'TICK')
+    expect(lambda: table.getSqrtRatioAtTick(table.maxTick + tickSpacing)).toThrow(AssertionError, 'TICK')
+    expect(table.contains(tickSpacing)).toEqual(True)
+    expect(table.contains(tickSpacing + 1)).toEqual(False)
+
+  def test_savesAndLoadsMemoryMappedTable(self):
+    table.save(self.path)
+    loaded = SqrtRatioTable.load(self.path)
+    try:
+      expect(loaded.tickSpacing).toEqual(tickSpacing)
+      expect(len(loaded)).toEqual(len(table))
+      for index in range(0, len(table), 97):
+        expect(loaded[index]).toEqual(table[index])
+      expect(loaded[len(loaded) - 1]).toEqual(table[len(table) - 1])
+    finally:
+      loaded.close()
+
+  def test_throwsForInvalidFile(self):
+    with open(self.path, 'wb') as f:
+      f.write(b'\x00' * SqrtRatioTable.HEADER.size)
+    expect(lambda: SqrtRatioTable.load(self.path)).toThrow(AssertionError, 'TABLE_MAGIC')
+
+  def test_throwsForTruncatedFile(self):
+    with open(self.path, 'wb') as f:
+      f.write(table.toBytes()[:-1])
+    expect(lambda: SqrtRatioTable.load(self.path)).toThrow(AssertionError, 'TABLE_SIZE')
+
+  def test_getSqrtRatioAtTickConsultsTheTable(self):
+    TickMath.useSqrtRatioTable(table)
+    for tick in (table.minTick, -tickSpacing, 0, tickSpacing, table.maxTick):
+      expect(TickMath.getSqrtRatioAtTick(tick)).toEqual(TickMath.computeSqrtRatioAtTick(tick))
+
+  def test_getSqrtRatioAtTickComputesTicksNotInTheTable(self):
+    TickMath.useSqrtRatioTable(table)
+    for tick in (TickMath.MIN_TICK, -1, 1, tickSpacing + 1, TickMath.MAX_TICK):
+      expect(TickMath.getSqrtRatioAtTick(tick)).toEqual(TickMath.computeSqrtRatioAtTick(tick))
+    expect(TickMath.getSqrtRatioAtTick(TickMath.MIN_TICK)).toEqual(TickMath.MIN_SQRT_RATIO)
+    expect(TickMath.getSqrtRatioAtTick(TickMath.MAX_TICK)).toEqual(TickMath.MAX_SQRT_RATIO)
+
+  def test_getSqrtRatioAtTickStillValidatesTheTick(self):
+    TickMath.useSqrtRatioTable(table)
+    expect(lambda: TickMath.getSqrtRatioAtTick(TickMath.MAX_TICK + 1)).toThrow(AssertionError, 'TICK')
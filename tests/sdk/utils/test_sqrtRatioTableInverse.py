@@ -0,0 +1,70 @@
+import os
+import random
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.sqrtRatioTable import SqrtRatioTable
+
+class TestGetTickAtSqrtRatioWithTable(unittest.TestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    cls.table = SqrtRatioTable.build(1)
+
+  def tearDown(self):
+    TickMath.useSqrtRatioTable(None)
+    super().tearDown()
+
+  def mismatches(self, indexes):
+    table = self.table
+    compute = TickMath.computeTickAtSqrtRatio
+    lookup = table.getTickAtSqrtRatio
+    # check the tick boundaries: the sqrt ratio of a tick, and the largest sqrt ratio still below the next tick
+    mismatches = []
+    for index in indexes:
+      tick = table.minTick + index
+      lower, upper = table[index], table[index + 1]
+      if not (lookup(lower) == compute(lower) == tick and lookup(upper - 1) == compute(upper - 1) == tick):
+        mismatches.append(tick)
+    return mismatches
+
+  def test_matchesComputedTickAtTheExtremesAndASampleOfTicks(self):
+    last = len(self.table) - 2
+    middle = -self.table.minTick
+    extremes = [*range(0, 1000), *range(middle - 1000, middle + 1000), *range(last - 1000, last + 1)]
+    sample = random.Random(0).sample(range(last + 1), 20000)
+    expect(self.mismatches(sorted(set(extremes + sample)))).toEqual([])
+
+  @unittest.skipUnless(os.environ.get('CONVEXUS_SLOW_TESTS'), 'set CONVEXUS_SLOW_TESTS=1 to check every tick')
+  def test_matchesComputedTickAcrossTheWholeTickRange(self):
+    expect(self.mismatches(range(len(self.table) - 1))).toEqual([])
+
+  def test_tableIsStrictlyIncreasing(self):
+    table = self.table
+    previous = 0
+    for index in range(len(table)):
+      value = table[index]
+      self.assertLess(previous, value)
+      previous = value
+
+  def test_getTickAtSqrtRatioConsultsFullRangeTable(self):
+    TickMath.useSqrtRatioTable(self.table)
+    expect(TickMath.getTickAtSqrtRatio(TickMath.MIN_SQRT_RATIO)).toEqual(TickMath.MIN_TICK)
+    expect(TickMath.getTickAtSqrtRatio(TickMath.MAX_SQRT_RATIO - 1)).toEqual(TickMath.MAX_TICK - 1)
+    expect(TickMath.getTickAtSqrtRatio(1 << 96)).toEqual(0)
+    expect(TickMath.getTickAtSqrtRatio((1 << 96) - 1)).toEqual(-1)
+
+  def test_getTickAtSqrtRatioStillValidatesTheSqrtRatio(self):
+    TickMath.useSqrtRatioTable(self.table)
+    expect(lambda: TickMath.getTickAtSqrtRatio(TickMath.MIN_SQRT_RATIO - 1)).toThrow(AssertionError, 'SQRT_RATIO')
+    expect(lambda: TickMath.getTickAtSqrtRatio(TickMath.MAX_SQRT_RATIO)).toThrow(AssertionError, 'SQRT_RATIO')
+
+  def test_coarseTableBracketsTheTick(self):
+    table = SqrtRatioTable.build(200)
+    TickMath.useSqrtRatioTable(table)
+    for tick in (-887200, -201, -200, -1, 0, 199, 200, 887199):
+      sqrtRatioX96 = TickMath.computeSqrtRatioAtTick(tick)
+      expect(table.getTickAtSqrtRatio(sqrtRatioX96)).toEqual((tick // 200) * 200)
+      # a coarse table cannot answer the inverse, so the tick is computed
+      expect(TickMath.getTickAtSqrtRatio(sqrtRatioX96)).toEqual(tick)
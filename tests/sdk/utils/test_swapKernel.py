@@ -0,0 +1,101 @@
+import random
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdk.constants import FeeAmount, TICK_SPACINGS
+from convexus.sdk.entities.tickListDataProvider import TickListDataProvider
+from convexus.sdk.utils.tickMath import TickMath
+from convexus.sdk.utils.swapMath import SwapMath
+from convexus.sdk.utils.liquidityMath import LiquidityMath
+from convexus.sdk.utils.swapKernel import computeSwap, computeSwapMany
+
+from randomTicks import randomTicks
+
+def referenceSwap(tickDataProvider, fee, tickSpacing, zeroForOne, amountSpecified, sqrtPriceLimitX96, sqrtPriceX96, tick, liquidity):
+  exactInput = amountSpecified >= 0
+  amountSpecifiedRemaining = amountSpecified
+  amountCalculated = 0
+
+  while amountSpecifiedRemaining != 0 and sqrtPriceX96 != sqrtPriceLimitX96:
+    sqrtPriceStartX96 = sqrtPriceX96
+    tickNext, initialized = tickDataProvider.nextInitializedTickWithinOneWord(tick, zeroForOne, tickSpacing)
+    tickNext = min(max(tickNext, TickMath.MIN_TICK), TickMath.MAX_TICK)
+    sqrtPriceNextX96 = TickMath.getSqrtRatioAtTick(tickNext)
+
+    direction = (sqrtPriceNextX96 < sqrtPriceLimitX96) if zeroForOne else (sqrtPriceNextX96 > sqrtPriceLimitX96)
+    sqrtPriceX96, amountIn, amountOut, feeAmount = SwapMath.computeSwapStep(
+      sqrtPriceX96,
+      sqrtPriceLimitX96 if direction else sqrtPriceNextX96,
+      liquidity,
+      amountSpecifiedRemaining,
+      fee
+    )
+
+    if exactInput:
+      amountSpecifiedRemaining -= amountIn + feeAmount
+      amountCalculated -= amountOut
+    else:
+      amountSpecifiedRemaining += amountOut
+      amountCalculated += amountIn + feeAmount
+
+    if sqrtPriceX96 == sqrtPriceNextX96:
+      if initialized:
+        liquidityNet = tickDataProvider.getTick(tickNext).liquidityNet
+        liquidity = LiquidityMath.addDelta(liquidity, -liquidityNet if zeroForOne else liquidityNet)
+      tick = tickNext - 1 if zeroForOne else tickNext
+    elif sqrtPriceX96 != sqrtPriceStartX96:
+      tick = TickMath.getTickAtSqrtRatio(sqrtPriceX96)
+
+  return (amountCalculated, sqrtPriceX96, liquidity, tick)
+
+class TestComputeSwap(unittest.TestCase):
+
+  def test_matchesTheStepByStepSwap(self):
+    rng = random.Random(7)
+    for fee in [FeeAmount.LOW, FeeAmount.MEDIUM, FeeAmount.HIGH]:
+      tickSpacing = TICK_SPACINGS[fee]
+      provider = TickListDataProvider(randomTicks(fee, 40, tickSpacing), tickSpacing)
+      for _ in range(25):
+        tick = rng.randint(-50000, 50000)
+        sqrtPriceX96 = TickMath.getSqrtRatioAtTick(tick)
+        liquidity = sum(t.liquidityNet for t in provider.ticks if t.index <= tick)
+        zeroForOne = rng.random() < 0.5
+        amountSpecified = rng.randint(1, 10**24) * rng.choice([1, -1])
+        sqrtPriceLimitX96 = TickMath.MIN_SQRT_RATIO + 1 if zeroForOne else TickMath.MAX_SQRT_RATIO - 1
+        args = (provider, fee, tickSpacing, zeroForOne, amountSpecified, sqrtPriceLimitX96, sqrtPriceX96, tick, liquidity)
+        expect(computeSwap(*args)).toEqual(referenceSwap(*args))
+
+  def test_stopsAtThePriceLimit(self):
+    fee = FeeAmount.MEDIUM
+    tickSpacing = TICK_SPACINGS[fee]
+    provider = TickListDataProvider(randomTicks(1, 20, tickSpacing), tickSpacing)
+    sqrtPriceX96 = TickMath.getSqrtRatioAtTick(0)
+    sqrtPriceLimitX96 = TickMath.getSqrtRatioAtTick(-100)
+    liquidity = sum(t.liquidityNet for t in provider.ticks if t.index <= 0)
+    args = (provider, fee, tickSpacing, True, 10**30, sqrtPriceLimitX96, sqrtPriceX96, 0, liquidity)
+    result = computeSwap(*args)
+    expect(result).toEqual(referenceSwap(*args))
+    expect(result[1]).toEqual(sqrtPriceLimitX96)
+
+class TestComputeSwapMany(unittest.TestCase):
+
+  def test_matchesComputeSwapForEachAmount(self):
+    rng = random.Random(11)
+    for fee in [FeeAmount.LOW, FeeAmount.MEDIUM, FeeAmount.HIGH]:
+      tickSpacing = TICK_SPACINGS[fee]
+      provider = TickListDataProvider(randomTicks(fee + 1, 60, tickSpacing), tickSpacing)
+      for _ in range(10):
+        tick = rng.randint(-50000, 50000)
+        sqrtPriceX96 = TickMath.getSqrtRatioAtTick(tick)
+        liquidity = sum(t.liquidityNet for t in provider.ticks if t.index <= tick)
+        zeroForOne = rng.random() < 0.5
+        sqrtPriceLimitX96 = TickMath.MIN_SQRT_RATIO + 1 if zeroForOne else TickMath.MAX_SQRT_RATIO - 1
+        amounts = [rng.randint(0, 10**rng.randint(1, 26)) * rng.choice([1, -1]) for _ in range(40)]
+        amounts += amounts[:5]
+        state = (sqrtPriceLimitX96, sqrtPriceX96, tick, liquidity)
+        expect(computeSwapMany(provider, fee, tickSpacing, zeroForOne, amounts, *state)).toEqual(
+          [computeSwap(provider, fee, tickSpacing, zeroForOne, amount, *state) for amount in amounts]
+        )
+
+  def test_emptyAmounts(self):
+    provider = TickListDataProvider([], 1)
+    expect(computeSwapMany(provider, FeeAmount.LOW, 1, True, [], TickMath.MIN_SQRT_RATIO + 1, 2**96, 0, 0)).toEqual([])
@@ -1,6 +1,12 @@
 import unittest
+from decimal import getcontext
 
+from convexus.sdkcore.constants import Rounding
+from convexus.sdkcore.entities.currency import Token
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
 from convexus.sdkcore.entities.fractions.fraction import Fraction
+from convexus.sdkcore.entities.fractions.percent import Percent
+from convexus.sdkcore.entities.fractions.price import Price
 
 class TestFractionQuotient(unittest.TestCase):
     
@@ -63,5 +69,108 @@ class TestFractionInvert(unittest.TestCase):
       f = Fraction(1, 2)
       self.assertEqual(f.asFraction, (f))
 
+class TestFractionNormalize(unittest.TestCase):
+
+    def test_normalize(self):
+      self.assertEqual(Fraction(52, 120).normalize().numerator, 13)
+      self.assertEqual(Fraction(52, 120).normalize().denominator, 30)
+      self.assertEqual(Fraction(-4, 6).normalize().numerator, -2)
+      self.assertEqual(Fraction(0, 6).normalize().denominator, 1)
+      self.assertEqual(Fraction(7, 3).normalize().numerator, 7)
+
+    def test_disabledByDefault(self):
+      result = Fraction(1, 10).add(Fraction(4, 12))
+      self.assertEqual((result.numerator, result.denominator), (52, 120))
+
+    def test_reducesTheResults(self):
+      with Fraction.normalizing(0):
+        result = Fraction(1, 10).add(Fraction(4, 12))
+        self.assertEqual((result.numerator, result.denominator), (13, 30))
+        result = Fraction(1, 10).subtract(Fraction(4, 12))
+        self.assertEqual((result.numerator, result.denominator), (-7, 30))
+        result = Fraction(2, 9).multiply(Fraction(3, 4))
+        self.assertEqual((result.numerator, result.denominator), (1, 6))
+        result = Fraction(2, 9).divide(Fraction(4, 3))
+        self.assertEqual((result.numerator, result.denominator), (1, 6))
+
+    def test_onlyReducesAboveTheThreshold(self):
+      with Fraction.normalizing(64):
+        result = Fraction(2, 9).multiply(Fraction(3, 4))
+        self.assertEqual((result.numerator, result.denominator), (6, 36))
+        result = Fraction(2**100, 3).multiply(Fraction(3, 2**90))
+        self.assertEqual((result.numerator, result.denominator), (2**10, 1))
+
+    def test_keepsTheValues(self):
+      a = Fraction(2**200 + 1, 3**100)
+      b = Fraction(5**90, 2**150)
+      expected = [a.add(b), a.subtract(b), a.multiply(b), a.divide(b)]
+      with Fraction.normalizing(128):
+        self.assertEqual([a.add(b), a.subtract(b), a.multiply(b), a.divide(b)], expected)
+
+    def test_normalizingRestoresTheThreshold(self):
+      with Fraction.normalizing(64):
+        with self.assertRaises(ValueError):
+          with Fraction.normalizing(0):
+            self.assertEqual(Fraction.NORMALIZE_THRESHOLD, 0)
+            raise ValueError()
+        self.assertEqual(Fraction.NORMALIZE_THRESHOLD, 64)
+      self.assertEqual(Fraction.NORMALIZE_THRESHOLD, None)
+
+class TestFractionToFixed(unittest.TestCase):
+
+    def test_rounding(self):
+      self.assertEqual(Fraction(2, 3).toFixed(2), '0.67')
+      self.assertEqual(Fraction(2, 3).toFixed(2, Rounding.ROUND_DOWN), '0.66')
+      self.assertEqual(Fraction(1, 3).toFixed(2, Rounding.ROUND_UP), '0.34')
+      self.assertEqual(Fraction(5, 2).toFixed(0), '3')
+      self.assertEqual(Fraction(-5, 2).toFixed(0), '-3')
+
+    def test_removesTrailingZeroes(self):
+      self.assertEqual(Fraction(5, 4).toFixed(4), '1.25')
+      self.assertEqual(Fraction(6, 3).toFixed(4), '2')
+      self.assertEqual(Fraction(1, 10**6).toFixed(6), '0.000001')
+
+    def test_keepsTheSignOfZero(self):
+      self.assertEqual(Fraction(-1, 3).toFixed(0), '-0')
+      self.assertEqual(Fraction(1, -400).toFixed(2), '-0')
+
+    def test_throwsWithNegativeDecimalPlaces(self):
+      with self.assertRaises(AssertionError):
+        Fraction(1, 3).toFixed(-1)
+
+    def test_doesNotChangeTheDecimalContext(self):
+      context = getcontext()
+      prec, rounding = context.prec, context.rounding
+      Fraction(1, 3).toFixed(300, Rounding.ROUND_UP)
+      self.assertEqual((context.prec, context.rounding), (prec, rounding))
+
+    def test_isExactBeyond256Digits(self):
+      self.assertEqual(Fraction(10**300, 3).toFixed(1), '3' * 300 + '.3')
+
+class TestFractionFormatMany(unittest.TestCase):
+
+    token = Token('cx0000000000000000000000000000000000000001', 6, 't0', 'token0')
+    quote = Token('cx0000000000000000000000000000000000000002', 18, 't1', 'token1')
+
+    def test_formatsEveryFraction(self):
+      fractions = [
+        Fraction(1, 3),
+        CurrencyAmount.fromRawAmount(self.token, 1234567),
+        Percent(1, 8),
+        Price(self.token, self.quote, 10**6, 3 * 10**18)
+      ]
+      self.assertEqual(Fraction.formatMany(fractions, 2), [fraction.toFixed(2) for fraction in fractions])
+      self.assertEqual(
+        Fraction.formatMany(fractions, 1, Rounding.ROUND_UP),
+        [fraction.toFixed(1, Rounding.ROUND_UP) for fraction in fractions]
+      )
+
+    def test_defaultDecimalPlaces(self):
+      fractions = [CurrencyAmount.fromRawAmount(self.token, 1234567), Percent(1, 3), Price(self.token, self.quote, 3, 10**12)]
+      self.assertEqual(Fraction.formatMany(fractions), ['1.234567', '33.33', '0.3333'])
+
+    def test_empty(self):
+      self.assertEqual(Fraction.formatMany([], 2), [])
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from convexus.sdkcore.constants import Rounding
 from convexus.sdkcore.entities.currency import Token
 from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
 from convexus.sdkcore.entities.fractions.price import Price
@@ -38,6 +39,11 @@ class TestPrice(unittest.TestCase):
   def test_noDecimalsFlipRatio(self):
       p = Price(TestPrice.t0_18, TestPrice.t2_18, 456, 123)
       self.assertEqual(p.toFixed(4), '0.2697')
+
+  def test_toSignificant(self):
+      p = Price(TestPrice.t0_18, TestPrice.t2_18, 123, 456)
+      self.assertEqual(p.toSignificant(), p.toFixed(4))
+      self.assertEqual(p.toSignificant(decimalPlaces=2, rounding=Rounding.ROUND_DOWN), '3.7')
     
   def test_withDecimalDifference(self):
       p = Price(TestPrice.t1_6, TestPrice.t2_18, 123, 456)
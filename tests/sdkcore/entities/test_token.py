@@ -1,6 +1,9 @@
+import pickle
+import sys
+import threading
 import unittest
 
-from convexus.sdkcore.entities.currency import Token
+from convexus.sdkcore.entities.currency import Icx, Token, TokenRegistry, TOKEN_REGISTRY
 
 ADDRESS_ONE = 'hx0000000000000000000000000000000000000001'
 ADDRESS_TWO = 'hx0000000000000000000000000000000000000002'
@@ -52,3 +55,77 @@ class TestToken(unittest.TestCase):
     tokenA = Token(ADDRESS_ONE, 9, 'abc', 'def')
     tokenB = Token(ADDRESS_ONE, 18, 'ghi', 'jkl')
     self.assertTrue(tokenA.equals(tokenB))
+
+  def test_normalizesTheAddress(self):
+    token = Token(' HX0000000000000000000000000000000000000001 ', 18)
+    self.assertEqual(token.address, ADDRESS_ONE)
+    self.assertTrue(token.equals(Token(ADDRESS_ONE, 18)))
+
+  def test_hashable(self):
+    tokens = {Token(ADDRESS_ONE, 18): 1, Token(ADDRESS_TWO, 18): 2}
+    self.assertEqual(tokens[Token(ADDRESS_ONE, 9)], 1)
+    self.assertEqual(len(set([Token(ADDRESS_ONE, 18), Token(ADDRESS_ONE, 6), Token(ADDRESS_TWO, 18)])), 2)
+
+  def test_sortsBefore(self):
+    self.assertTrue(Token(ADDRESS_ONE, 18).sortsBefore(Token(ADDRESS_TWO, 18)))
+    self.assertFalse(Token(ADDRESS_TWO, 18).sortsBefore(Token(ADDRESS_ONE, 18)))
+    with self.assertRaises(AssertionError) as cm:
+      Token(ADDRESS_ONE, 18).sortsBefore(Token(ADDRESS_ONE, 9))
+    self.assertEqual(str(cm.exception), 'ADDRESSES')
+
+  def test_picklesWithoutItsIdentity(self):
+    token = Token(ADDRESS_ONE, 9, 'abc', 'def')
+    # a token pickled by another process has an identity of that process
+    state = pickle.dumps(token).replace(ADDRESS_ONE.encode(), ADDRESS_TWO.encode())
+    unpickled = pickle.loads(state)
+    self.assertEqual(unpickled.id, Token(ADDRESS_TWO, 18).id)
+    self.assertEqual((unpickled.decimals, unpickled.symbol, unpickled.name), (9, 'abc', 'def'))
+
+class TestTokenRegistry(unittest.TestCase):
+
+  def test_assignsIdentitiesInOrder(self):
+    registry = TokenRegistry()
+    self.assertEqual(registry.idOf(ADDRESS_TWO), 0)
+    self.assertEqual(registry.idOf(ADDRESS_ONE), 1)
+    self.assertEqual(registry.idOf(ADDRESS_TWO.upper()), 0)
+    self.assertEqual(len(registry), 2)
+    self.assertEqual(registry.addresses, [ADDRESS_TWO, ADDRESS_ONE])
+
+  def test_parse(self):
+    registry = TokenRegistry()
+    self.assertEqual(registry.parse(' ' + ADDRESS_ONE.upper()), (ADDRESS_ONE, 0))
+    self.assertTrue(ADDRESS_ONE in registry)
+    with self.assertRaises(Exception) as cm:
+      registry.parse('hxhello00000000000000000000000000000000002')
+    self.assertEqual(str(cm.exception), 'hxhello00000000000000000000000000000000002 is not a valid address')
+    self.assertEqual(len(registry), 1)
+
+  def test_intern(self):
+    registry = TokenRegistry()
+    token = Token(ADDRESS_ONE, 18, 'abc')
+    self.assertIs(registry.intern(token), token)
+    self.assertIs(registry.intern(Token(ADDRESS_ONE, 18, 'abc')), token)
+    self.assertIs(registry.get(ADDRESS_ONE.upper()), token)
+    self.assertIsNone(registry.get(ADDRESS_TWO))
+
+  def test_assignsDistinctIdentitiesAcrossThreads(self):
+    registry = TokenRegistry()
+    addresses = ['cx%040x' % i for i in range(2000)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+      threads = [threading.Thread(target=lambda: [registry.idOf(address) for address in addresses]) for _ in range(8)]
+      for thread in threads:
+        thread.start()
+      for thread in threads:
+        thread.join()
+    finally:
+      sys.setswitchinterval(interval)
+
+    self.assertEqual(len(registry), len(addresses))
+    self.assertEqual(sorted(registry.ids.values()), list(range(len(addresses))))
+    self.assertTrue(all(registry.addresses[registry.ids[address]] == address for address in addresses))
+
+  def test_tokensTakeTheirIdentityFromTheGlobalRegistry(self):
+    self.assertEqual(Token(ADDRESS_ONE, 18).id, TOKEN_REGISTRY.idOf(ADDRESS_ONE))
+    self.assertEqual(Icx().wrapped.id, TOKEN_REGISTRY.idOf(Icx.wrappedAddress))
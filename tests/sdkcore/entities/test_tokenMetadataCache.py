@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from convexus.sdkcore.entities.currency import Icx, Token
+from convexus.sdkcore.entities.tokenMetadataCache import TokenMetadata, TokenMetadataCache
+
+ADDRESS_ONE = 'cx0000000000000000000000000000000000000001'
+ADDRESS_TWO = 'cx0000000000000000000000000000000000000002'
+
+class IRC2Contract:
+  """ An IRC2 contract counting its reads """
+
+  def __init__(self, address: str, reads: list) -> None:
+    self.address = address
+    self.reads = reads
+
+  async def decimals(self):
+    self.reads.append((self.address, 'decimals'))
+    return int(self.address[-1]) + 6
+
+  async def name(self):
+    self.reads.append((self.address, 'name'))
+    return 'Token ' + self.address[-1]
+
+  async def symbol(self):
+    self.reads.append((self.address, 'symbol'))
+    return 'T' + self.address[-1]
+
+class TestTokenMetadataCache(unittest.TestCase):
+
+  def test_missing(self):
+    cache = TokenMetadataCache()
+    cache.set(ADDRESS_ONE, TokenMetadata(18))
+    self.assertEqual(cache.missing([ADDRESS_TWO, ADDRESS_ONE, ADDRESS_TWO]), [ADDRESS_TWO])
+    self.assertTrue(ADDRESS_ONE in cache)
+    self.assertEqual(len(cache), 1)
+
+  def test_persistsToFile(self):
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'tokens.json')
+      cache = TokenMetadataCache(path)
+      self.assertEqual(len(cache), 0)
+      cache.update({ADDRESS_ONE: TokenMetadata(18, 'T1', 'Token 1'), ADDRESS_TWO: TokenMetadata(6)})
+
+      loaded = TokenMetadataCache(path)
+      self.assertEqual(loaded.get(ADDRESS_ONE), TokenMetadata(18, 'T1', 'Token 1'))
+      self.assertEqual(loaded.get(ADDRESS_TWO), TokenMetadata(6, None, None))
+      self.assertEqual(os.listdir(directory), ['tokens.json'])
+
+  def test_concurrentSavesDontShareTheirTemporaryFile(self):
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'tokens.json')
+      first, second = TokenMetadataCache(), TokenMetadataCache()
+      first.metadata[ADDRESS_ONE] = TokenMetadata(18)
+      second.metadata[ADDRESS_TWO] = TokenMetadata(6)
+
+      # the second save starts while the first one is writing its temporary file
+      dump = json.dump
+      def interleaved(data, file):
+        json.dump = dump
+        second.save(path)
+        dump(data, file)
+      json.dump = interleaved
+      try:
+        first.save(path)
+      finally:
+        json.dump = dump
+
+      self.assertEqual(TokenMetadataCache(path).metadata, {ADDRESS_ONE: TokenMetadata(18)})
+      self.assertEqual(os.listdir(directory), ['tokens.json'])
+
+class TestTokenFromContract(unittest.TestCase):
+
+  def test_readsTheMetadataOnce(self):
+    cache = TokenMetadataCache()
+    reads = []
+    token = asyncio.run(Token.fromContract(IRC2Contract(ADDRESS_ONE, reads), cache))
+    self.assertEqual(len(reads), 3)
+    self.assertEqual((token.address, token.decimals, token.symbol, token.name), (ADDRESS_ONE, 7, 'T1', 'Token 1'))
+
+    cached = asyncio.run(Token.fromContract(IRC2Contract(ADDRESS_ONE.upper(), reads), cache))
+    self.assertEqual(len(reads), 3)
+    self.assertEqual((cached.address, cached.decimals, cached.symbol, cached.name), (ADDRESS_ONE, 7, 'T1', 'Token 1'))
+
+  def test_wrappedIcx(self):
+    reads = []
+    token = asyncio.run(Token.fromContract(IRC2Contract(Icx.wrappedAddress, reads), TokenMetadataCache()))
+    self.assertTrue(token.equals(Icx().wrapped))
+    self.assertEqual(reads, [])
+
+class TestTokenFromContracts(unittest.TestCase):
+
+  def test_onlyReadsTheMissingTokensOnce(self):
+    cache = TokenMetadataCache()
+    cache.set(ADDRESS_TWO, TokenMetadata(18, 'CACHED'))
+    reads = []
+    contracts = []
+    def contractOf(address):
+      contracts.append(address)
+      return IRC2Contract(address, reads)
+
+    tokens = asyncio.run(Token.fromContracts([ADDRESS_ONE, ADDRESS_TWO, Icx.wrappedAddress, ADDRESS_ONE], contractOf, cache))
+    self.assertEqual(contracts, [ADDRESS_ONE])
+    self.assertEqual(sorted(reads), [(ADDRESS_ONE, 'decimals'), (ADDRESS_ONE, 'name'), (ADDRESS_ONE, 'symbol')])
+    self.assertEqual([token.address for token in tokens], [ADDRESS_ONE, ADDRESS_TWO, Icx.wrappedAddress, ADDRESS_ONE])
+    self.assertEqual([token.symbol for token in tokens], ['T1', 'CACHED', 'ICX', 'T1'])
+    self.assertEqual(cache.get(ADDRESS_ONE), TokenMetadata(7, 'T1', 'Token 1'))
+
+    asyncio.run(Token.fromContracts([ADDRESS_ONE, ADDRESS_TWO], contractOf, cache))
+    self.assertEqual(contracts, [ADDRESS_ONE])
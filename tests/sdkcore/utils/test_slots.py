@@ -0,0 +1,62 @@
+import pickle
+import unittest
+from convexus.icontoolkit.expect import expect
+from convexus.sdkcore.utils.slots import slotsToDict
+from convexus.sdkcore.entities.currency import Token
+from convexus.sdkcore.entities.fractions.currencyAmount import CurrencyAmount
+from convexus.sdkcore.entities.fractions.percent import Percent
+
+class Base:
+  __slots__ = ('a', '__private')
+
+  def __init__(self) -> None:
+    self.__private = 1
+    self.a = 2
+
+class Child(Base):
+  __slots__ = 'b'
+
+  def __init__(self) -> None:
+    super().__init__()
+    self.b = 3
+
+class Unslotted(Child):
+  def __init__(self) -> None:
+    super().__init__()
+    self.c = 4
+
+token = Token('cx0000000000000000000000000000000000000001', 18, 't0', 'token0')
+
+class TestSlotsToDict(unittest.TestCase):
+
+  def test_baseClassesFirst(self):
+    expect(list(slotsToDict(Child()).items())).toEqual([('a', 2), ('_Base__private', 1), ('b', 3)])
+
+  def test_omitsUnsetAttributes(self):
+    child = Child()
+    del child.a
+    expect(slotsToDict(child)).toEqual({'_Base__private': 1, 'b': 3})
+
+  def test_includesTheDictOfSubclasses(self):
+    expect(slotsToDict(Unslotted())).toEqual({'a': 2, '_Base__private': 1, 'b': 3, 'c': 4})
+
+  def test_token(self):
+    expect(hasattr(token, '__dict__')).toBe(False)
+    expect(repr(token)).toEqual(
+      "{'decimals': 18, 'symbol': 't0', 'name': 'token0', 'address': 'cx0000000000000000000000000000000000000001', 'id': "
+      + str(token.id) + "}"
+    )
+
+  def test_currencyAmount(self):
+    amount = CurrencyAmount.fromFractionalAmount(token, 5, 2)
+    expect(hasattr(amount, '__dict__')).toBe(False)
+    expect(repr(amount)).toEqual(
+      "{'numerator': 5, 'denominator': 2, 'currency': " + repr(token) + ", 'decimalScale': 1000000000000000000}"
+    )
+
+  def test_percent(self):
+    expect(repr(Percent(1, 2))).toEqual("{'numerator': 1, 'denominator': 2, 'isPercent': True}")
+
+  def test_pickles(self):
+    amount = pickle.loads(pickle.dumps(CurrencyAmount.fromRawAmount(token, 7)))
+    expect(repr(amount)).toEqual(repr(CurrencyAmount.fromRawAmount(token, 7)))